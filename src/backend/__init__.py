@@ -19,8 +19,14 @@ load_dotenv(dotenv_path=Path(__file__).resolve().parent / ".env", override=False
 def create_app() -> Flask:
     # Import config AFTER dotenv is loaded
     from backend.config import LocalConfig, ProdConfig
-    from backend.db.engine import build_engine
+    from backend.db.engine import REPLICA, init_engine
+    from backend.db.replica import replica_health
     from backend.db.session import init_session_factory, remove_db_session
+    from backend.db.snapshot import analytics_snapshot
+    from backend.db.statements import statement_metrics
+    from backend.db.warmup import pool_warmup
+    from backend.analytics.recommendations import init_recommendation_templates
+    from backend.api_http.timing import init_request_timing
     from backend.routes.v1 import api_v1_bp
 
     import os
@@ -32,21 +38,85 @@ def create_app() -> Flask:
     CORS(
         app,
         resources={r"/api/*": {"origins": cors_origins}},
+        expose_headers=["X-Next-Cursor"],  # Arrow/Parquet paging
         supports_credentials=False,  # uses cookies/sessions
     )
 
     env = os.getenv("ENV", "local").lower()
     app.config.from_object(LocalConfig if env == "local" else ProdConfig)
 
-    engine = build_engine(
-        server=app.config["AZURE_SQL_SERVER"],
-        database=app.config["AZURE_SQL_DATABASE"],
+    pool_settings = {
+        "pool_size": app.config["SQL_POOL_SIZE"],
+        "max_overflow": app.config["SQL_MAX_OVERFLOW"],
+        "pool_recycle": app.config["SQL_POOL_RECYCLE"],
+        "ping_idle": app.config["SQL_POOL_PING_IDLE"],
+    }
+    adaptive = {
+        "min_size": app.config["SQL_POOL_MIN_SIZE"],
+        "max_size": app.config["SQL_POOL_MAX_SIZE"],
+        "interval": app.config["SQL_POOL_ADAPT_INTERVAL"],
+        "target_wait_ms": app.config["SQL_POOL_TARGET_WAIT_MS"],
+    } if app.config["SQL_POOL_ADAPTIVE"] else None
+
+    # Before any engine is built: engines install the hooks when enabled
+    statement_metrics.configure(
+        app.config["SQL_STATS"],
+        slow_ms=app.config["SQL_SLOW_QUERY_MS"],
+        query_budget=app.config["SQL_QUERY_BUDGET"],
+        repeat_threshold=app.config["SQL_REPEAT_THRESHOLD"],
+    )
+    if app.config["SQL_STATS"]:
+        app.teardown_request(statement_metrics.finish_request)
+
+    # The engine is built lazily, so no credentials are fetched at startup
+    db_backend = app.config["DB_BACKEND"]
+    if db_backend in ("sqlite", "duckdb"):
+        init_engine(
+            path=app.config["SQLITE_PATH" if db_backend == "sqlite" else "DUCKDB_PATH"],
+            backend=db_backend,
+            latency_ms=app.config["SQL_STANDIN_LATENCY_MS"],
+            adaptive=adaptive,
+            **pool_settings,
+        )
+    elif db_backend == "azure":
+        init_engine(
+            server=app.config["AZURE_SQL_SERVER"],
+            database=app.config["AZURE_SQL_DATABASE"],
+            adaptive=adaptive,
+            **pool_settings,
+        )
+    else:
+        raise ValueError(f"Unknown DB_BACKEND: {db_backend}")
+
+    if app.config["SQL_READ_REPLICA"] and db_backend == "azure":
+        init_engine(
+            REPLICA,
+            server=app.config["AZURE_SQL_READ_SERVER"],
+            database=app.config["AZURE_SQL_DATABASE"],
+            read_only=True,
+            **pool_settings,
+        )
+        replica_health.configure(True, app.config["SQL_READ_RETRY_SECONDS"])
+    else:
+        replica_health.configure(False)
+    init_session_factory()
+    app.teardown_appcontext(remove_db_session)
+
+    # Loaded in the background on the first analytics request
+    analytics_snapshot.configure(
+        app.config["ANALYTICS_SNAPSHOT"],
+        refresh_seconds=app.config["ANALYTICS_SNAPSHOT_REFRESH"],
+        rebuild_seconds=app.config["ANALYTICS_SNAPSHOT_REBUILD"],
         pool_size=app.config["SQL_POOL_SIZE"],
         max_overflow=app.config["SQL_MAX_OVERFLOW"],
-        pool_recycle=app.config["SQL_POOL_RECYCLE"],
     )
-    init_session_factory(engine)
-    app.teardown_appcontext(remove_db_session)
+
+    if app.config["SQL_POOL_WARMUP"]:
+        pool_warmup.start(app.config["SQL_POOL_SIZE"])
+
+    init_recommendation_templates()
+
+    init_request_timing(app, app.config["SERVER_TIMING"], meta=app.config["SERVER_TIMING_META"])
 
     app.register_blueprint(api_v1_bp)
     return app
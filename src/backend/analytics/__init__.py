@@ -0,0 +1,9 @@
+"""
+File: __init__.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead), Michael Allen (Project Manager)
+Created: Feburary 2026
+Description: Analytics package initialization. Server-side cost analysis
+             (waste alerts, recommendations) that runs next to the data
+             instead of in the browser over raw usage rows.
+"""
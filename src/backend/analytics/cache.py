@@ -0,0 +1,49 @@
+"""
+File: cache.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Small in-process TTL cache for analytics results. Each worker
+             keeps its own copy; entries expire after a configurable number
+             of seconds so new usage rows show up without a restart.
+"""
+
+import threading
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """Thread-safe dict of key -> (expires_at, value) with a size cap."""
+
+    def __init__(self, max_entries: int = 256):
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Drop expired entries first, then the oldest insert
+                for k in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                    del self._entries[k]
+                if len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + ttl, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
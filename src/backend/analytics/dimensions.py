@@ -0,0 +1,38 @@
+"""
+File: dimensions.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: In-process cache of the small dimension tables (clients,
+             services with their providers). Exports join names from here
+             instead of joining them into every streamed usage row.
+"""
+
+from typing import Any, NamedTuple
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from backend.analytics.cache import TTLCache
+from backend.analytics.queries import load_services
+
+
+class Dimensions(NamedTuple):
+    clients: dict[int, str]
+    services: dict[int, dict[str, Any]]
+
+
+dimension_cache = TTLCache(max_entries=1)
+
+
+def load_dimensions(db: Session, ttl: float) -> Dimensions:
+    """Return client names and services by ID, reloading at most every ttl seconds."""
+    dimensions = dimension_cache.get("dimensions")
+    if dimensions is not None:
+        return dimensions
+
+    rows = db.execute(text("SELECT ClientID, ClientName FROM Clients")).fetchall()
+    dimensions = Dimensions(
+        clients={row.ClientID: row.ClientName for row in rows},
+        services={svc["service_id"]: svc for svc in load_services(db)},
+    )
+    dimension_cache.set("dimensions", dimensions, ttl)
+    return dimensions
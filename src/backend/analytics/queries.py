@@ -0,0 +1,106 @@
+"""
+File: queries.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Database reads shared by the analytics endpoints. Usage is
+             pre-aggregated to one row per (service, day) with GROUP BY so
+             only the compact daily series leaves the database, and is read
+             from the daily rollup rather than raw Usages rows.
+"""
+
+from datetime import date, timedelta
+from typing import Any
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from backend.db.query import Predicates
+from backend.analytics.rollups import usage_source
+
+
+def usage_filters(args: dict[str, Any]) -> Predicates:
+    # Same window as the dashboard: usage dated on or after today - days.
+    # Expects the usage source aliased as "u" and Services as "s".
+    where = Predicates()
+    where.gte("u.UsageDate", "start_date", date.today() - timedelta(days=args["days"]))
+    where.eq("u.ClientID", "client_id", args.get("client_id"))
+    where.eq("s.ProviderID", "provider_id", args.get("provider_id"))
+    where.eq("u.ServiceID", "service_id", args.get("service_id"))
+    return where
+
+
+def load_daily_service_usage(db: Session, where: Predicates) -> list[tuple]:
+    """Return (service_id, usage_date, units_used, total_cost) per service per day."""
+    source, source_params = usage_source(db, "day")
+    rows = db.execute(
+        text(
+            f"""
+            SELECT u.ServiceID, u.UsageDate,
+                   SUM(u.UnitsUsed) AS UnitsUsed,
+                   SUM(u.TotalCost) AS TotalCost
+            FROM {source} u
+            INNER JOIN Services s ON s.ServiceID = u.ServiceID
+            {where.sql()}
+            GROUP BY u.ServiceID, u.UsageDate
+            """
+        ),
+        {**source_params, **where.params},
+    ).fetchall()
+    return [tuple(row) for row in rows]
+
+
+def load_services(db: Session) -> list[dict[str, Any]]:
+    """Return every service with its provider name (the cross-provider rate map needs all of them)."""
+    rows = db.execute(
+        text("""
+            SELECT s.ServiceID, s.ServiceName, s.ServiceType, s.ServiceCost, s.ServiceUnit,
+                   s.ProviderID, p.ProviderName
+            FROM Services s
+            LEFT JOIN Providers p ON p.ProviderID = s.ProviderID
+            ORDER BY s.ServiceID
+        """)
+    ).fetchall()
+
+    return [
+        {
+            "service_id": row.ServiceID,
+            "service_name": row.ServiceName,
+            "service_type": row.ServiceType,
+            "service_cost": row.ServiceCost,
+            "service_unit": row.ServiceUnit,
+            "provider_id": row.ProviderID,
+            "provider_name": row.ProviderName or "Unknown",
+        }
+        for row in rows
+    ]
+
+
+def load_client_budget(db: Session, client_id: int | None) -> dict[str, Any] | None:
+    """Return the client's most recent budget, or None for the all-clients view."""
+    if client_id is None:
+        return None
+
+    row = db.execute(
+        text("""
+            SELECT BudgetID, ClientID, BudgetAmount, MonthlyLimit, AlertThreshold, AlertEnabled
+            FROM Budgets
+            WHERE ClientID = :client_id
+            ORDER BY BudgetID DESC
+            OFFSET 0 ROWS
+            FETCH NEXT 1 ROWS ONLY
+        """),
+        {
+            "client_id": client_id
+        },
+    ).fetchone()
+
+    if row is None:
+        return None
+
+    return {
+        "budget_id": row.BudgetID,
+        "client_id": row.ClientID,
+        "budget_amount": row.BudgetAmount,
+        "monthly_limit": row.MonthlyLimit,
+        "alert_threshold": row.AlertThreshold,
+        "alert_enabled": row.AlertEnabled,
+    }
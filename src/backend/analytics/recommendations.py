@@ -0,0 +1,182 @@
+"""
+File: recommendations.py
+Project: Cloud Cost Intelligence Platform
+Author: Michael Allen (Project Manager), Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Optimization recommendation engine (FR-05). Python port of
+             computeRecommendations() from frontend/js/analysis.js. Turns
+             waste alerts into a phased savings roadmap using the template
+             table in recommendation_templates.json, which is loaded once
+             when the app starts.
+"""
+
+import json
+import math
+from pathlib import Path
+from typing import Any
+
+TEMPLATES_PATH = Path(__file__).resolve().parent / "recommendation_templates.json"
+
+RecommendationTemplates = None
+
+# Minimum monthly cost before each template kind is worth recommending,
+# in the order the JS engine evaluates them
+MIN_MONTHLY_COST = {
+    "lifecycle": 30,
+    "reserved": 15,
+    "ondemand": 10,
+    "rightsize": 15,
+    "multicloud": 30,
+}
+RIGHTSIZE_MAX_UTILIZATION = 0.50
+
+PHASES = (1, 2, 3)
+
+
+def init_recommendation_templates(path: Path = TEMPLATES_PATH):
+    global RecommendationTemplates
+    with open(path, encoding="utf-8") as f:
+        RecommendationTemplates = json.load(f)
+
+
+def get_recommendation_templates() -> dict[str, Any]:
+    if RecommendationTemplates is None:
+        raise RuntimeError("Recommendation templates not initialized")
+    return RecommendationTemplates
+
+
+def _js_round(value: float) -> int:
+    # Math.round semantics (half rounds up), not Python's banker's rounding
+    return math.floor(value + 0.5)
+
+
+def _build_rec(alert: dict[str, Any], template: dict[str, Any], savings: int) -> dict[str, Any]:
+    formatted = f"${savings:,.2f}"
+    return {
+        "service_name": alert["service_name"],
+        "service_type": alert["service_type"],
+        "provider_name": alert["provider_name"],
+        "phase": template["phase"],
+        "action": template["action"],
+        "savings": savings,
+        "monthly_cost": alert["monthly_cost"],
+        "effort": dict(template["effort"]),
+        "plus": [line.replace("{savings}", formatted, 1) for line in template["plus"]],
+        "minus": list(template["minus"]),
+        "risk": template["risk"],
+        "severity": alert["severity"],
+    }
+
+
+def _payback(upfront: float, savings: float) -> str:
+    if upfront > 0 and savings > 0:
+        months = upfront / savings
+        if months >= 12:
+            return f"{_js_round(months / 12)}+ years"
+        return f"~{math.ceil(months)} months"
+    return "Immediate"
+
+
+def compute_recommendations(
+    alerts: list[dict[str, Any]],
+    services: list[dict[str, Any]],
+    summary: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Build the phase 1/2/3 savings roadmap.
+
+    alerts:   alerts from analytics.waste.compute_waste_alerts
+    services: every service (from analytics.queries.load_services)
+    summary:  the waste alert summary (total_monthly_cost, budget_amount)
+    """
+    templates = get_recommendation_templates()
+
+    # Which provider IDs offer each service type (multi-cloud candidates)
+    type_providers: dict[str, set[int]] = {}
+    for svc in services:
+        type_providers.setdefault(svc["service_type"], set()).add(svc["provider_id"])
+
+    phases: dict[int, list[dict[str, Any]]] = {p: [] for p in PHASES}
+    for alert in alerts:
+        service_templates = templates["service_types"].get(alert["service_type"]) or templates["default"]
+        monthly_cost = alert["monthly_cost"]
+        has_multi = len(type_providers.get(alert["service_type"], ())) > 1
+
+        for kind, min_cost in MIN_MONTHLY_COST.items():
+            template = service_templates.get(kind)
+            if template is None or monthly_cost <= min_cost:
+                continue
+            if kind == "rightsize" and alert["utilization"] >= RIGHTSIZE_MAX_UTILIZATION:
+                continue
+            if kind == "multicloud" and not has_multi:
+                continue
+
+            savings = _js_round(monthly_cost * template["savings_rate"])
+            if savings > 0:
+                phases[template["phase"]].append(_build_rec(alert, template, savings))
+
+    # Sort within each phase by savings desc (stable, like Array.sort)
+    for items in phases.values():
+        items.sort(key=lambda r: -r["savings"])
+
+    running_spend = summary["total_monthly_cost"]
+    budget_target = summary["budget_amount"]
+    phase_totals: dict[str, dict[str, Any]] = {}
+
+    for p in PHASES:
+        phase_def = templates["phases"][str(p)]
+
+        # Skip Phase 3 if Phases 1+2 already brought spend under budget
+        if p == 3 and running_spend <= budget_target:
+            phase_totals[str(p)] = {
+                **phase_def,
+                "savings": 0,
+                "upfront": 0,
+                "hours": 0,
+                "downtime": "None",
+                "payback": "N/A",
+                "budget_amount": budget_target,
+                "spend_before": _js_round(running_spend),
+                "spend_after": _js_round(running_spend),
+                "items": [],
+                "skipped": True,
+                "skip_reason": "Already under budget after Phases 1 & 2",
+            }
+            continue
+
+        items = phases[p]
+        total_savings = sum(r["savings"] for r in items)
+        total_upfront = sum(r["effort"]["cost"] for r in items)
+        total_hours = sum(r["effort"]["hours"] for r in items)
+
+        # Downtime of the last item in the phase that has any
+        downtimes = [r["effort"]["downtime"] for r in items if r["effort"]["downtime"] != "None"]
+
+        spend_before = running_spend
+        running_spend -= total_savings
+
+        phase_totals[str(p)] = {
+            **phase_def,
+            "savings": total_savings,
+            "upfront": total_upfront,
+            "hours": total_hours,
+            "downtime": downtimes[-1] if downtimes else "None",
+            "payback": _payback(total_upfront, total_savings),
+            "budget_amount": budget_target,
+            "spend_before": _js_round(spend_before),
+            "spend_after": _js_round(max(0.0, running_spend)),
+            "items": items,
+        }
+
+    totals: dict[str, Any] = {
+        "savings": sum(p["savings"] for p in phase_totals.values()),
+        "upfront": sum(p["upfront"] for p in phase_totals.values()),
+        "hours": sum(p["hours"] for p in phase_totals.values()),
+    }
+
+    # Flag if optimization can't reach budget — recommend budget increase
+    if running_spend > budget_target:
+        totals["budget_shortfall"] = round(running_spend - budget_target, 2)
+        totals["recommended_budget"] = math.ceil(running_spend / 100) * 100
+
+    return {"phases": phase_totals, "totals": totals}
@@ -0,0 +1,106 @@
+"""
+File: rollups.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Read side of the usage rollup tables (see
+             database/create_rollups.sql and backend.jobs.rollups). Picks the
+             coarsest rollup that answers a date range and exposes it as a
+             Usages-shaped source: the rollup rows up to the high-water mark
+             plus the few raw Usages rows created since, so results stay
+             exact between maintenance runs.
+"""
+
+import calendar
+from datetime import date
+from typing import Any, NamedTuple
+from sqlalchemy.orm import Session
+from backend.db.watermarks import load_high_water
+
+ROLLUP_NAME = "usage_rollups"
+
+
+class RollupGrain(NamedTuple):
+    table: str
+    # Bucket columns in the rollup table and the matching expressions over a
+    # Usages row; "{u}" is replaced with the Usages alias
+    bucket_columns: tuple[str, ...]
+    bucket_exprs: tuple[str, ...]
+
+
+# Finest to coarsest
+ROLLUPS = {
+    "hour": RollupGrain(
+        "UsageRollupHourly",
+        ("BucketDate", "BucketHour"),
+        ("{u}.UsageDate", "DATEPART(hour, {u}.UsageTime)"),
+    ),
+    "day": RollupGrain(
+        "UsageRollupDaily",
+        ("BucketDate",),
+        ("{u}.UsageDate",),
+    ),
+    "month": RollupGrain(
+        "UsageRollupMonthly",
+        ("BucketDate",),
+        ("DATEFROMPARTS(YEAR({u}.UsageDate), MONTH({u}.UsageDate), 1)",),
+    ),
+}
+RESOLUTIONS = tuple(ROLLUPS)
+
+
+def coarsest_resolution(start_date: date | None, end_date: date | None, interval: str = "month") -> str:
+    """
+    Return the coarsest rollup that can answer [start_date, end_date] at the
+    requested interval. Monthly buckets only answer ranges that start and end
+    on month boundaries; any whole-day range can be read from the daily rollup.
+    """
+    if interval == "hour":
+        return "hour"
+
+    month_aligned = (start_date is None or start_date.day == 1) and (
+        end_date is None or end_date.day == calendar.monthrange(end_date.year, end_date.month)[1]
+    )
+    if interval == "month" and month_aligned:
+        return "month"
+    return "day"
+
+
+def usage_source(db: Session, resolution: str = "day") -> tuple[str, dict[str, Any]]:
+    """
+    Return (sql, params) for a derived table to use in place of Usages, e.g.
+    f"FROM {sql} u". It has ClientID, ServiceID, UsageDate (the bucket date;
+    first of the month for "month"), UsageHour (for "hour" only), UnitsUsed,
+    TotalCost and UsageCount columns.
+    """
+    grain = ROLLUPS[resolution]
+    hourly = resolution == "hour"
+
+    raw_columns = f"ClientID, ServiceID, {grain.bucket_exprs[0].format(u='Usages')} AS UsageDate"
+    rollup_columns = "ClientID, ServiceID, BucketDate AS UsageDate"
+    if hourly:
+        raw_columns += f", {grain.bucket_exprs[1].format(u='Usages')} AS UsageHour"
+        rollup_columns += ", BucketHour AS UsageHour"
+
+    high_water = load_high_water(db, ROLLUP_NAME)
+    if high_water is None:
+        # Rollups have not been built yet: aggregate raw usage
+        return (
+            f"""(
+                SELECT {raw_columns}, UnitsUsed, TotalCost, 1 AS UsageCount
+                FROM Usages
+            )""",
+            {},
+        )
+
+    return (
+        f"""(
+                SELECT {rollup_columns}, UnitsUsed, TotalCost, UsageCount
+                FROM {grain.table}
+                UNION ALL
+                SELECT {raw_columns}, UnitsUsed, TotalCost, 1 AS UsageCount
+                FROM Usages
+                WHERE CreatedDate > :rollup_high_water
+            )""",
+        {"rollup_high_water": high_water},
+    )
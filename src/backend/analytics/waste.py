@@ -0,0 +1,205 @@
+"""
+File: waste.py
+Project: Cloud Cost Intelligence Platform
+Author: Michael Allen (Project Manager), Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Waste alert engine (FR-04). Python port of computeWasteAlerts()
+             from frontend/js/analysis.js. Works on one row per (service, day)
+             and computes every per-service metric with vectorized NumPy
+             group-by operations instead of per-record loops.
+"""
+
+from typing import Any, Iterable
+import numpy as np
+
+# Capacity baselines per service type for utilization estimation when a
+# service has no usage to derive a peak from (getCapacityBaseline in JS)
+CAPACITY_BASELINES = {
+    "Compute": 100,            # 100 hrs/day = full utilization
+    "Object Storage": 10000,   # 10,000 GB = full
+    "File Storage": 5000,      # 5,000 GB = full
+    "Databases": 24,           # 24 hrs/day = full
+    "Containers": 50,          # 50 units/day
+    "Managed Services": 100,
+    "Serverless": 100000,      # 100k requests
+}
+DEFAULT_CAPACITY_BASELINE = 100
+
+SEVERITY_ORDER = {"critical": 0, "warning": 1, "info": 2}
+
+
+def _number(value, default: float = 0.0) -> float:
+    # Mirrors parseFloat(x) || default: missing, zero and unparsable fall back
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    return number if number else default
+
+
+def budget_thresholds(budget: dict[str, Any] | None) -> tuple[float, float, float]:
+    """Return (budget_amount, monthly_limit, alert_threshold) with the JS defaults."""
+    if budget is None:
+        return 1000.0, 1000.0 * 1.1, 1000.0 * 0.9
+
+    budget_amount = _number(budget.get("budget_amount"), 1000.0)
+    monthly_limit = _number(budget.get("monthly_limit"), budget_amount * 1.1)
+    alert_threshold = _number(budget.get("alert_threshold"), budget_amount * 0.9)
+    return budget_amount, monthly_limit, alert_threshold
+
+
+def _daily_arrays(daily_rows: Iterable[tuple]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    rows = list(daily_rows)
+    service_ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+    days = np.fromiter((r[1].toordinal() for r in rows), dtype=np.int64, count=len(rows))
+    units = np.fromiter((float(r[2] or 0) for r in rows), dtype=np.float64, count=len(rows))
+    costs = np.fromiter((float(r[3] or 0) for r in rows), dtype=np.float64, count=len(rows))
+    return service_ids, days, units, costs
+
+
+def compute_waste_alerts(
+    daily_rows: Iterable[tuple],
+    services: list[dict[str, Any]],
+    budget: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """
+    Compute waste alerts from per-service daily usage.
+
+    daily_rows: (service_id, usage_date, units_used, total_cost), one row per
+                service per day (see analytics.queries.load_daily_service_usage)
+    services:   every service (from analytics.queries.load_services)
+    budget:     the client's budget record, or None for the all-clients view
+    """
+    budget_amount, monthly_limit, alert_threshold = budget_thresholds(budget)
+
+    service_map = {s["service_id"]: s for s in services}
+
+    # Cross-provider rate map: which providers offer each service type
+    type_providers: dict[str, set[str]] = {}
+    for svc in services:
+        type_providers.setdefault(svc["service_type"] or "Unknown", set()).add(svc["provider_name"])
+
+    service_ids, days, units, costs = _daily_arrays(daily_rows)
+
+    # Usage for services we no longer know about is skipped, as in the JS engine
+    known = np.isin(service_ids, np.fromiter(service_map.keys(), dtype=np.int64, count=len(service_map)))
+    service_ids, days, units, costs = service_ids[known], days[known], units[known], costs[known]
+
+    alerts: list[dict[str, Any]] = []
+    if service_ids.size:
+        # Group by service: sort by (service, day) and find segment boundaries
+        order = np.lexsort((days, service_ids))
+        service_ids, days, units, costs = service_ids[order], days[order], units[order], costs[order]
+        group_ids, starts, day_counts = np.unique(service_ids, return_index=True, return_counts=True)
+
+        total_units = np.add.reduceat(units, starts)
+        total_costs = np.add.reduceat(costs, starts)
+        peak_daily_units = np.maximum.reduceat(units, starts)
+
+        daily_cost = total_costs / day_counts
+        monthly_cost = daily_cost * 30
+
+        # Utilization: derived from peak usage + 20% headroom (industry standard)
+        fallback_base = np.array(
+            [CAPACITY_BASELINES.get(service_map[sid]["service_type"], DEFAULT_CAPACITY_BASELINE) for sid in group_ids],
+            dtype=np.float64,
+        )
+        utilization_base = np.where(peak_daily_units > 0, peak_daily_units * 1.2, fallback_base)
+        avg_daily_units = total_units / day_counts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            utilization = np.where(utilization_base > 0, np.minimum(avg_daily_units / utilization_base, 1.0), 0.5)
+
+        # Severity badges (visual indicator, still tiered)
+        severity = np.select(
+            [(utilization < 0.20) & (monthly_cost > 30), (utilization < 0.50) & (monthly_cost > 20)],
+            ["critical", "warning"],
+            default="info",
+        )
+
+        # Savings rate on a gradient — no cliffs
+        # 0% util → 50% recoverable, 50% util → 5%, 75%+ → 0%
+        savings_rate = np.select(
+            [utilization < 0.50, utilization < 0.75],
+            [0.50 - (utilization / 0.50) * 0.45, 0.05 - ((utilization - 0.50) / 0.25) * 0.05],
+            default=0.0,
+        )
+        # Noise filter: don't flag low-cost services
+        savings_rate = np.where(monthly_cost < 20, 0.0, savings_rate)
+        potential_savings = monthly_cost * savings_rate
+
+        # Trend: compare the later half of each service's active days against
+        # the earlier half (15 vs 15 on a full 30-day window)
+        segment = np.repeat(np.arange(group_ids.size), day_counts)
+        position = np.arange(service_ids.size) - np.repeat(starts, day_counts)
+        prior_counts = day_counts // 2
+        is_recent = position >= prior_counts[segment]
+        recent_sum = np.bincount(segment[is_recent], weights=costs[is_recent], minlength=group_ids.size)
+        prior_sum = np.bincount(segment[~is_recent], weights=costs[~is_recent], minlength=group_ids.size)
+        recent_avg = recent_sum / (day_counts - prior_counts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            prior_avg = np.where(prior_counts > 0, prior_sum / prior_counts, 0.0)
+            trend = np.where(prior_avg > 0, (recent_avg - prior_avg) / prior_avg * 100, 0.0)
+
+        for i, sid in enumerate(group_ids.tolist()):
+            svc = service_map[sid]
+            alternatives = len(type_providers.get(svc["service_type"] or "Unknown", ()))
+            alerts.append(
+                {
+                    "service_id": sid,
+                    "service_name": svc["service_name"],
+                    "service_type": svc["service_type"],
+                    "provider_name": svc["provider_name"],
+                    "provider_id": svc["provider_id"],
+                    "utilization": float(utilization[i]),
+                    "daily_cost": float(daily_cost[i]),
+                    "monthly_cost": float(monthly_cost[i]),
+                    "potential_savings": float(potential_savings[i]),
+                    "severity": str(severity[i]),
+                    "trend": float(trend[i]),
+                    "has_alternative": alternatives > 1,
+                    "is_locked": alternatives <= 1,
+                }
+            )
+
+    # Sort: critical first, then by savings desc
+    alerts.sort(key=lambda a: (SEVERITY_ORDER[a["severity"]], -a["potential_savings"]))
+
+    total_monthly_cost = sum(a["monthly_cost"] for a in alerts)
+    total_savings = sum(a["potential_savings"] for a in alerts)
+
+    provider_costs: dict[str, float] = {}
+    category_spend: dict[str, float] = {}
+    for a in alerts:
+        provider_costs[a["provider_name"]] = provider_costs.get(a["provider_name"], 0.0) + a["monthly_cost"]
+        category_spend[a["service_type"]] = category_spend.get(a["service_type"], 0.0) + a["monthly_cost"]
+
+    # Provider concentration
+    top_provider = max(provider_costs.items(), key=lambda item: item[1], default=None)
+    top_provider_pct = top_provider[1] / total_monthly_cost * 100 if top_provider and total_monthly_cost else 0.0
+
+    # Round for the response only after every total has been summed
+    for a in alerts:
+        a["utilization"] = round(a["utilization"], 4)
+        a["trend"] = round(a["trend"], 2)
+        for key in ("daily_cost", "monthly_cost", "potential_savings"):
+            a[key] = round(a[key], 2)
+
+    return {
+        "alerts": alerts,
+        "summary": {
+            "total_monthly_cost": round(total_monthly_cost, 2),
+            "total_savings": round(total_savings, 2),
+            "critical_count": sum(1 for a in alerts if a["severity"] == "critical"),
+            "warning_count": sum(1 for a in alerts if a["severity"] == "warning"),
+            "budget_amount": budget_amount,
+            "monthly_limit": monthly_limit,
+            "alert_threshold": alert_threshold,
+            "over_budget": total_monthly_cost > budget_amount,
+            "over_budget_amount": round(max(0.0, total_monthly_cost - budget_amount), 2),
+            "provider_costs": {k: round(v, 2) for k, v in provider_costs.items()},
+            "provider_count": len(provider_costs),
+            "top_provider": top_provider[0] if top_provider else "N/A",
+            "top_provider_pct": round(top_provider_pct, 2),
+            "category_spend": {k: round(v, 2) for k, v in category_spend.items()},
+        },
+    }
@@ -0,0 +1,135 @@
+"""
+File: workbook.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Server-side port of the dashboard's CSV export ("The Analyst's
+             Workbook", dashboard.js exportData). Rows are built from usage
+             ordered by date so the rolling averages and trends only need the
+             per client+service daily history seen so far, and the export can
+             be streamed straight from the database cursor.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from itertools import groupby
+from typing import Any, Iterable, Iterator
+from backend.analytics.dimensions import Dimensions
+
+HEADERS = [
+    "Date", "Client", "Provider", "Service", "Service Type", "Unit",
+    "Units Used", "Unit Cost", "Total Cost",
+    "Daily Avg (7d)", "30d Trend %", "Forecast 30d",
+    "AWS Rate", "Azure Rate", "GCP Rate",
+    "Cheapest", "Switch Savings", "Utilization %", "Status", "Est Monthly Savings",
+]
+
+RATE_PROVIDERS = ("AWS", "Azure", "GCP")
+
+
+def _fixed(value: float, digits: int = 2) -> str:
+    # Number.toFixed semantics: exact binary ties round away from zero, where
+    # Python's format() would round them to even
+    return str(Decimal(value).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP))
+
+
+def type_rates(services: Iterable[dict[str, Any]]) -> dict[str, dict[str, float]]:
+    """Cheapest rate per service type for each of AWS, Azure and GCP."""
+    rates: dict[str, dict[str, float]] = {}
+    for svc in services:
+        service_rates = rates.setdefault(svc["service_type"] or "Unknown", {})
+        provider = svc["provider_name"]
+        rate = float(svc["service_cost"] or 0)
+        if provider in RATE_PROVIDERS and (provider not in service_rates or rate < service_rates[provider]):
+            service_rates[provider] = rate
+    return rates
+
+
+def _metrics(costs: list[float]) -> tuple[float, float, float]:
+    # costs is the client+service daily history up to and including the row's date
+    target = len(costs) - 1
+
+    window = costs[max(0, target - 6):target + 1]
+    avg7d = sum(window) / len(window)
+
+    # Last 15 active days vs the 15 before them (index 0 included early on, as in the dashboard)
+    recent = costs[max(0, target - 14):target + 1]
+    prior = costs[max(0, target - 29):max(0, target - 15) + 1]
+    recent_avg = sum(recent) / len(recent)
+    prior_avg = sum(prior) / len(prior)
+    trend30d = (recent_avg - prior_avg) / prior_avg * 100 if prior_avg > 0 else 0.0
+
+    return avg7d, trend30d, avg7d * 30
+
+
+def _cheapest(rates: dict[str, float], units_used: float, total_cost: float) -> tuple[str, float]:
+    available = sorted(
+        ((name, rates[name]) for name in RATE_PROVIDERS if name in rates),
+        key=lambda item: item[1],
+    )
+    if len(available) == 1:
+        return available[0][0] + " Only", 0.0
+    if not available:
+        return "N/A", 0.0
+
+    name, cheapest_rate = available[0]
+    if all(rate == cheapest_rate for _, rate in available):
+        return "Tied", 0.0
+    return name, max(0.0, total_cost - units_used * cheapest_rate)
+
+
+def workbook_rows(usages: Iterable, dims: Dimensions) -> Iterator[list[str]]:
+    """
+    Yield one workbook row per usage row. usages must be ordered by
+    UsageDate (then ClientID) and have ClientID, ServiceID, UsageDate,
+    UnitsUsed and TotalCost columns.
+    """
+    rates_by_type = type_rates(dims.services.values())
+    history: dict[tuple[int, int], list[float]] = {}
+
+    for usage_date, day in groupby(usages, key=lambda row: row.UsageDate):
+        day_rows = list(day)
+
+        day_costs: dict[tuple[int, int], float] = {}
+        for row in day_rows:
+            key = (row.ClientID, row.ServiceID)
+            day_costs[key] = day_costs.get(key, 0.0) + float(row.TotalCost)
+        for key, cost in day_costs.items():
+            history.setdefault(key, []).append(cost)
+
+        date_text = usage_date.isoformat()
+        for row in day_rows:
+            service = dims.services.get(row.ServiceID)
+            service_type = (service and service["service_type"]) or "Unknown"
+            units_used = float(row.UnitsUsed)
+            total_cost = float(row.TotalCost)
+
+            avg7d, trend30d, forecast30d = _metrics(history[(row.ClientID, row.ServiceID)])
+            rates = rates_by_type.get(service_type, {})
+            cheapest, switch_savings = _cheapest(rates, units_used, total_cost)
+
+            # Estimated capacity is units * 1.5 (provisioned headroom)
+            capacity = units_used * 1.5
+            utilization = units_used / capacity if capacity > 0 else 0.0
+            status = "Underutilized" if utilization < 0.5 else ("Review" if utilization < 0.75 else "Optimal")
+            waste_rate = 0.30 if status == "Underutilized" else (0.10 if status == "Review" else 0.0)
+
+            yield [
+                date_text,
+                dims.clients.get(row.ClientID) or "Unknown",
+                service["provider_name"] if service else "Unknown",
+                (service and service["service_name"]) or "Unknown",
+                service_type,
+                (service and service["service_unit"]) or "unit",
+                _fixed(units_used),
+                _fixed(float(service["service_cost"] or 0) if service else 0.0),
+                _fixed(total_cost),
+                _fixed(avg7d),
+                ("+" if trend30d >= 0 else "") + _fixed(trend30d, 1) + "%",
+                _fixed(forecast30d),
+                *(_fixed(rates[name]) if name in rates else "N/A" for name in RATE_PROVIDERS),
+                cheapest,
+                _fixed(switch_savings),
+                _fixed(utilization * 100, 1) + "%",
+                status,
+                _fixed(forecast30d * waste_rate),
+            ]
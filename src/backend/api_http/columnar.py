@@ -0,0 +1,195 @@
+"""
+File: columnar.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Apache Arrow IPC stream and Parquet responses for the usage,
+             invoice and rollup lists. Result batches from the database
+             cursor are transposed straight into Arrow columns (no per-row
+             dicts or JSON strings) and written out as they arrive.
+"""
+
+from typing import Iterator, NamedTuple
+import pyarrow as pa
+import pyarrow.parquet as pq
+from flask import Response, stream_with_context
+from sqlalchemy import text
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import Session
+from backend.api_http.cursors import encode_cursor
+from backend.api_http.responses import FORMAT_MIMETYPES
+from backend.db.query import Predicates
+from backend.db.session import STREAM_BATCH_SIZE, hold_session_for_stream
+
+
+class Column(NamedTuple):
+    name: str  # field name, the same as in the JSON item
+    db_column: str
+    type: pa.DataType
+
+
+# Decimal measures are sent as float64 so notebooks get native numeric
+# columns; use the JSON formats when exact decimal strings are needed
+USAGE_COLUMNS = (
+    Column("usage_id", "UsageID", pa.int32()),
+    Column("client_id", "ClientID", pa.int32()),
+    Column("service_id", "ServiceID", pa.int32()),
+    Column("usage_date", "UsageDate", pa.date32()),
+    Column("usage_time", "UsageTime", pa.time64("us")),
+    Column("units_used", "UnitsUsed", pa.float64()),
+    Column("total_cost", "TotalCost", pa.float64()),
+    Column("created_date", "CreatedDate", pa.timestamp("us")),
+)
+
+INVOICE_COLUMNS = (
+    Column("invoice_id", "InvoiceID", pa.int32()),
+    Column("client_id", "ClientID", pa.int32()),
+    Column("invoice_date", "InvoiceDate", pa.date32()),
+    Column("invoice_amount", "InvoiceAmount", pa.float64()),
+    Column("created_date", "CreatedDate", pa.timestamp("us")),
+)
+
+# Bucket date and hour stay separate typed columns instead of the JSON
+# "bucket" string; bucket_hour is null unless interval=hour
+ROLLUP_COLUMNS = (
+    Column("bucket_date", "BucketDate", pa.date32()),
+    Column("bucket_hour", "BucketHour", pa.int8()),
+    Column("client_id", "ClientID", pa.int32()),
+    Column("service_id", "ServiceID", pa.int32()),
+    Column("provider_id", "ProviderID", pa.int32()),
+    Column("units_used", "UnitsUsed", pa.float64()),
+    Column("total_cost", "TotalCost", pa.float64()),
+    Column("usage_count", "UsageCount", pa.int64()),
+)
+
+
+def _schema(columns: tuple[Column, ...]) -> pa.Schema:
+    return pa.schema([pa.field(column.name, column.type) for column in columns])
+
+
+def _array(values: tuple, data_type: pa.DataType) -> pa.Array:
+    if pa.types.is_floating(data_type):
+        # Let Arrow infer decimal128 from the Decimals, then cast the whole column
+        return pa.array(values).cast(data_type)
+    return pa.array(values, type=data_type)
+
+
+def record_batches(result: Result, columns: tuple[Column, ...], limit: int) -> Iterator[pa.RecordBatch]:
+    """Yield up to limit rows of result as record batches of STREAM_BATCH_SIZE rows."""
+    schema = _schema(columns)
+    keys = list(result.keys())
+    positions = [keys.index(column.db_column) for column in columns]
+
+    remaining = limit
+    for rows in result.partitions(STREAM_BATCH_SIZE):
+        rows = rows[:remaining]
+        if not rows:
+            break
+        # Transpose the batch of row tuples into one tuple per column
+        values = list(zip(*rows))
+        yield pa.RecordBatch.from_arrays(
+            [_array(values[position], column.type) for position, column in zip(positions, columns)],
+            schema=schema,
+        )
+        remaining -= len(rows)
+        if remaining == 0:
+            break
+
+
+class _ChunkSink:
+    """Write-only file object that collects encoded bytes until drained."""
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self.chunks.append(chunk)
+        self.position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def next_page_cursor(
+    db: Session, table: str, date_column: str, id_column: str, where: Predicates, offset: int, limit: int,
+) -> str | None:
+    """
+    next_cursor for a "date DESC, id DESC" page that is about to be streamed:
+    the key of the page's last row, if another row follows it. The body has
+    no meta, so it goes in the X-Next-Cursor header, which is sent before
+    any row is read. Run it before the page's own query, which holds the
+    connection's result set while it streams.
+    """
+    keys = db.execute(
+        text(
+            f"""
+            SELECT {date_column}, {id_column}
+            FROM {table}
+            {where.sql()}
+            ORDER BY {date_column} DESC, {id_column} DESC
+            OFFSET :offset ROWS
+            FETCH NEXT 2 ROWS ONLY
+            """
+        ),
+        {
+            "offset": offset + limit - 1,
+            **where.params,
+        },
+    ).all()
+    if len(keys) < 2:
+        return None
+    return encode_cursor(keys[0][0], keys[0][1])
+
+
+def ok_resource_columnar(
+    result: Result, columns: tuple[Column, ...], resource_type, limit, response_format, next_cursor=None,
+):
+    """
+    Stream up to limit rows as an Arrow IPC stream or a Parquet file
+    (response_format "arrow" or "parquet"), one record batch or row group
+    per database batch.
+    """
+    schema = _schema(columns)
+
+    def generate():
+        sink = _ChunkSink()
+        output = pa.PythonFile(sink, mode="w")
+        if response_format == "parquet":
+            writer = pq.ParquetWriter(output, schema)
+        else:
+            writer = pa.ipc.new_stream(output, schema)
+
+        yield sink.drain()
+        for batch in record_batches(result, columns, limit):
+            writer.write_batch(batch)
+            yield sink.drain()
+        writer.close()
+        yield sink.drain()
+
+    headers = {}
+    if response_format == "parquet":
+        headers["Content-Disposition"] = f'attachment; filename="{resource_type}.parquet"'
+    # Only present when there is another page to fetch with ?cursor=
+    if next_cursor is not None:
+        headers["X-Next-Cursor"] = next_cursor
+
+    return hold_session_for_stream(Response(
+        stream_with_context(generate()),
+        mimetype=FORMAT_MIMETYPES[response_format],
+        headers=headers,
+    ))
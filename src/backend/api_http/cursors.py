@@ -0,0 +1,27 @@
+"""
+File: cursors.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Opaque keyset pagination cursors. A cursor encodes the sort key of
+             the last row returned so the next page can seek past it instead of
+             scanning and discarding rows with OFFSET.
+"""
+
+import base64
+import json
+from datetime import date
+
+
+def encode_cursor(key_date: date, key_id: int) -> str:
+    raw = json.dumps([key_date.isoformat(), key_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[date, int]:
+    padded = token + "=" * (-len(token) % 4)
+    raw = base64.urlsafe_b64decode(padded.encode("ascii"))
+    key_date, key_id = json.loads(raw)
+    if not isinstance(key_id, int) or isinstance(key_id, bool):
+        raise ValueError("cursor id must be an integer")
+    return date.fromisoformat(key_date), key_id
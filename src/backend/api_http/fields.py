@@ -8,8 +8,11 @@ Description: Define API field parsing rules
 
 # backend/api_http/fields.py
 from marshmallow import fields, ValidationError
+from datetime import date
 from decimal import Decimal, InvalidOperation
 from typing import Any
+import binascii
+from backend.api_http.cursors import decode_cursor
 
 class FlexibleDecimal(fields.Field):
     """Accept Decimal/int/float/str and return Decimal."""
@@ -26,4 +29,15 @@ class FlexibleDecimal(fields.Field):
                 return Decimal(value)
         except (InvalidOperation, ValueError):
             raise ValidationError(f"{field} must be a number or numeric string")
-        raise ValidationError(f"{field} must be a number or numeric string")
\ No newline at end of file
+        raise ValidationError(f"{field} must be a number or numeric string")
+
+
+class KeysetCursor(fields.Field):
+    """Accept an opaque cursor string and return its (date, id) sort key."""
+    def _deserialize(self, value: Any, attr: str | None, data: Any, **kwargs) -> tuple[date, int]:
+        if not isinstance(value, str) or not value:
+            raise ValidationError("cursor must be a non-empty string")
+        try:
+            return decode_cursor(value)
+        except (ValueError, TypeError, binascii.Error, UnicodeError):
+            raise ValidationError("cursor is not a valid page cursor")
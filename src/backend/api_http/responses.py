@@ -6,7 +6,24 @@ Created: Feburary 2026
 Description: Provides standardized JSON structured response templates
 """
 
-from flask import jsonify
+import csv
+import io
+from typing import Any, Callable, Iterable
+from flask import Response, current_app, jsonify, request, stream_with_context
+from backend.api_http import timing
+from backend.db.session import hold_session_for_stream
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+CSV_CHUNK_ROWS = 1000
+
+# List formats by ?format= name; JSON first so "*/*" and no Accept header keep JSON
+FORMAT_MIMETYPES = {
+    "json": "application/json",
+    "ndjson": NDJSON_MIMETYPE,
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+COLUMNAR_FORMATS = ("arrow", "parquet")
 
 def ok(data=None, meta=None, status_code=200):
     payload = {
@@ -19,7 +36,14 @@ def ok(data=None, meta=None, status_code=200):
     if meta is not None:
         payload["meta"] = meta
 
-    return jsonify(payload), status_code
+    # Debug breakdown (SERVER_TIMING_META); a copy, as meta may be cached
+    request_timing = timing.meta_timing()
+    if request_timing is not None:
+        payload["meta"] = {**(meta or {}), "timing": request_timing}
+
+    with timing.phase("serialize"):
+        response = jsonify(payload)
+    return response, status_code
 
 def ok_resource(resource, resource_type):
     return ok(
@@ -29,16 +53,90 @@ def ok_resource(resource, resource_type):
         },
     )
 
-def ok_resource_list(resource_list, resource_type):
+def ok_resource_list(resource_list, resource_type, next_cursor=None):
+    meta = {
+        "type": resource_type,
+        "count": len(resource_list),
+    }
+
+    # Only present when there is another page to fetch with ?cursor=
+    if next_cursor is not None:
+        meta["next_cursor"] = next_cursor
+
     return ok(
         data=resource_list,
-        meta={
-            "type": resource_type,
-            "count": len(resource_list),
-        },
+        meta=meta,
     )
 
 
+def response_format() -> str:
+    # ?format=<name>, or the format whose mimetype the Accept header prefers
+    requested = request.args.get("format")
+    if requested in FORMAT_MIMETYPES:
+        return requested
+    best = request.accept_mimetypes.best_match(list(FORMAT_MIMETYPES.values()))
+    for name, mimetype in FORMAT_MIMETYPES.items():
+        if mimetype == best:
+            return name
+    return "json"
+
+def ok_resource_stream(rows: Iterable, to_item: Callable[[Any], dict], resource_type, limit, cursor_of=None):
+    """
+    Stream a list as NDJSON: one item per line, written as rows arrive, then
+    a final {"status": "ok", "meta": {...}} line with the same meta as
+    ok_resource_list. Pass limit + 1 rows and cursor_of(row) to get a
+    next_cursor when another page exists.
+    """
+    dumps = current_app.json.dumps
+
+    def generate():
+        count = 0
+        last_row = None
+        next_cursor = None
+        for row in rows:
+            if count == limit:
+                if cursor_of is not None:
+                    next_cursor = cursor_of(last_row)
+                break
+            yield dumps(to_item(row)) + "\n"
+            count += 1
+            last_row = row
+
+        meta = {
+            "type": resource_type,
+            "count": count,
+        }
+        if next_cursor is not None:
+            meta["next_cursor"] = next_cursor
+        yield dumps({"status": "ok", "meta": meta}) + "\n"
+
+    return hold_session_for_stream(Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE))
+
+
+def csv_stream(header: list[str], rows: Iterable[list[str]], filename: str):
+    """
+    Stream a CSV download, flushing every CSV_CHUNK_ROWS rows so neither the
+    server nor the browser has to hold the whole file.
+    """
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(header)
+        for count, row in enumerate(rows, start=1):
+            writer.writerow(row)
+            if count % CSV_CHUNK_ROWS == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    return hold_session_for_stream(Response(
+        stream_with_context(generate()),
+        mimetype="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    ))
+
+
 def error(type, message, details=None, status_code=400):
     payload = {
         "status": "error",
@@ -51,7 +149,9 @@ def error(type, message, details=None, status_code=400):
     if details is not None:
         payload["error"]["details"] = details
 
-    return jsonify(payload), status_code
+    with timing.phase("serialize"):
+        response = jsonify(payload)
+    return response, status_code
 
 def error_resource_missing(resource_type, resource_id):
     return error(
@@ -7,13 +7,21 @@ Description: Defined API parameter schemas that endpoints can make use of
 """
 
 from marshmallow import EXCLUDE, Schema, fields, validate, validates_schema, ValidationError, RAISE
-from backend.api_http.fields import FlexibleDecimal
+from backend.api_http import timing
+from backend.api_http.fields import FlexibleDecimal, KeysetCursor
 
 
+# Base for the parameter schemas below; load() counts as the request's
+# validate phase (see timing.py)
+class ApiSchema(Schema):
+    def load(self, *args, **kwargs):
+        with timing.phase("validate"):
+            return super().load(*args, **kwargs)
+
 
 # For endpoints that return lists of data in pages
 # NOTE: Max page size is 50000
-class PagedSchema(Schema):
+class PagedSchema(ApiSchema):
     class Meta:
         unknown = EXCLUDE
     
@@ -28,8 +36,22 @@ class PagedSchema(Schema):
     )
 
 
+# For date-ordered lists (usages, invoices) that also accept keyset cursors.
+# A cursor replaces page: the next page seeks past the last row returned
+# instead of making the database skip every earlier row.
+class CursorPagedSchema(PagedSchema):
+    cursor = KeysetCursor(load_default=None)
+
+    @validates_schema
+    def validate_cursor_page(self, data, **kwargs):
+        if data.get("cursor") is not None and data.get("page", 1) > 1:
+            raise ValidationError(
+                {"cursor": ["cursor cannot be combined with page."]}
+            )
+
+
 # For endpoints that return data within date ranges (format YYY-MM-DD)
-class DateRangeSchema(Schema):
+class DateRangeSchema(ApiSchema):
     class Meta:
         unknown = EXCLUDE
     
@@ -49,7 +71,66 @@ class DateRangeSchema(Schema):
 
 
 
-class BudgetPatchSchema(Schema):
+# For analytics endpoints that aggregate the last N days of usage
+# NOTE: Max window is 730 days
+class AnalyticsFilterSchema(ApiSchema):
+    class Meta:
+        unknown = EXCLUDE
+
+    days = fields.Int(
+        load_default=30,
+        validate=validate.Range(min=1, max=730),
+    )
+
+    client_id = fields.Int(load_default=None)
+    provider_id = fields.Int(load_default=None)
+    service_id = fields.Int(load_default=None)
+
+
+# Recommendations look at a full year of usage by default and only filter by
+# client: every provider is needed to find cross-provider savings
+class RecommendationFilterSchema(ApiSchema):
+    class Meta:
+        unknown = EXCLUDE
+
+    days = fields.Int(
+        load_default=365,
+        validate=validate.Range(min=1, max=730),
+    )
+
+    client_id = fields.Int(load_default=None)
+
+
+# For the usage rollup endpoint: a date range summed into hour, day or month buckets
+class UsageRollupSchema(DateRangeSchema):
+    interval = fields.Str(
+        load_default="day",
+        validate=validate.OneOf(["hour", "day", "month"]),
+    )
+
+    client_id = fields.Int(load_default=None)
+    provider_id = fields.Int(load_default=None)
+    service_id = fields.Int(load_default=None)
+
+
+# For the usage CSV export: a date range and the dashboard's filters
+class UsageExportSchema(DateRangeSchema):
+    client_id = fields.Int(load_default=None)
+    provider_id = fields.Int(load_default=None)
+    service_id = fields.Int(load_default=None)
+
+
+
+# For /health/sql: how many statements to list and how to rank them
+class SqlStatsSchema(ApiSchema):
+    class Meta:
+        unknown = EXCLUDE
+
+    top = fields.Int(load_default=20, validate=validate.Range(min=1, max=500))
+    order = fields.Str(load_default="total", validate=validate.OneOf(["total", "mean", "calls", "max"]))
+
+
+class BudgetPatchSchema(ApiSchema):
     class Meta:
         unknown = RAISE  # reject any field not defined here
 
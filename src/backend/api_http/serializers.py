@@ -0,0 +1,34 @@
+"""
+File: serializers.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Row to JSON item converters shared by the list endpoints, so a
+             page serializes the same whether it is returned as one JSON
+             document or streamed as NDJSON.
+"""
+
+from typing import Any
+
+
+def usage_item(row) -> dict[str, Any]:
+    return {
+        "usage_id": row.UsageID,
+        "client_id": row.ClientID,
+        "service_id": row.ServiceID,
+        "usage_date": row.UsageDate.isoformat() if row.UsageDate else None,
+        "usage_time": row.UsageTime.isoformat() if row.UsageTime else None,
+        "units_used": row.UnitsUsed,
+        "total_cost": row.TotalCost,
+        "created_date": row.CreatedDate.isoformat() if row.CreatedDate else None,
+    }
+
+
+def invoice_item(row) -> dict[str, Any]:
+    return {
+        "invoice_id": row.InvoiceID,
+        "client_id": row.ClientID,
+        "invoice_date": row.InvoiceDate.isoformat() if row.InvoiceDate else None,
+        "invoice_amount": row.InvoiceAmount,
+        "created_date": row.CreatedDate.isoformat() if row.CreatedDate else None,
+    }
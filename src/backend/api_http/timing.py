@@ -0,0 +1,167 @@
+"""
+File: timing.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Per-request phase timing (SERVER_TIMING). Splits each API
+             request into parameter validation, SQL statements, the rest of
+             the handler (fetching rows and turning them into dicts) and
+             JSON serialization, and reports the split in a Server-Timing
+             header and, with SERVER_TIMING_META, a meta.timing block in
+             ok() responses. When off, no hook is installed and phase() is
+             a flag check.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+from flask import Flask, Response, g, has_app_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Server-Timing entries, in order, with their descriptions. "convert" is
+# what is left of the request once the measured phases are taken out.
+PHASES = {
+    "validate": "Parameter validation",
+    "db": "SQL statements",
+    "convert": "Rows to dicts",
+    "serialize": "JSON encoding",
+}
+MEASURED = ("validate", "db", "serialize")
+
+_enabled = False
+_meta = False
+
+
+class RequestTiming:
+    """Seconds spent per measured phase since the request started."""
+
+    __slots__ = ("started", "seconds", "queries", "in_session")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.seconds = dict.fromkeys(MEASURED, 0.0)
+        self.queries = 0
+        # Inside Session.execute, which is timed as a whole
+        self.in_session = False
+
+    def add(self, phase: str, seconds: float):
+        self.seconds[phase] += seconds
+
+    def breakdown(self) -> dict[str, Any]:
+        """Milliseconds per phase and in total so far, and the statement count."""
+        total = time.perf_counter() - self.started
+        seconds = {**self.seconds, "convert": max(total - sum(self.seconds.values()), 0.0)}
+        breakdown: dict[str, Any] = {phase: round(seconds[phase] * 1000, 2) for phase in PHASES}
+        breakdown["total"] = round(total * 1000, 2)
+        breakdown["queries"] = self.queries
+        return breakdown
+
+
+def init_request_timing(app: Flask, enabled: bool, meta: bool = False):
+    global _enabled, _meta
+    _enabled = enabled
+    _meta = enabled and meta
+    if not enabled:
+        return
+    # On the classes, so the primary, replica and snapshot engines (built
+    # later, on first use) and every session are covered
+    if not event.contains(Engine, "before_cursor_execute", _before_execute):
+        event.listen(Engine, "before_cursor_execute", _before_execute)
+        event.listen(Engine, "after_cursor_execute", _after_execute)
+        event.listen(Session, "do_orm_execute", _session_execute)
+    app.before_request(_start)
+    app.after_request(_finish)
+
+
+def current() -> RequestTiming | None:
+    if not _enabled or not has_app_context():
+        return None
+    return g.get("request_timing")
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Count the time in the block towards phase `name` of the current request."""
+    timing = current()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(name, time.perf_counter() - started)
+
+
+def meta_timing() -> dict[str, Any] | None:
+    """
+    The breakdown so far for meta.timing, or None when SERVER_TIMING_META
+    is off. It is taken before the body is encoded, so serialization only
+    shows in the header.
+    """
+    if not _meta:
+        return None
+    timing = current()
+    if timing is None:
+        return None
+    breakdown = timing.breakdown()
+    del breakdown["serialize"]
+    return breakdown
+
+
+def server_timing_header(breakdown: dict[str, Any]) -> str:
+    entries = []
+    for name, description in PHASES.items():
+        if name == "db":
+            count = breakdown["queries"]
+            description = f"{count} SQL statement{'' if count == 1 else 's'}"
+        entries.append(f'{name};dur={breakdown[name]:.2f};desc="{description}"')
+    entries.append(f"total;dur={breakdown['total']:.2f}")
+    return ", ".join(entries)
+
+
+def _start():
+    g.request_timing = RequestTiming()
+
+
+def _finish(response: Response) -> Response:
+    # Streamed bodies (NDJSON, Arrow, CSV) are produced after this point,
+    # so their header covers the work done before the first byte
+    timing = g.get("request_timing")
+    if timing is not None:
+        response.headers["Server-Timing"] = server_timing_header(timing.breakdown())
+    return response
+
+
+def _session_execute(state):
+    # Statements run through a session: time the whole call, which also
+    # covers checking a connection out of the pool (a new Azure connection
+    # takes a while)
+    timing = current()
+    if timing is None or timing.in_session:
+        return None
+    timing.in_session = True
+    started = time.perf_counter()
+    try:
+        return state.invoke_statement()
+    finally:
+        timing.in_session = False
+        timing.add("db", time.perf_counter() - started)
+
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    if current() is not None:
+        context._request_timing_started = time.perf_counter()
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_request_timing_started", None)
+    if started is None:
+        return
+    timing = current()
+    if timing is not None:
+        timing.queries += 1
+        if not timing.in_session:
+            timing.add("db", time.perf_counter() - started)
@@ -0,0 +1,221 @@
+"""
+File: asgi.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: ASGI entry point. Serves the Flask app from an asyncio event
+             loop: connections and queued requests are held by the loop,
+             and each request (with its pyodbc calls) runs on a bounded
+             thread pool, so one slow query no longer blocks a whole worker.
+
+                 gunicorn -k asgi --worker-connections 1000 backend.asgi:app
+"""
+
+import asyncio
+import io
+import json
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+from backend import create_app
+
+
+class ThreadPoolASGI:
+    """
+    Run a WSGI app under ASGI. Request bodies are read on the loop, the WSGI
+    call and response iteration run on a pool of `threads` threads, and
+    body chunks are sent back through the loop as they are produced.
+    Requests beyond `max_in_flight` get a 503 instead of queuing.
+    """
+
+    def __init__(self, wsgi_app: Callable, threads: int, max_in_flight: int):
+        self.wsgi_app = wsgi_app
+        self.threads = max(1, threads)
+        self.max_in_flight = max(self.threads, max_in_flight)
+        self.in_flight = 0
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # Created on first use so it is made in the worker, not before fork
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="asgi-request")
+        return self._executor
+
+    async def __call__(self, scope: dict[str, Any], receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                if self._executor is not None:
+                    self._executor.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send):
+        if self.in_flight >= self.max_in_flight:
+            await _send_overloaded(send)
+            return
+
+        self.in_flight += 1
+        try:
+            body = bytearray()
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                body += message.get("body", b"")
+                if not message.get("more_body", False):
+                    break
+
+            loop = asyncio.get_running_loop()
+            outbox: asyncio.Queue = asyncio.Queue()
+            state = {"open": True}
+
+            def hand_over(item):
+                # Runs on the loop; once the coroutine has left, fail the
+                # thread's send instead of queuing it
+                message, sent = item
+                if state["open"]:
+                    outbox.put_nowait(item)
+                elif sent is not None:
+                    sent.set_exception(ConnectionError("Client connection closed"))
+
+            def send_from_thread(message, wait=True):
+                # send() has to be awaited by this coroutine, so messages are
+                # handed over; the thread waits for each one to go out
+                sent = Future() if wait else None
+                loop.call_soon_threadsafe(hand_over, (message, sent))
+                if sent is not None:
+                    sent.result()
+
+            environ = _environ(scope, bytes(body))
+            task = loop.run_in_executor(self.executor, self._run_wsgi, environ, send_from_thread)
+            task.add_done_callback(lambda done: hand_over((None, None)))
+            started = False
+            try:
+                while True:
+                    message, sent = await outbox.get()
+                    if message is None:
+                        # The thread ended without sending the final chunk
+                        if started:
+                            raise RuntimeError("Response ended early") from task.exception()
+                        await _send_server_error(send)
+                        return
+                    try:
+                        await send(message)
+                    finally:
+                        if sent is not None:
+                            sent.set_result(None)
+                    started = True
+                    if message["type"] == "http.response.body" and not message.get("more_body", False):
+                        # Return straight away: gunicorn only starts reading
+                        # the next keep-alive request once the app returns
+                        return
+            finally:
+                state["open"] = False
+                while not outbox.empty():
+                    _, sent = outbox.get_nowait()
+                    if sent is not None:
+                        sent.set_exception(ConnectionError("Client connection closed"))
+        finally:
+            self.in_flight -= 1
+
+    def _run_wsgi(self, environ: dict[str, Any], send: Callable[..., None]):
+        response: dict[str, Any] = {}
+
+        def start_response(status, headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [
+                (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers
+            ]
+            return lambda data: None  # write() is not used by Flask
+
+        iterable = self.wsgi_app(environ, start_response)
+        try:
+            # Hold one chunk back so the last one can carry more_body=False
+            pending = None
+            for chunk in iterable:
+                if not chunk:
+                    continue
+                if pending is None:
+                    send({"type": "http.response.start", "status": response["status"], "headers": response["headers"]})
+                else:
+                    send({"type": "http.response.body", "body": pending, "more_body": True})
+                pending = chunk
+        finally:
+            # Runs Flask teardown (session removal) on this thread, before
+            # the last chunk reaches the client
+            if hasattr(iterable, "close"):
+                iterable.close()
+        if pending is None:
+            send({"type": "http.response.start", "status": response["status"], "headers": response["headers"]})
+        send({"type": "http.response.body", "body": pending or b"", "more_body": False}, wait=False)
+
+
+def _environ(scope: dict[str, Any], body: bytes) -> dict[str, Any]:
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": str(client[0]),
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+            continue
+        if name == "CONTENT_LENGTH":
+            continue
+        key = f"HTTP_{name}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+async def _send_error(send, status: int, code: str, message: str, headers=()):
+    # Same body shape as api_http.responses.error()
+    body = json.dumps({"status": "error", "error": {"code": code, "message": message}}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), *headers],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_overloaded(send):
+    await _send_error(send, 503, "overloaded", "Too many requests in flight; retry shortly.", [(b"retry-after", b"1")])
+
+
+async def _send_server_error(send):
+    await _send_error(send, 500, "internal_error", "Internal server error.")
+
+flask_app = create_app()
+app = ThreadPoolASGI(
+    flask_app,
+    threads=flask_app.config["ASGI_THREADS"]
+    or flask_app.config["SQL_POOL_SIZE"] + flask_app.config["SQL_MAX_OVERFLOW"],
+    max_in_flight=flask_app.config["ASGI_MAX_IN_FLIGHT"],
+)
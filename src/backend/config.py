@@ -8,15 +8,70 @@ Description: Application configuration settings. Loads environment variables
 """
 
 import os
+from pathlib import Path
 
 class BaseConfig:
     ENV = os.getenv("ENV", "local")
+    # "azure", or "sqlite" / "duckdb" for the local stand-in database (db/standin.py)
+    DB_BACKEND = os.getenv("DB_BACKEND", "azure").strip().lower()
+    SQLITE_PATH = os.getenv("SQLITE_PATH") or str(Path(__file__).resolve().parent / "local.db")
+    DUCKDB_PATH = os.getenv("DUCKDB_PATH") or str(Path(__file__).resolve().parent / "local.duckdb")
+    # Added to every stand-in statement to mimic the Azure round trip
+    SQL_STANDIN_LATENCY_MS = float(os.getenv("SQL_STANDIN_LATENCY_MS", "0"))
     AZURE_SQL_SERVER = os.getenv("AZURE_SQL_SERVER")
     AZURE_SQL_DATABASE = os.getenv("AZURE_SQL_DATABASE")
 
     SQL_POOL_SIZE = int(os.getenv("SQL_POOL_SIZE", "5"))
     SQL_MAX_OVERFLOW = int(os.getenv("SQL_MAX_OVERFLOW", "10"))
     SQL_POOL_RECYCLE = int(os.getenv("SQL_POOL_RECYCLE", "1800"))  # seconds
+    # Open SQL_POOL_SIZE connections in the background at startup
+    SQL_POOL_WARMUP = os.getenv("SQL_POOL_WARMUP", "false").strip().lower() in ("1", "true", "yes")
+    # Ping a pooled connection on checkout only after this many idle seconds (0 pings every checkout)
+    SQL_POOL_PING_IDLE = float(os.getenv("SQL_POOL_PING_IDLE", "30"))
+
+    # Adaptive pool: resize the steady-state pool between MIN and MAX from
+    # the p95 checkout wait, re-evaluated every ADAPT_INTERVAL seconds
+    SQL_POOL_ADAPTIVE = os.getenv("SQL_POOL_ADAPTIVE", "false").strip().lower() in ("1", "true", "yes")
+    SQL_POOL_MIN_SIZE = int(os.getenv("SQL_POOL_MIN_SIZE", "2"))
+    SQL_POOL_MAX_SIZE = int(os.getenv("SQL_POOL_MAX_SIZE", "20"))
+    SQL_POOL_ADAPT_INTERVAL = int(os.getenv("SQL_POOL_ADAPT_INTERVAL", "30"))  # seconds
+    SQL_POOL_TARGET_WAIT_MS = float(os.getenv("SQL_POOL_TARGET_WAIT_MS", "50"))
+
+    # Read replica: GET requests use a second engine with ApplicationIntent=ReadOnly
+    # (same server unless AZURE_SQL_READ_SERVER is set), falling back to the
+    # primary for SQL_READ_RETRY_SECONDS after a failed replica connection
+    SQL_READ_REPLICA = os.getenv("SQL_READ_REPLICA", "false").strip().lower() in ("1", "true", "yes")
+    AZURE_SQL_READ_SERVER = os.getenv("AZURE_SQL_READ_SERVER") or AZURE_SQL_SERVER
+    SQL_READ_RETRY_SECONDS = int(os.getenv("SQL_READ_RETRY_SECONDS", "30"))
+
+    # ASGI mode (backend.asgi): threads running requests (0 means
+    # SQL_POOL_SIZE + SQL_MAX_OVERFLOW) and requests accepted before 503s
+    ASGI_THREADS = int(os.getenv("ASGI_THREADS", "0"))
+    ASGI_MAX_IN_FLIGHT = int(os.getenv("ASGI_MAX_IN_FLIGHT", "1000"))
+
+    # Analytics snapshot (db/snapshot.py): the analytics endpoints scan an
+    # in-memory DuckDB copy of Usages, Services, Providers and Invoices,
+    # topped up with new usage every REFRESH seconds and rebuilt every REBUILD
+    ANALYTICS_SNAPSHOT = os.getenv("ANALYTICS_SNAPSHOT", "false").strip().lower() in ("1", "true", "yes")
+    ANALYTICS_SNAPSHOT_REFRESH = int(os.getenv("ANALYTICS_SNAPSHOT_REFRESH", "300"))  # seconds
+    ANALYTICS_SNAPSHOT_REBUILD = int(os.getenv("ANALYTICS_SNAPSHOT_REBUILD", "86400"))  # seconds
+
+    # SQL statement telemetry (db/statements.py): per-statement totals for
+    # /health/sql, a log line for statements slower than SQL_SLOW_QUERY_MS,
+    # and a warning for requests running more than SQL_QUERY_BUDGET
+    # statements or one statement SQL_REPEAT_THRESHOLD times (N+1)
+    SQL_STATS = os.getenv("SQL_STATS", "true").strip().lower() in ("1", "true", "yes")
+    SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "500"))
+    SQL_QUERY_BUDGET = int(os.getenv("SQL_QUERY_BUDGET", "20"))
+    SQL_REPEAT_THRESHOLD = int(os.getenv("SQL_REPEAT_THRESHOLD", "5"))
+
+    # Per-request phase timing (api_http/timing.py): a Server-Timing header
+    # on every API response, plus meta.timing in JSON bodies with _META
+    SERVER_TIMING = os.getenv("SERVER_TIMING", "false").strip().lower() in ("1", "true", "yes")
+    SERVER_TIMING_META = os.getenv("SERVER_TIMING_META", "false").strip().lower() in ("1", "true", "yes")
+
+    ANALYTICS_CACHE_TTL = int(os.getenv("ANALYTICS_CACHE_TTL", "300"))  # seconds, 0 disables
+    DIMENSION_CACHE_TTL = int(os.getenv("DIMENSION_CACHE_TTL", "300"))  # seconds, 0 disables
 
 
 class LocalConfig(BaseConfig):
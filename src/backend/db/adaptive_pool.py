@@ -0,0 +1,188 @@
+"""
+File: adaptive_pool.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Optional adaptive connection pool (SQL_POOL_ADAPTIVE). A
+             background controller grows the steady-state pool when recent
+             checkout waits are slow and shrinks it when connections sit
+             idle, within SQL_POOL_MIN_SIZE..SQL_POOL_MAX_SIZE, and records
+             each decision for /health/pool.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any
+from sqlalchemy.engine import Engine
+from sqlalchemy.util import queue as sqla_queue
+from backend.db.pool_metrics import InstrumentedQueuePool
+
+logger = logging.getLogger(__name__)
+
+DECISION_HISTORY = 50
+SHRINK_AFTER_WINDOWS = 3  # consecutive quiet windows before giving a connection back
+
+
+class AdaptiveQueuePool(InstrumentedQueuePool):
+    """InstrumentedQueuePool whose steady-state size can change at runtime."""
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self._idle_low = self._pool.maxsize
+
+    def resize(self, size: int):
+        """
+        Set the number of connections kept open. Capacity stays size +
+        max_overflow: QueuePool counts open connections as maxsize + _overflow,
+        so _overflow moves by the opposite amount.
+        """
+        with self._overflow_lock:
+            delta = size - self._pool.maxsize
+            self._pool.maxsize = size
+            self._overflow -= delta
+        self._close_excess_idle()
+
+    def _close_excess_idle(self):
+        while self._pool.qsize() > self._pool.maxsize:
+            try:
+                record = self._pool.get(False)
+            except sqla_queue.Empty:
+                break
+            try:
+                record.close()
+            finally:
+                self._dec_overflow()
+
+    def _do_get(self):
+        record = super()._do_get()
+        # Fewest idle connections seen since the controller last looked
+        self._idle_low = min(self._idle_low, self._pool.qsize())
+        return record
+
+    def _do_return_conn(self, record):
+        # Queue only refuses puts at exactly maxsize, so check for a shrunk pool here
+        if self._pool.qsize() >= self._pool.maxsize:
+            try:
+                record.close()
+            finally:
+                self._dec_overflow()
+            return
+        super()._do_return_conn(record)
+
+    def take_idle_low(self) -> int:
+        idle_low = min(self._idle_low, self._pool.qsize())
+        self._idle_low = self._pool.qsize()
+        return idle_low
+
+
+class AdaptivePoolController:
+    """Resizes an engine's AdaptiveQueuePool every `interval` seconds."""
+
+    def __init__(self, engine: Engine, min_size: int, max_size: int, interval: float, target_wait_ms: float):
+        self.engine = engine
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.interval = interval
+        self.target_wait_ms = target_wait_ms
+
+        self._lock = threading.Lock()
+        self._seen_waits = 0
+        self._seen_timeouts = 0
+        self._quiet_windows = 0
+        self.decisions: deque[dict[str, Any]] = deque(maxlen=DECISION_HISTORY)
+        self.counters = {"grows": 0, "shrinks": 0, "holds": 0}
+        self.last_window: dict[str, Any] | None = None
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="sql-pool-adapt", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.adjust()
+            except Exception:
+                logger.exception("Adaptive pool adjustment failed")
+
+    def _window(self, pool: AdaptiveQueuePool) -> dict[str, Any]:
+        # Checkout waits and timeouts observed since the previous window, plus
+        # the checkouts still waiting right now
+        metrics = pool.metrics
+        waiting = metrics.waiting_ms()
+        with metrics._lock:
+            histogram = metrics.checkout_wait
+            new_waits = histogram.count - self._seen_waits
+            recent = list(histogram.recent)[-new_waits:] if new_waits > 0 else []
+            timeouts = metrics.counters["checkout_timeouts"] - self._seen_timeouts
+            self._seen_waits = histogram.count
+            self._seen_timeouts = metrics.counters["checkout_timeouts"]
+
+        recent = sorted(recent + waiting)
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else None
+        return {
+            "checkouts": max(new_waits, 0),
+            "waiting": len(waiting),
+            "p95_wait_ms": round(p95, 3) if p95 is not None else None,
+            "timeouts": timeouts,
+            "min_idle": pool.take_idle_low(),
+        }
+
+    def adjust(self) -> dict[str, Any]:
+        """Run one control step and return the decision."""
+        with self._lock:
+            pool = self.engine.pool
+            size = pool.size()
+            window = self._window(pool)
+            step = max(1, size // 4)
+
+            slow = window["timeouts"] > 0 or (
+                window["p95_wait_ms"] is not None and window["p95_wait_ms"] > self.target_wait_ms
+            )
+            quiet = window["min_idle"] >= 1 and (
+                window["p95_wait_ms"] is None or window["p95_wait_ms"] <= self.target_wait_ms / 10
+            )
+            self._quiet_windows = self._quiet_windows + 1 if quiet and not slow else 0
+
+            if slow and size < self.max_size:
+                action, new_size = "grow", min(self.max_size, size + step)
+                reason = "checkout timeouts" if window["timeouts"] else "p95 checkout wait above target"
+            elif self._quiet_windows >= SHRINK_AFTER_WINDOWS and size > self.min_size:
+                # Give back at most the connections that stayed idle all window
+                action, new_size = "shrink", max(self.min_size, size - min(step, window["min_idle"]))
+                reason = "connections idle with fast checkouts"
+                self._quiet_windows = 0
+            else:
+                action, new_size, reason = "hold", size, None
+
+            if new_size != size:
+                pool.resize(new_size)
+            self.counters[f"{action}s"] += 1
+
+            decision = {"at": time.time(), "action": action, "from": size, "to": new_size, **window}
+            if reason is not None:
+                decision["reason"] = reason
+                self.decisions.append(decision)
+            self.last_window = decision
+            return decision
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "interval_seconds": self.interval,
+                "target_wait_ms": self.target_wait_ms,
+                "counters": dict(self.counters),
+                "last_window": self.last_window,
+                # Only grow/shrink decisions are kept
+                "decisions": list(self.decisions),
+            }
@@ -0,0 +1,270 @@
+"""
+File: dialects.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: SQL dialects for the local stand-in database. The routes are
+             written in T-SQL for Azure SQL; each dialect here says how the
+             stand-in's tables are declared, how the few T-SQL constructs the
+             API uses are rewritten, and how rows come back with the types
+             pyodbc would return.
+"""
+
+import re
+import sqlite3
+from datetime import date, datetime, time as dtime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from backend.db import schema
+
+# Result column names like MAX(CreatedDate) take the type of the column inside
+_AGGREGATE_NAME = re.compile(r"^(?:MAX|MIN|SUM)\((?:\w+\.)?(\w+)\)$", re.IGNORECASE)
+
+# Services.ServiceCost holds per-request prices (0.0000002); other decimals are money or units
+DECIMAL_SCALES = {"ServiceCost": 7}
+
+
+# T-SQL #temp tables, and the plain column types they are declared with
+_TEMP_TABLE = re.compile(r"\bCREATE TABLE #(\w+)\s*\((.*)\)", re.DOTALL)
+_TEMP_NAME = re.compile(r"(?<![\w'])#(\w+)")
+_TYPE_NAME = re.compile(r"\b(tinyint|int|bit|date|time|datetime)\b")
+
+
+class StandinDialect:
+    """A local database standing in for Azure SQL."""
+
+    name = ""
+    suffix = ""
+    # schema.md type -> column type
+    column_types: dict[str, str] = {}
+    # (pattern, replacement) pairs applied in order to every statement
+    rewrites: tuple[tuple[re.Pattern, str], ...] = ()
+
+    def __init__(self):
+        self.translate = lru_cache(maxsize=512)(self._translate)
+
+    def _translate(self, statement: str) -> str:
+        for pattern, replacement in self.rewrites:
+            statement = pattern.sub(replacement, statement)
+        # #temp tables become the connection's TEMP tables, with this dialect's
+        # column types (on SQLite a "date" key column would not match TEXT dates)
+        statement = _TEMP_TABLE.sub(self._temp_table, statement)
+        return _TEMP_NAME.sub(r"\1", statement)
+
+    def _temp_table(self, match: re.Match) -> str:
+        columns = _TYPE_NAME.sub(lambda kind: self.column_types[kind.group(1)], match.group(2))
+        return f"CREATE TEMP TABLE {match.group(1)} ({columns})"
+
+    def url(self, path: str) -> str:
+        raise NotImplementedError
+
+    def connect(self, path: str):
+        """Plain DB-API connection, for creating and seeding the file."""
+        raise NotImplementedError
+
+    def connect_args(self) -> dict[str, Any]:
+        return {}
+
+    def install(self, engine: Engine):
+        """Per-connection setup for an engine of this dialect."""
+
+    def column_type(self, column: str, kind: str) -> str:
+        return self.column_types[kind]
+
+    def identity_column(self, table: str, column: str) -> tuple[list[str], str]:
+        """Statements to run first and the column definition for an IDENTITY key."""
+        raise NotImplementedError
+
+    def insert_rows(self, connection, table: str, columns: list[str], rows: Iterable[tuple]):
+        placeholders = ", ".join("?" for _ in columns)
+        connection.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows)
+
+    def insert_arrow(self, connection, table: str, batch):
+        """Insert a pyarrow Table whose column names are the table's."""
+        values = [self.column_values(column) for column in batch.columns]
+        self.insert_rows(connection, table, batch.column_names, zip(*values))
+
+    def column_values(self, column) -> list:
+        return column.to_pylist()
+
+
+def _decimal(value):
+    if isinstance(value, float):
+        # SUM() over NUMERIC columns comes back as a float
+        return Decimal(str(round(value, 10)))
+    return Decimal(str(value))
+
+
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "decimal": _decimal,
+    "date": date.fromisoformat,
+    "time": dtime.fromisoformat,
+    "datetime": datetime.fromisoformat,
+    "bit": bool,
+}
+
+
+class SQLiteDialect(StandinDialect):
+    """
+    SQLite only stores text and numbers, so rows are typed on the way out
+    from the schema's column types, matched by result column name.
+    """
+
+    name = "sqlite"
+    suffix = ".db"
+    column_types = {
+        "int": "INTEGER",
+        "tinyint": "INTEGER",
+        "bit": "INTEGER",
+        "decimal": "NUMERIC",
+        "varchar": "TEXT",
+        "date": "TEXT",
+        "time": "TEXT",
+        "datetime": "TEXT",
+    }
+    rewrites = (
+        # Keeps the parameter order: LIMIT <offset>, <count>
+        (re.compile(r"OFFSET\s+(\S+)\s+ROWS\s+FETCH\s+NEXT\s+(\S+)\s+ROWS\s+ONLY", re.IGNORECASE), r"LIMIT \1, \2"),
+        (re.compile(r"DATEFROMPARTS\(YEAR\(([\w.]+)\),\s*MONTH\(\1\),\s*1\)"), r"date(\1, 'start of month')"),
+        (re.compile(r"DATEPART\(hour,\s*([\w.]+)\)", re.IGNORECASE), r"CAST(strftime('%H', \1) AS INTEGER)"),
+        (re.compile(r"\bYEAR\(([\w.]+)\)"), r"CAST(strftime('%Y', \1) AS INTEGER)"),
+        (re.compile(r"\bMONTH\(([\w.]+)\)"), r"CAST(strftime('%m', \1) AS INTEGER)"),
+        (re.compile(r"\bEOMONTH\(([\w.]+)\)"), r"date(\1, 'start of month', '+1 month', '-1 day')"),
+        # A #temp table holds a few keys, but without statistics SQLite would
+        # scan the other table and probe it; CROSS JOIN keeps it outermost
+        (re.compile(r"(FROM #\w+ \w+\s+)INNER JOIN\b"), r"\1CROSS JOIN"),
+    )
+
+    def __init__(self):
+        super().__init__()
+        self._row_converters = lru_cache(maxsize=512)(self._converters)
+
+    def url(self, path: str) -> str:
+        return f"sqlite:///{path}"
+
+    def connect(self, path: str):
+        _register_sqlite_adapters()
+        return sqlite3.connect(path)
+
+    def connect_args(self) -> dict[str, Any]:
+        _register_sqlite_adapters()
+        # Pooled connections move between threads
+        return {"check_same_thread": False}
+
+    def install(self, engine: Engine):
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            dbapi_connection.row_factory = self._row_factory
+
+    def identity_column(self, table: str, column: str) -> tuple[list[str], str]:
+        # INTEGER PRIMARY KEY doubles as IDENTITY
+        return [], f"{column} INTEGER PRIMARY KEY"
+
+    def column_values(self, column) -> list:
+        # Bind what the adapters below would store, without building a
+        # Decimal or datetime per value
+        import pyarrow as pa
+        if pa.types.is_decimal(column.type):
+            column = column.cast(pa.float64())
+        elif pa.types.is_temporal(column.type):
+            column = column.cast(pa.string())
+        return column.to_pylist()
+
+    def _converters(self, names: tuple[str, ...]) -> tuple[Callable[[Any], Any] | None, ...]:
+        types = schema.column_types()
+        converters = []
+        for name in names:
+            match = _AGGREGATE_NAME.match(name)
+            if match:
+                name = match.group(1)
+            converters.append(_CONVERTERS.get(types.get(name, "")))
+        return tuple(converters)
+
+    def _row_factory(self, cursor: sqlite3.Cursor, row: tuple) -> tuple:
+        # Give rows the driver types pyodbc would
+        converters = self._row_converters(tuple(column[0] for column in cursor.description))
+        return tuple(
+            value if value is None or convert is None else convert(value)
+            for value, convert in zip(row, converters)
+        )
+
+
+def _register_sqlite_adapters():
+    sqlite3.register_adapter(Decimal, str)
+    sqlite3.register_adapter(date, date.isoformat)
+    sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+    sqlite3.register_adapter(dtime, dtime.isoformat)
+
+
+class DuckDBDialect(StandinDialect):
+    """
+    DuckDB has real DECIMAL, DATE, TIME and TIMESTAMP columns and runs the
+    analytics' scans and GROUP BYs column-wise. One process at a time can
+    open the file for writing, so use a single server worker.
+    """
+
+    name = "duckdb"
+    suffix = ".duckdb"
+    column_types = {
+        "int": "INTEGER",
+        "tinyint": "TINYINT",
+        "bit": "BOOLEAN",
+        "decimal": "DECIMAL(18, 2)",
+        "varchar": "VARCHAR",
+        "date": "DATE",
+        "time": "TIME",
+        "datetime": "TIMESTAMP",
+    }
+    rewrites = (
+        # DuckDB takes OFFSET before LIMIT, so the parameters keep their order
+        (re.compile(r"OFFSET\s+(\S+)\s+ROWS\s+FETCH\s+NEXT\s+(\S+)\s+ROWS\s+ONLY", re.IGNORECASE), r"OFFSET \1 LIMIT \2"),
+        (re.compile(r"DATEFROMPARTS\(YEAR\(([\w.]+)\),\s*MONTH\(\1\),\s*1\)"), r"make_date(year(\1), month(\1), 1)"),
+        (re.compile(r"DATEPART\(hour,\s*([\w.]+)\)", re.IGNORECASE), r"hour(\1)"),
+        (re.compile(r"\bEOMONTH\(([\w.]+)\)"), r"last_day(\1)"),
+    )
+
+    def url(self, path: str) -> str:
+        return f"duckdb:///{path}"
+
+    def connect(self, path: str):
+        import duckdb
+        return duckdb.connect(path)
+
+    def column_type(self, column: str, kind: str) -> str:
+        if kind == "decimal" and column in DECIMAL_SCALES:
+            return f"DECIMAL(18, {DECIMAL_SCALES[column]})"
+        return super().column_type(column, kind)
+
+    def identity_column(self, table: str, column: str) -> tuple[list[str], str]:
+        sequence = f"{table}_{column}"
+        return (
+            [f"CREATE SEQUENCE IF NOT EXISTS {sequence}"],
+            f"{column} INTEGER PRIMARY KEY DEFAULT nextval('{sequence}')",
+        )
+
+    def insert_rows(self, connection, table: str, columns: list[str], rows: Iterable[tuple]):
+        # executemany binds row by row; loading an Arrow table is a single scan
+        import pyarrow as pa
+        rows = list(rows)
+        if not rows:
+            return
+        self.insert_arrow(connection, table, pa.table({name: list(values) for name, values in zip(columns, zip(*rows))}))
+
+    def insert_arrow(self, connection, table: str, batch):
+        connection.register("_standin_rows", batch)
+        try:
+            connection.execute(f"INSERT INTO {table} ({', '.join(batch.column_names)}) SELECT * FROM _standin_rows")
+        finally:
+            connection.unregister("_standin_rows")
+
+
+DIALECTS: dict[str, StandinDialect] = {dialect.name: dialect for dialect in (SQLiteDialect(), DuckDBDialect())}
+
+
+def get_dialect(name: str) -> StandinDialect:
+    if name not in DIALECTS:
+        raise ValueError(f"Unknown stand-in dialect: {name}")
+    return DIALECTS[name]
@@ -4,24 +4,42 @@ Project: Cloud Cost Intelligence Platform
 Author: Tony (Database Lead), Sean Kellner (Backend Lead)
 Created: January 2026
 Description: SQLAlchemy engine configuration. Handles Azure SQL connection
-             with Microsoft Entra authentication and device code flow.
+             with Microsoft Entra authentication and device code flow, for
+             the primary database and an optional read-only replica.
 """
 
 import os
 import sys
-import struct
+import threading
+from typing import Any
 from azure.identity import (
     DefaultAzureCredential,
     DeviceCodeCredential,
     InteractiveBrowserCredential,
 )
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
-from sqlalchemy.pool import QueuePool
 import time
+from backend.db.adaptive_pool import AdaptivePoolController, AdaptiveQueuePool
+from backend.db.pool_metrics import InstrumentedQueuePool
+from backend.db.replica import replica_health
+from backend.db import standin
+from backend.db.dialects import get_dialect
+from backend.db.statements import install_statement_stats, statement_metrics
+from backend.db.tokens import AccessTokenProvider
+from backend.db.validation import install_idle_ping
 
 SQL_COPT_SS_ACCESS_TOKEN = 1256  # ODBC access token attribute
 
+PRIMARY = "primary"
+REPLICA = "replica"
+
+# build_engine settings and built engines, by role
+_engine_settings: dict[str, dict[str, Any]] = {}
+_engines: dict[str, Engine] = {}
+_engine_lock = threading.Lock()
+_pool_controller: AdaptivePoolController | None = None
+_token_provider: AccessTokenProvider | None = None
 
 
 def _get_credential():
@@ -40,21 +58,67 @@ def _get_credential():
     raise ValueError(f"Unknown AZURE_IDENTITY_MODE: {azure_identity_mode}")
 
 
-def _get_access_token() -> str:
-    credential = _get_credential()
-    token = credential.get_token("https://database.windows.net/.default")
-    return token.token
-
-
-def _odbc_access_token(token: str) -> bytes:
-    token_bytes = token.encode("utf-16-le")
-    return struct.pack(f"<I{len(token_bytes)}s", len(token_bytes), token_bytes)
-
-
-def build_engine(server: str, database: str, pool_size: int, max_overflow: int, pool_recycle: int) -> Engine:
+def _require_database(server: str, database: str):
     if not server or not database:
         raise ValueError("AZURE_SQL_SERVER and AZURE_SQL_DATABASE must be set")
 
+
+def _pooled_engine(
+    url: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_recycle: int,
+    ping_idle: float,
+    adaptive: dict[str, Any] | None,
+    **kw: Any,
+) -> Engine:
+    global _pool_controller
+    if adaptive is not None:
+        pool_size = min(max(pool_size, adaptive["min_size"]), adaptive["max_size"])
+
+    engine = create_engine(
+        url,
+        poolclass=AdaptiveQueuePool if adaptive is not None else InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        future=True,
+        **kw,
+    )
+    install_idle_ping(engine, ping_idle)
+    if statement_metrics.enabled:
+        install_statement_stats(engine)
+
+    if adaptive is not None:
+        _pool_controller = AdaptivePoolController(engine, **adaptive)
+        _pool_controller.start()
+    return engine
+
+
+def build_engine(
+    server: str,
+    database: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_recycle: int,
+    ping_idle: float = 30,
+    adaptive: dict[str, Any] | None = None,
+    read_only: bool = False,
+) -> Engine:
+    """
+    read_only connects with ApplicationIntent=ReadOnly, which Azure SQL
+    routes to a readable secondary replica.
+
+    Pooled connections are pinged on checkout only after ping_idle seconds
+    unused (see validation.py) rather than on every checkout.
+
+    adaptive, when given, holds min_size, max_size, interval and
+    target_wait_ms for an AdaptivePoolController that resizes the pool
+    (starting from pool_size) at runtime.
+    """
+    global _token_provider
+    _require_database(server, database)
+
     driver = "ODBC Driver 18 for SQL Server"
     odbc_connect = (
         f"Driver={{{driver}}};"
@@ -64,20 +128,110 @@ def build_engine(server: str, database: str, pool_size: int, max_overflow: int,
         "TrustServerCertificate=no;"
         "Connection Timeout=60;"
     )
+    if read_only:
+        odbc_connect += "ApplicationIntent=ReadOnly;"
+
+    engine = _pooled_engine(
+        "mssql+pyodbc:///?odbc_connect=" + odbc_connect,
+        pool_size, max_overflow, pool_recycle, ping_idle, adaptive,
+    )
 
-    connect_args = {
-        "attrs_before": {
-            SQL_COPT_SS_ACCESS_TOKEN: _odbc_access_token(_get_access_token())
+    # Every new pooled connection logs in with the current cached token, so
+    # connections opened after the first token expires keep working. The
+    # primary and the replica share one token.
+    if _token_provider is None:
+        _token_provider = AccessTokenProvider(_get_credential)
+    token_provider = _token_provider
+
+    @event.listens_for(engine, "do_connect")
+    def _inject_access_token(dialect, conn_rec, cargs, cparams):
+        cparams["attrs_before"] = {
+            **cparams.get("attrs_before", {}),
+            SQL_COPT_SS_ACCESS_TOKEN: token_provider.packed_token(),
         }
-    }
 
-    return create_engine(
-        "mssql+pyodbc:///?odbc_connect=" + odbc_connect,
-        connect_args=connect_args,
-        poolclass=QueuePool,
-        pool_size=pool_size,
-        max_overflow=max_overflow,
-        pool_recycle=pool_recycle,
-        pool_pre_ping=True,
-        future=True,
+    return engine
+
+
+def build_standin_engine(
+    path: str,
+    backend: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_recycle: int,
+    ping_idle: float = 30,
+    adaptive: dict[str, Any] | None = None,
+    latency_ms: float = 0,
+) -> Engine:
+    """
+    Engine for the local stand-in database (see standin.py), with the same
+    instrumented pool as Azure. backend names the dialect ("sqlite" or
+    "duckdb"); latency_ms is added to every statement to mimic the network
+    round trip.
+    """
+    dialect = get_dialect(backend)
+    engine = _pooled_engine(
+        dialect.url(path),
+        pool_size, max_overflow, pool_recycle, ping_idle, adaptive,
+        connect_args=dialect.connect_args(),
     )
+    standin.install(engine, dialect, latency_ms)
+    return engine
+
+
+def init_engine(role: str = PRIMARY, **settings: Any):
+    """
+    Record the build_engine settings for role (PRIMARY or REPLICA), or the
+    build_standin_engine settings when they include a path. The engine (and
+    with it the first Entra token) is only created by get_engine(), so app
+    start never waits on credentials or the network.
+    """
+    if "path" not in settings:
+        _require_database(settings.get("server"), settings.get("database"))
+    with _engine_lock:
+        _engine_settings[role] = settings
+        _engines.pop(role, None)
+
+
+def get_engine(role: str = PRIMARY) -> Engine:
+    engine = _engines.get(role)
+    if engine is not None:
+        return engine
+    with _engine_lock:
+        if role not in _engines:
+            if role not in _engine_settings:
+                raise RuntimeError(f"DB engine not initialized: {role}")
+            settings = _engine_settings[role]
+            engine = build_standin_engine(**settings) if "path" in settings else build_engine(**settings)
+            if role == REPLICA:
+                replica_health.watch(engine)
+            _engines[role] = engine
+        return _engines[role]
+
+
+def engine_configured(role: str = PRIMARY) -> bool:
+    return role in _engine_settings
+
+
+def engine_created(role: str = PRIMARY) -> bool:
+    return role in _engines
+
+
+def get_pool_controller() -> AdaptivePoolController | None:
+    return _pool_controller
+
+
+def _after_fork():
+    # Pooled sockets (and the adaptive pool's thread) belong to the parent,
+    # e.g. a gunicorn master with preload_app. Drop them without closing
+    # the parent's connections; this process builds its own engines on
+    # first use. The token provider handles fork itself.
+    global _engine_lock, _pool_controller
+    _engine_lock = threading.Lock()
+    for engine in _engines.values():
+        engine.dispose(close=False)
+    _engines.clear()
+    _pool_controller = None
+
+
+os.register_at_fork(after_in_child=_after_fork)
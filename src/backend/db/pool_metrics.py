@@ -0,0 +1,215 @@
+"""
+File: pool_metrics.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Connection pool telemetry. Counts pool events (connect,
+             checkout, checkin, invalidate, close) and records checkout wait
+             and connect time histograms plus connection ages, so
+             SQL_POOL_SIZE / SQL_MAX_OVERFLOW can be sized from data.
+"""
+
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds in milliseconds (the last bucket is everything slower)
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+RECENT_SAMPLES = 1000
+
+
+class LatencyHistogram:
+    """Bucketed latencies plus the most recent samples for percentiles."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS, recent: int = RECENT_SAMPLES):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent: deque[float] = deque(maxlen=recent)
+
+    def observe(self, seconds: float):
+        ms = seconds * 1000
+        index = next((i for i, bound in enumerate(self.buckets_ms) if ms <= bound), len(self.buckets_ms))
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.recent.append(ms)
+
+    def percentile(self, p: float) -> float | None:
+        """p-th percentile (0-100) of the recent samples, in milliseconds."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    def snapshot(self) -> dict[str, Any]:
+        # Ordered list (JSON objects get their keys sorted); le_ms null is the overflow bucket
+        buckets = [{"le_ms": bound, "count": count} for bound, count in zip(self.buckets_ms, self.counts)]
+        buckets.append({"le_ms": None, "count": self.counts[-1]})
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": _round(self.percentile(50)),
+            "p95_ms": _round(self.percentile(95)),
+            "p99_ms": _round(self.percentile(99)),
+            "buckets": buckets,
+        }
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
+
+
+class PoolMetrics:
+    """Counters and histograms for one engine's pool; updated from pool events."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {
+            "connects": 0,
+            "checkouts": 0,
+            "checkins": 0,
+            "invalidations": 0,
+            "soft_invalidations": 0,
+            "closes": 0,
+            "checkout_timeouts": 0,
+            "idle_pings": 0,
+            "ping_disconnects": 0,
+            "disconnect_retries": 0,
+        }
+        self.checkout_wait = LatencyHistogram()
+        self.connect_time = LatencyHistogram()
+        self._records: weakref.WeakSet = weakref.WeakSet()
+        # Checkouts still waiting, by token -> start time; a starved waiter
+        # only shows up in the histogram once it finally gets a connection
+        self._waiting: dict[object, float] = {}
+
+    def begin_wait(self) -> object:
+        token = object()
+        with self._lock:
+            self._waiting[token] = time.perf_counter()
+        return token
+
+    def end_wait(self, token: object):
+        with self._lock:
+            started = self._waiting.pop(token)
+            self.checkout_wait.observe(time.perf_counter() - started)
+
+    def waiting_ms(self) -> list[float]:
+        """Age of every checkout still waiting, in milliseconds."""
+        now = time.perf_counter()
+        with self._lock:
+            return [(now - started) * 1000 for started in self._waiting.values()]
+
+    def count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def observe_connect(self, seconds: float):
+        with self._lock:
+            self.connect_time.observe(seconds)
+
+    def track(self, record):
+        with self._lock:
+            self._records.add(record)
+
+    def snapshot(self, pool: QueuePool) -> dict[str, Any]:
+        now = time.time()
+        waiting = self.waiting_ms()
+        with self._lock:
+            ages = sorted(
+                now - record.starttime
+                for record in list(self._records)
+                if record.dbapi_connection is not None
+            )
+            recycle = pool._recycle
+            return {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "max_overflow": pool._max_overflow,
+                "counters": dict(self.counters),
+                "waiting": len(waiting),
+                "oldest_wait_ms": round(max(waiting), 3) if waiting else None,
+                "checkout_wait": self.checkout_wait.snapshot(),
+                "connect_time": self.connect_time.snapshot(),
+                "connection_age": {
+                    "open": len(ages),
+                    "min_seconds": round(ages[0], 1) if ages else None,
+                    "max_seconds": round(ages[-1], 1) if ages else None,
+                    "recycle_seconds": recycle if recycle > -1 else None,
+                    # Connections that will be replaced on their next checkout
+                    "past_recycle": sum(1 for age in ages if recycle > -1 and age > recycle),
+                },
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times checkouts and new connections into .metrics."""
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self.metrics = PoolMetrics()
+        # recreate() passes the old pool's listeners along with _dispatch
+        if "_dispatch" not in kw:
+            _listen(self.metrics, self)
+
+    def _do_get(self):
+        # Covers waiting for a free connection and opening an overflow one
+        token = self.metrics.begin_wait()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.count("checkout_timeouts")
+            raise
+        finally:
+            self.metrics.end_wait(token)
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        record = super()._create_connection()
+        self.metrics.observe_connect(time.perf_counter() - started)
+        return record
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep the running totals
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def _listen(metrics: PoolMetrics, pool: QueuePool):
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.count("connects")
+        metrics.track(connection_record)
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.count("checkouts")
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.count("checkins")
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.count("invalidations")
+
+    @event.listens_for(pool, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_connection, connection_record, exception):
+        metrics.count("soft_invalidations")
+
+    @event.listens_for(pool, "close")
+    def _on_close(dbapi_connection, connection_record):
+        metrics.count("closes")
@@ -0,0 +1,56 @@
+"""
+File: query.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: SQL predicate composer. Builds WHERE clauses from only the
+             filters a request actually supplied, so each filter shape gets
+             its own stable SQL text (and its own cached plan that can seek
+             on an index) instead of one catch-all "(:p IS NULL OR ...)" plan.
+"""
+
+from datetime import date
+from typing import Any
+
+class Predicates:
+    """Collects AND-ed predicates and their bind parameters."""
+
+    def __init__(self):
+        self._clauses: list[str] = []
+        self.params: dict[str, Any] = {}
+
+    def add(self, clause: str, **params: Any) -> "Predicates":
+        self._clauses.append(clause)
+        self.params.update(params)
+        return self
+
+    def eq(self, column: str, name: str, value: Any) -> "Predicates":
+        if value is not None:
+            self.add(f"{column} = :{name}", **{name: value})
+        return self
+
+    def gte(self, column: str, name: str, value: Any) -> "Predicates":
+        if value is not None:
+            self.add(f"{column} >= :{name}", **{name: value})
+        return self
+
+    def lte(self, column: str, name: str, value: Any) -> "Predicates":
+        if value is not None:
+            self.add(f"{column} <= :{name}", **{name: value})
+        return self
+
+    def seek_before(self, date_column: str, id_column: str, cursor: tuple[date, int] | None) -> "Predicates":
+        # Keyset predicate for lists ordered "date DESC, id DESC". The leading
+        # "date <= :cursor_date" gives the optimizer a range to seek on.
+        if cursor is not None:
+            self.add(
+                f"{date_column} <= :cursor_date AND ({date_column} < :cursor_date OR {id_column} < :cursor_id)",
+                cursor_date=cursor[0],
+                cursor_id=cursor[1],
+            )
+        return self
+
+    def sql(self) -> str:
+        if not self._clauses:
+            return ""
+        return "WHERE " + "\n              AND ".join(self._clauses)
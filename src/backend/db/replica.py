@@ -0,0 +1,83 @@
+"""
+File: replica.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Read replica health. A failed connection to the read-only
+             replica marks it down for SQL_READ_RETRY_SECONDS; while it is
+             down, read sessions are routed to the primary instead.
+"""
+
+import logging
+import threading
+import time
+from typing import Any
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+RETRY_SECONDS = 30
+
+
+class ReplicaHealth:
+    """Whether reads should go to the replica: up, down or disabled."""
+
+    def __init__(self, retry_seconds: float = RETRY_SECONDS):
+        self._lock = threading.Lock()
+        self.retry_seconds = retry_seconds
+        self.enabled = False
+        self.down_until = 0.0
+        self.failures = 0
+        self.fallbacks = 0
+        self.last_error: str | None = None
+
+    def configure(self, enabled: bool, retry_seconds: float = RETRY_SECONDS):
+        with self._lock:
+            self.enabled = enabled
+            self.retry_seconds = retry_seconds
+            self.down_until = 0.0
+
+    def available(self) -> bool:
+        # Once down_until passes, the next read tries the replica again
+        return self.enabled and time.monotonic() >= self.down_until
+
+    def mark_down(self, error: BaseException):
+        with self._lock:
+            self.failures += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+            self.down_until = time.monotonic() + self.retry_seconds
+        logger.warning("Read replica unavailable, reading from the primary for %ss: %s", self.retry_seconds, error)
+
+    def count_fallback(self):
+        with self._lock:
+            self.fallbacks += 1
+
+    def watch(self, engine: Engine):
+        @event.listens_for(engine, "handle_error")
+        def _on_error(context):
+            # No connection means the error came from connecting (unreachable,
+            # login refused, replica not readable); statement errors don't count
+            if context.connection is None:
+                self.mark_down(context.original_exception)
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            if not self.enabled:
+                state = "disabled"
+            elif time.monotonic() < self.down_until:
+                state = "down"
+            else:
+                state = "up"
+            status = {
+                "state": state,
+                "failures": self.failures,
+                "fallbacks": self.fallbacks,
+                "retry_in_seconds": max(0.0, round(self.down_until - time.monotonic(), 1)) if state == "down" else None,
+            }
+            if self.last_error is not None:
+                status["last_error"] = self.last_error
+            return status
+
+
+replica_health = ReplicaHealth()
@@ -0,0 +1,100 @@
+"""
+File: schema.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: The database schema as documented in database/schema.md, with
+             the keys and indexes from the SQL scripts, turned into CREATE
+             statements for a local stand-in dialect (see dialects.py).
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+SCHEMA_PATH = Path(__file__).resolve().parents[2] / "database" / "schema.md"
+
+# Primary keys not implied by a <Table>ID first column (see create_rollups.sql)
+PRIMARY_KEYS = {
+    "UsageRollupHourly": ("ClientID", "ServiceID", "BucketDate", "BucketHour"),
+    "UsageRollupDaily": ("ClientID", "ServiceID", "BucketDate"),
+    "UsageRollupMonthly": ("ClientID", "ServiceID", "BucketDate"),
+    "RollupWatermarks": ("RollupName",),
+}
+
+# Keys the database assigns (IDENTITY)
+IDENTITY_KEYS = {"Invoices": "InvoiceID"}
+
+# The API's key indexes (create_indexes.sql, create_rollups.sql)
+INDEXES = (
+    ("IX_Usages_UsageDate_UsageID", "Usages", "UsageDate DESC, UsageID DESC"),
+    ("IX_Usages_ClientID_UsageDate_UsageID", "Usages", "ClientID, UsageDate DESC, UsageID DESC"),
+    ("IX_Usages_ServiceID_UsageDate_UsageID", "Usages", "ServiceID, UsageDate DESC, UsageID DESC"),
+    ("IX_Usages_CreatedDate", "Usages", "CreatedDate"),
+    ("IX_Invoices_InvoiceDate_InvoiceID", "Invoices", "InvoiceDate DESC, InvoiceID DESC"),
+    ("IX_Invoices_ClientID_InvoiceDate_InvoiceID", "Invoices", "ClientID, InvoiceDate DESC, InvoiceID DESC"),
+    ("IX_UsageRollupDaily_BucketDate", "UsageRollupDaily", "BucketDate"),
+)
+
+
+@lru_cache(maxsize=1)
+def load_schema(path: Path = SCHEMA_PATH) -> dict[str, list[tuple[str, str]]]:
+    """Parse schema.md into {table: [(column, type), ...]}."""
+    tables: dict[str, list[tuple[str, str]]] = {}
+    table = None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line.startswith("## "):
+            table = line[3:].strip()
+            tables[table] = []
+        elif table and line.startswith("|") and not line.startswith("|--"):
+            cells = [cell.strip() for cell in line.strip("|").split("|")]
+            if cells[0] != "Column":
+                tables[table].append((cells[0], cells[1].lower()))
+    return tables
+
+
+@lru_cache(maxsize=1)
+def column_types() -> dict[str, str]:
+    # Column names mean the same thing in every table, so one map covers all
+    return {name: kind for columns in load_schema().values() for name, kind in columns}
+
+
+def primary_key(table: str, columns: list[tuple[str, str]]) -> tuple[str, ...]:
+    if table in PRIMARY_KEYS:
+        return PRIMARY_KEYS[table]
+    # Budgets.BudgetID, Usages.UsageID, ...
+    first = columns[0][0]
+    return (first,) if first == table.rstrip("s") + "ID" else ()
+
+
+def create_schema_sql(dialect: Any, tables: Iterable[str] | None = None, keyed: bool = True) -> list[str]:
+    """
+    CREATE TABLE/INDEX IF NOT EXISTS statements for a StandinDialect. tables
+    limits them to those tables; keyed=False leaves out keys, identities and
+    indexes, for a copy that is bulk loaded and only scanned.
+    """
+    schema = load_schema()
+    tables = list(schema) if tables is None else list(tables)
+    statements = []
+    for table in tables:
+        columns = schema[table]
+        key = primary_key(table, columns) if keyed else ()
+        lines = []
+        for name, kind in columns:
+            if keyed and name == IDENTITY_KEYS.get(table):
+                setup, line = dialect.identity_column(table, name)
+                statements.extend(setup)
+                lines.append(line)
+            elif key == (name,):
+                lines.append(f"{name} {dialect.column_type(name, kind)} PRIMARY KEY")
+            else:
+                lines.append(f"{name} {dialect.column_type(name, kind)} NOT NULL")
+        if len(key) > 1:
+            lines.append(f"PRIMARY KEY ({', '.join(key)})")
+        statements.append(f"CREATE TABLE IF NOT EXISTS {table} (\n    " + ",\n    ".join(lines) + "\n)")
+    for name, table, columns in INDEXES if keyed else ():
+        if table not in tables:
+            continue
+        statements.append(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+    return statements
@@ -3,29 +3,136 @@ File: session.py
 Project: Cloud Cost Intelligence Platform
 Author: Sean Kellner (Backend Lead)
 Created: January 2026
-Description: Database session management. Provides scoped session factory
-             for SQLAlchemy database operations.
+Description: Database session management. Provides scoped session factories
+             for SQLAlchemy database operations and routes read-only requests
+             to the read replica when one is configured, and the analytics
+             scans to the DuckDB snapshot when it is enabled.
 """
 
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from flask import Response, g, has_app_context, has_request_context, request
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from backend.db.engine import PRIMARY, REPLICA, engine_configured, get_engine
+from backend.db.replica import replica_health
+from backend.db.snapshot import SNAPSHOT, analytics_snapshot
+
+READ_METHODS = ("GET", "HEAD")
 
 SessionLocal = None
+ReadSessionLocal = None
+AnalyticsSessionLocal = None
+
+
+class RetryingSession(Session):
+    """
+    Session that retries a statement once when its connection turns out to
+    be dead, or when the replica it was routed to could not be reached (the
+    retry then goes to the primary). Only the first statement of a
+    transaction is retried: nothing has run on the lost connection yet, so
+    running it again on a new one is safe. Later failures are raised as usual.
+    """
+
+    def execute(self, statement, params=None, **kw):
+        fresh = not self.in_transaction()
+        try:
+            return super().execute(statement, params, **kw)
+        except DBAPIError as exc:
+            fallback = self.info.get("role") == REPLICA and not replica_health.available()
+            if not (fresh and (exc.connection_invalidated or fallback)):
+                raise
+            # The pool has already discarded the connection; start over
+            self.rollback()
+            if fallback:
+                self.bind = get_engine(PRIMARY)
+                self.info["role"] = PRIMARY
+                replica_health.count_fallback()
+            else:
+                metrics = getattr(self.get_bind().pool, "metrics", None)
+                if metrics is not None:
+                    metrics.count("disconnect_retries")
+            return super().execute(statement, params, **kw)
 
 
-def init_session_factory(engine: Engine):
-    global SessionLocal
-    SessionLocal = scoped_session(
-        sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
-    )
+def init_session_factory():
+    global SessionLocal, ReadSessionLocal, AnalyticsSessionLocal
+    factory = sessionmaker(class_=RetryingSession, autocommit=False, autoflush=False, future=True)
+    SessionLocal = scoped_session(factory)
+    ReadSessionLocal = scoped_session(factory)
+    AnalyticsSessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, future=True))
 
 
-def get_db_session():
-    if SessionLocal is None:
+def _wants_read_only() -> bool:
+    # GET/HEAD handlers only read; jobs and CLI code run outside a request
+    return has_request_context() and request.method in READ_METHODS
+
+
+def get_db_session(read_only: bool | None = None):
+    """
+    Return this request's session. read_only defaults to True for GET and
+    HEAD requests; those sessions use the replica while it is healthy and
+    the primary otherwise. Writes always get the primary.
+    """
+    if SessionLocal is None or ReadSessionLocal is None:
         raise RuntimeError("DB session factory not initialized")
-    return SessionLocal()
+    if read_only is None:
+        read_only = _wants_read_only()
+
+    session = ReadSessionLocal() if read_only else SessionLocal()
+    if session.bind is None:
+        # Engines are built on the first request that needs them
+        role = REPLICA if read_only and engine_configured(REPLICA) and replica_health.available() else PRIMARY
+        session.bind = get_engine(role)
+        session.info["role"] = role
+    return session
+
+
+def get_analytics_session():
+    """
+    Return this request's session for analytics scans: the in-memory DuckDB
+    snapshot (snapshot.py) once it has loaded, the read session otherwise.
+    It holds Usages, Services, Providers and Invoices only.
+    """
+    engine = analytics_snapshot.get_engine()
+    if engine is None or AnalyticsSessionLocal is None:
+        return get_db_session(read_only=True)
+
+    session = AnalyticsSessionLocal()
+    if session.bind is None:
+        # A rebuild mid-request leaves this request on the copy it started with
+        session.bind = engine
+        session.info["role"] = SNAPSHOT
+    return session
+
+
+# Execution options for results that are iterated in batches (NDJSON,
+# CSV and Arrow streaming) instead of fetched whole; uses a server-side
+# cursor where the driver has one
+STREAM_RESULTS = {"stream_results": True}
+STREAM_BATCH_SIZE = 1000
+
+
+def hold_session_for_stream(response: Response) -> Response:
+    """
+    Keep this request's sessions until a streamed response has been sent.
+    Flask tears the app context down when the view returns, before the body
+    is iterated, but the stream is still reading from a session's cursor.
+    The sessions are removed when the server closes the response instead.
+    """
+    g.db_session_streaming = True
+    response.call_on_close(_remove_sessions)
+    return response
 
 
 def remove_db_session(exception=None):
+    if has_app_context() and g.get("db_session_streaming"):
+        return
+    _remove_sessions()
+
+
+def _remove_sessions():
     if SessionLocal is not None:
         SessionLocal.remove()
+    if ReadSessionLocal is not None:
+        ReadSessionLocal.remove()
+    if AnalyticsSessionLocal is not None:
+        AnalyticsSessionLocal.remove()
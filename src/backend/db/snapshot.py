@@ -0,0 +1,274 @@
+"""
+File: snapshot.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Optional analytics snapshot (ANALYTICS_SNAPSHOT). Each worker
+             keeps a columnar copy of Usages, Services, Providers and
+             Invoices in an in-memory DuckDB database, refreshed in the
+             background, and the analytics endpoints run their GROUP BY
+             scans against it instead of Azure SQL. New Usages rows are
+             appended by CreatedDate every refresh; the whole copy is
+             rebuilt now and then to pick up edits and deletes.
+"""
+
+import itertools
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.pool import QueuePool
+from backend.db import standin
+from backend.db.dialects import get_dialect
+from backend.db.engine import PRIMARY, REPLICA, engine_configured, get_engine
+from backend.db.replica import replica_health
+from backend.db.schema import create_schema_sql, load_schema
+from backend.db.statements import install_statement_stats, statement_metrics
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT = "snapshot"
+
+# Reloaded whole on every refresh; they are small next to Usages
+DIMENSION_TABLES = ("Providers", "Services", "Invoices")
+# Empty in the snapshot, so usage_source() reads Usages directly
+EMPTY_TABLES = ("RollupWatermarks",)
+
+# Usages rows fetched from the database and loaded per batch
+LOAD_BATCH_SIZE = 50000
+
+_generations = itertools.count(1)
+
+
+def _columns(table: str) -> list[str]:
+    return [name for name, _ in load_schema()[table]]
+
+
+class AnalyticsSnapshot:
+    """State of the snapshot: disabled, idle, loading, ready or failed."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.dialect = get_dialect("duckdb")
+        self.state = "disabled"
+        self.refresh_seconds = 300.0
+        self.rebuild_seconds = 86400.0
+        self.pool_size = 5
+        self.max_overflow = 10
+        self.high_water: datetime | None = None
+        self.rows: dict[str, int] = {}
+        self.refreshes = 0
+        self.loaded_at: datetime | None = None
+        self.seconds: float | None = None
+        self.error: str | None = None
+        self._engine: Engine | None = None
+        self._keeper = None
+        self._rebuilt = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def configure(
+        self,
+        enabled: bool,
+        refresh_seconds: float = 300,
+        rebuild_seconds: float = 86400,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+    ):
+        """
+        Nothing is loaded here: the first analytics request starts the
+        refresher in the process that serves it (so after fork under a
+        preloading gunicorn), and is answered by the database until the
+        first load completes.
+        """
+        with self._lock:
+            self.state = "idle" if enabled else "disabled"
+            self.refresh_seconds = refresh_seconds
+            self.rebuild_seconds = rebuild_seconds
+            self.pool_size = pool_size
+            self.max_overflow = max_overflow
+
+    def get_engine(self) -> Engine | None:
+        """The snapshot's engine once loaded; None while disabled or loading."""
+        if self.state == "idle":
+            self.start()
+        return self._engine
+
+    def start(self) -> bool:
+        """Start the refresher in a daemon thread; False if disabled or running."""
+        with self._lock:
+            if self.state != "idle":
+                return False
+            self.state = "loading"
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="analytics-snapshot", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            rebuild = self._engine is None or time.monotonic() - self._rebuilt >= self.rebuild_seconds
+            try:
+                self.refresh(rebuild=rebuild)
+            except Exception:
+                # Recorded in status(); the previous copy keeps serving
+                logger.exception("Analytics snapshot refresh failed")
+            self._stop.wait(self.refresh_seconds)
+
+    def refresh(self, rebuild: bool = False) -> dict[str, Any]:
+        """
+        Bring the snapshot up to the newest Usages.CreatedDate. Like the
+        rollup job, rows are picked up by CreatedDate, so rows edited,
+        deleted or backfilled below the mark only show after a rebuild.
+        """
+        started = time.monotonic()
+        rebuild = rebuild or self._engine is None
+        try:
+            # Loads read from the replica when there is a healthy one
+            role = REPLICA if engine_configured(REPLICA) and replica_health.available() else PRIMARY
+            with get_engine(role).connect() as source:
+                high = source.execute(text("SELECT MAX(CreatedDate) FROM Usages")).scalar()
+                if rebuild:
+                    result = self._rebuild(source, high)
+                else:
+                    result = self._append(source, self.high_water, high)
+        except Exception as exc:
+            with self._lock:
+                self.error = f"{type(exc).__name__}: {exc}"
+                if self._engine is None:
+                    self.state = "failed"
+            raise
+
+        with self._lock:
+            self.state = "ready"
+            self.error = None
+            self.refreshes += 1
+            self.loaded_at = datetime.now()
+            self.seconds = round(time.monotonic() - started, 3)
+            result["seconds"] = self.seconds
+        return result
+
+    def _rebuild(self, source: Connection, high: datetime | None) -> dict[str, Any]:
+        # Load into a new database while the current one keeps serving,
+        # then swap. Each generation has its own in-memory database name.
+        name = f":memory:analytics_{os.getpid()}_{next(_generations)}"
+        engine = create_engine(
+            self.dialect.url(name),
+            poolclass=QueuePool,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            future=True,
+        )
+        if statement_metrics.enabled:
+            install_statement_stats(engine)
+        standin.install(engine, self.dialect)
+        # The loading connection stays open for the engine's lifetime, which
+        # keeps the in-memory database alive however the pool trims itself
+        connection = engine.raw_connection()
+        keeper = connection.driver_connection
+        connection.detach()
+        try:
+            tables = (*DIMENSION_TABLES, "Usages", *EMPTY_TABLES)
+            for statement in create_schema_sql(self.dialect, tables, keyed=False):
+                keeper.execute(statement)
+            rows = self._load(keeper, source, None, high)
+        except Exception:
+            keeper.close()
+            engine.dispose()
+            raise
+
+        with self._lock:
+            old_engine, old_keeper = self._engine, self._keeper
+            self._engine, self._keeper = engine, keeper
+            self.high_water = high
+            self.rows = rows
+            self._rebuilt = time.monotonic()
+
+        if old_engine is not None:
+            # Requests still holding a connection finish on the old copy,
+            # which is freed when the last of them closes
+            old_engine.dispose()
+            old_keeper.close()
+        return {"rebuilt": True, "high_water": high, "rows": dict(rows)}
+
+    def _append(self, source: Connection, low: datetime | None, high: datetime | None) -> dict[str, Any]:
+        with self._lock:
+            keeper = self._keeper
+        rows = self._load(keeper, source, low, high)
+        with self._lock:
+            self.high_water = high
+            self.rows = rows
+        return {"rebuilt": False, "high_water": high, "rows": dict(rows)}
+
+    def _load(self, keeper, source: Connection, low: datetime | None, high: datetime | None) -> dict[str, int]:
+        """Reload the dimension tables and append Usages created in (low, high]."""
+        # One transaction: readers see the old rows until all are in
+        keeper.begin()
+        try:
+            for table in DIMENSION_TABLES:
+                columns = _columns(table)
+                keeper.execute(f"DELETE FROM {table}")
+                rows = source.execute(text(f"SELECT {', '.join(columns)} FROM {table}")).fetchall()
+                self.dialect.insert_rows(keeper, table, columns, rows)
+
+            if high is not None and low != high:
+                columns = _columns("Usages")
+                where = "CreatedDate <= :high" if low is None else "CreatedDate > :low AND CreatedDate <= :high"
+                result = source.execute(
+                    text(f"SELECT {', '.join(columns)} FROM Usages WHERE {where}"),
+                    {"low": low, "high": high},
+                    execution_options={"stream_results": True},
+                )
+                for batch in result.partitions(LOAD_BATCH_SIZE):
+                    self.dialect.insert_rows(keeper, "Usages", columns, batch)
+            keeper.commit()
+        except Exception:
+            keeper.rollback()
+            raise
+        # Compresses the new rows; uncompressed they take about ten times the memory
+        keeper.execute("CHECKPOINT")
+
+        return {
+            table: keeper.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in (*DIMENSION_TABLES, "Usages")
+        }
+
+    def _after_fork(self):
+        # The refresher thread and the parent's DuckDB connections stay
+        # behind; this process loads its own copy on first use
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._engine = None
+        self._keeper = None
+        self.high_water = None
+        self.rows = {}
+        if self.state != "disabled":
+            self.state = "idle"
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            status = {
+                "state": self.state,
+                "high_water": self.high_water.isoformat() if self.high_water is not None else None,
+                "loaded_at": self.loaded_at.isoformat(timespec="seconds") if self.loaded_at is not None else None,
+                "rows": dict(self.rows),
+                "refreshes": self.refreshes,
+                "seconds": self.seconds,
+                "refresh_seconds": self.refresh_seconds,
+                "rebuild_seconds": self.rebuild_seconds,
+            }
+            if self.error is not None:
+                status["error"] = self.error
+            return status
+
+
+analytics_snapshot = AnalyticsSnapshot()
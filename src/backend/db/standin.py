@@ -0,0 +1,151 @@
+"""
+File: standin.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Local stand-in database (DB_BACKEND=sqlite or duckdb). A file
+             with the tables from database/schema.md, the few T-SQL
+             constructs the API uses translated on the way to the driver
+             (dialects.py), and an optional per-statement delay that mimics
+             the Azure SQL round trip, so the API can be run and benchmarked
+             without Azure. Create and seed it with:
+
+                 python -m backend.db.standin [--backend sqlite|duckdb] [--usages 40000] [--rebuild]
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime, time as dtime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from backend.db.dialects import DIALECTS, StandinDialect, get_dialect
+from backend.db.schema import create_schema_sql, load_schema
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def default_path(dialect: StandinDialect) -> Path:
+    # local.db, local.duckdb
+    return BACKEND_DIR / f"local{dialect.suffix}"
+
+
+def install(engine: Engine, dialect: StandinDialect, latency_ms: float = 0):
+    """Translate statements, type result rows and add latency_ms per statement."""
+    delay = latency_ms / 1000
+    dialect.install(engine)
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def _translate(conn, cursor, statement, parameters, context, executemany):
+        if delay:
+            # Sleeping releases the GIL, like waiting on the network does
+            time.sleep(delay)
+        return dialect.translate(statement), parameters
+
+
+# Seed data: 3 providers, one service per type and provider, 10 clients
+PROVIDERS = ((2001, "AWS"), (2002, "Azure"), (2003, "GCP"))
+CLIENTS = tuple((1000 + n, f"Client {n:02d}") for n in range(1, 11))
+SERVICE_CATALOG = (
+    # type, unit, (AWS, Azure, GCP) names and unit costs
+    ("Compute", "hours", (("EC2 m5.large", "0.0960"), ("Virtual Machines D2s v5", "0.0960"), ("Compute Engine n2-standard-2", "0.0971"))),
+    ("Containers", "hours", (("EKS Cluster", "0.1000"), ("AKS Standard", "0.1000"), ("GKE Standard", "0.1000"))),
+    ("Databases", "hours", (("RDS PostgreSQL db.m5.large", "0.1780"), ("Azure SQL Database S3", "0.2016"), ("Cloud SQL PostgreSQL", "0.1565"))),
+    ("Object Storage", "GB", (("S3 Standard", "0.0230"), ("Blob Storage Hot", "0.0184"), ("Cloud Storage Standard", "0.0200"))),
+    ("File Storage", "GB", (("EFS Standard", "0.3000"), ("Azure Files Premium", "0.1600"), ("Filestore Basic HDD", "0.2000"))),
+    ("Machine Learning", "hours", (("SageMaker ml.m5.xlarge", "0.2300"), ("Azure Machine Learning D4s v3", "0.1920"), ("Vertex AI n1-standard-4", "0.2190"))),
+    ("Data Warehouse", "hours", (("Redshift ra3.xlplus", "1.0860"), ("Synapse DW100c", "1.2000"), ("BigQuery Editions Standard", "0.0400"))),
+    ("Data Processing", "hours", (("EMR m5.xlarge", "0.0480"), ("HDInsight D4 v2", "0.0850"), ("Dataproc n1-standard-4", "0.0100"))),
+    ("Managed Services", "hours", (("Amazon MQ mq.m5.large", "0.2880"), ("Service Bus Premium", "0.9280"), ("Pub/Sub Lite", "0.0400"))),
+    ("Serverless", "requests", (("Lambda", "0.0000002"), ("Azure Functions", "0.0000002"), ("Cloud Functions", "0.0000004"))),
+)
+
+
+def services() -> list[tuple]:
+    """Services rows: 3001-3010 AWS, 3011-3020 Azure, 3021-3030 GCP."""
+    rows = []
+    created = datetime(2025, 10, 1)
+    for p, (provider_id, _) in enumerate(PROVIDERS):
+        for t, (service_type, unit, offers) in enumerate(SERVICE_CATALOG):
+            name, cost = offers[p]
+            rows.append((3001 + p * len(SERVICE_CATALOG) + t, name, service_type, Decimal(cost), provider_id, created, unit))
+    return rows
+
+
+def _seed_usages(count: int, days: int, seed: int):
+    rnd = random.Random(seed)
+    catalog = services()
+    end = date.today()
+    created = datetime.now().replace(microsecond=0)
+    for n in range(count):
+        service = rnd.choice(catalog)
+        units = Decimal(str(round(rnd.uniform(0.1, 50), 2)))
+        yield (
+            900001 + n,
+            rnd.choice(CLIENTS)[0],
+            service[0],
+            end - timedelta(days=rnd.randrange(days)),
+            dtime(rnd.randrange(24), rnd.randrange(60), rnd.randrange(60)),
+            units,
+            (units * service[3]).quantize(Decimal("0.01")),
+            created,
+        )
+
+
+def bootstrap(
+    path: Path | str | None = None,
+    backend: str = "sqlite",
+    usages: int = 40000,
+    days: int = 90,
+    seed: int = 495,
+    rebuild: bool = False,
+) -> Path:
+    """Create the schema, and seed it if it has no providers yet."""
+    dialect = get_dialect(backend)
+    path = Path(path) if path else default_path(dialect)
+    if rebuild and path.exists():
+        path.unlink()
+    connection = dialect.connect(str(path))
+    try:
+        for statement in create_schema_sql(dialect):
+            connection.execute(statement)
+        if connection.execute("SELECT COUNT(*) FROM Providers").fetchone()[0] == 0:
+            created = datetime(2025, 10, 1)
+            schema = load_schema()
+
+            def insert(table, rows):
+                dialect.insert_rows(connection, table, [name for name, _ in schema[table]], rows)
+
+            insert("Providers", PROVIDERS)
+            insert("Services", services())
+            insert("Clients", [(*client, created) for client in CLIENTS])
+            insert("Budgets", [
+                (n, client_id, Decimal("5000.00"), Decimal("6000.00"), Decimal("80.00"), True, created)
+                for n, (client_id, _) in enumerate(CLIENTS, start=1)
+            ])
+            insert("Usages", _seed_usages(usages, days, seed))
+        connection.commit()
+    finally:
+        connection.close()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create and seed the local stand-in database.")
+    parser.add_argument("--backend", choices=sorted(DIALECTS), default="sqlite", help="Stand-in dialect")
+    parser.add_argument("--path", help="Database file (default: src/backend/local.db or local.duckdb)")
+    parser.add_argument("--usages", type=int, default=40000, help="Usages rows to generate")
+    parser.add_argument("--days", type=int, default=90, help="Days of usage, ending today")
+    parser.add_argument("--seed", type=int, default=495, help="Random seed")
+    parser.add_argument("--rebuild", action="store_true", help="Delete the file and start over")
+    args = parser.parse_args()
+    path = bootstrap(
+        args.path, backend=args.backend, usages=args.usages, days=args.days, seed=args.seed, rebuild=args.rebuild,
+    )
+    print(f"Stand-in database ready: {path}")
+
+
+if __name__ == "__main__":
+    main()
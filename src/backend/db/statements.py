@@ -0,0 +1,256 @@
+"""
+File: statements.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: SQL statement telemetry (SQL_STATS). Times every statement
+             sent through the engine, grouped by its normalized text, logs
+             statements slower than SQL_SLOW_QUERY_MS, and at the end of
+             each request flags ones that ran more than SQL_QUERY_BUDGET
+             statements or the same statement SQL_REPEAT_THRESHOLD times
+             (an N+1 loop). /health/sql shows the top statements.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from backend.db.pool_metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Distinct statements tracked per worker; the rest are counted under OTHER
+MAX_STATEMENTS = 500
+OTHER = "(other statements)"
+# Recent samples per statement, for its percentiles
+STATEMENT_SAMPLES = 200
+# Flagged requests kept for /health/sql
+RECENT_FLAGGED = 50
+
+_STRING = re.compile(r"N?'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.@:$])-?\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize(statement: str) -> str:
+    """
+    One line of SQL with literals replaced by ? and IN lists collapsed, so
+    statements that differ only in their values group together.
+    """
+    statement = _STRING.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = _LIST.sub("(?, ...)", statement)
+    return _SPACE.sub(" ", statement).strip()
+
+
+class StatementStats:
+    """Totals and latencies for one normalized statement."""
+
+    __slots__ = ("calls", "slow", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.slow = 0
+        self.latency = LatencyHistogram(recent=STATEMENT_SAMPLES)
+
+    def snapshot(self, statement: str, total_ms: float) -> dict[str, Any]:
+        latency = self.latency
+        return {
+            "statement": statement,
+            "calls": self.calls,
+            "total_ms": round(latency.total_ms, 3),
+            "share": round(latency.total_ms / total_ms, 4) if total_ms else None,
+            "mean_ms": round(latency.total_ms / self.calls, 3) if self.calls else None,
+            "p95_ms": _round(latency.percentile(95)),
+            "max_ms": round(latency.max_ms, 3),
+            "slow": self.slow,
+        }
+
+
+class _RequestStatements:
+    """Statements run by the current request, kept on flask.g."""
+
+    __slots__ = ("count", "seconds", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: dict[str, int] = {}
+
+
+class SqlStatementMetrics:
+    """Per-worker statement totals, slow-statement log and N+1 flags."""
+
+    ORDERS = {
+        "total": lambda stats: stats.latency.total_ms,
+        "mean": lambda stats: stats.latency.total_ms / stats.calls if stats.calls else 0,
+        "calls": lambda stats: stats.calls,
+        "max": lambda stats: stats.latency.max_ms,
+    }
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.enabled = False
+        self.slow_ms = 500.0
+        self.query_budget = 20
+        self.repeat_threshold = 5
+        self._reset()
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def _reset(self):
+        self.statements: dict[str, StatementStats] = {}
+        self.total_ms = 0.0
+        self.requests = 0
+        self.request_statements = 0
+        self.max_request_statements = 0
+        self.over_budget = 0
+        self.repeated = 0
+        self.flagged: deque[dict[str, Any]] = deque(maxlen=RECENT_FLAGGED)
+        self.started = datetime.now()
+
+    def configure(self, enabled: bool, slow_ms: float = 500, query_budget: int = 20, repeat_threshold: int = 5):
+        with self._lock:
+            self.enabled = enabled
+            self.slow_ms = slow_ms
+            self.query_budget = query_budget
+            self.repeat_threshold = repeat_threshold
+
+    def reset(self):
+        with self._lock:
+            self._reset()
+
+    def observe(self, statement: str, seconds: float):
+        shape = normalize(statement)
+        ms = seconds * 1000
+        slow = ms >= self.slow_ms
+        with self._lock:
+            stats = self.statements.get(shape)
+            if stats is None:
+                if len(self.statements) >= MAX_STATEMENTS:
+                    shape = OTHER
+                stats = self.statements.setdefault(shape, StatementStats())
+            stats.calls += 1
+            stats.latency.observe(seconds)
+            if slow:
+                stats.slow += 1
+            self.total_ms += ms
+
+        if has_request_context():
+            current = g.get("sql_statements")
+            if current is None:
+                current = g.sql_statements = _RequestStatements()
+            current.count += 1
+            current.seconds += seconds
+            current.shapes[shape] = current.shapes.get(shape, 0) + 1
+
+        if slow:
+            logger.warning(
+                "Slow SQL statement: %.0f ms%s: %s", ms, _route_suffix(), shape,
+            )
+
+    def finish_request(self, exc: BaseException | None = None):
+        """Teardown: check the request's statements against the budget and for repeats."""
+        current = g.pop("sql_statements", None)
+        count = current.count if current is not None else 0
+        repeated = []
+        if current is not None:
+            repeated = sorted(
+                ((shape, n) for shape, n in current.shapes.items() if n >= self.repeat_threshold),
+                key=lambda item: -item[1],
+            )
+        over_budget = count > self.query_budget
+
+        with self._lock:
+            self.requests += 1
+            self.request_statements += count
+            self.max_request_statements = max(self.max_request_statements, count)
+            if not (over_budget or repeated):
+                return
+            self.over_budget += over_budget
+            self.repeated += bool(repeated)
+            self.flagged.append({
+                "at": datetime.now().isoformat(timespec="seconds"),
+                "request": _route(),
+                "statements": count,
+                "db_ms": round(current.seconds * 1000, 3),
+                "over_budget": over_budget,
+                "repeated": [{"statement": shape, "count": n} for shape, n in repeated],
+            })
+
+        if over_budget:
+            logger.warning("%s ran %s SQL statements (budget %s)", _route(), count, self.query_budget)
+        for shape, n in repeated:
+            logger.warning("%s ran the same SQL statement %s times (possible N+1): %s", _route(), n, shape)
+
+    def status(self, top: int = 20, order: str = "total") -> dict[str, Any]:
+        key = self.ORDERS[order]
+        with self._lock:
+            ranked = sorted(self.statements.items(), key=lambda item: key(item[1]), reverse=True)[:top]
+            calls = sum(stats.calls for stats in self.statements.values())
+            return {
+                "enabled": self.enabled,
+                "since": self.started.isoformat(timespec="seconds"),
+                "slow_query_ms": self.slow_ms,
+                "query_budget": self.query_budget,
+                "repeat_threshold": self.repeat_threshold,
+                "statements": {
+                    "distinct": len(self.statements),
+                    "calls": calls,
+                    "total_ms": round(self.total_ms, 3),
+                    "slow": sum(stats.slow for stats in self.statements.values()),
+                },
+                "requests": {
+                    "count": self.requests,
+                    "mean_statements": round(self.request_statements / self.requests, 2) if self.requests else None,
+                    "max_statements": self.max_request_statements,
+                    "over_budget": self.over_budget,
+                    "repeated": self.repeated,
+                },
+                "top": [stats.snapshot(shape, self.total_ms) for shape, stats in ranked],
+                "flagged": list(self.flagged),
+            }
+
+    def _after_fork(self):
+        # Each worker reports its own statements
+        self._lock = threading.Lock()
+        self._reset()
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
+
+
+def _route() -> str:
+    rule = request.url_rule
+    return f"{request.method} {rule.rule if rule is not None else request.path}"
+
+
+def _route_suffix() -> str:
+    return f" in {_route()}" if has_request_context() else ""
+
+
+def install_statement_stats(engine: Engine):
+    """Time every statement on this engine into statement_metrics."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        # The statement as the route wrote it, before any stand-in rewrite
+        context._statement_started = (time.perf_counter(), statement)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        started, statement = context._statement_started
+        statement_metrics.observe(statement, time.perf_counter() - started)
+
+
+statement_metrics = SqlStatementMetrics()
@@ -0,0 +1,250 @@
+"""
+File: synthetic.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Benchmark-scale Usages generator. Ports the model of
+             database/seed_usages v2.sql (client to provider preference,
+             all 30 services, category-based UnitsUsed, time-of-day
+             weighting, provider scaling) to NumPy, a million rows at a
+             time, and writes the rows to the local stand-in database or
+             to a Parquet file. The same seed gives the same rows:
+
+                 python -m backend.db.synthetic --rows 10000000 [--backend sqlite|duckdb] [--parquet usages.parquet]
+"""
+
+import argparse
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from backend.db import standin
+from backend.db.dialects import DIALECTS, get_dialect
+from backend.db.schema import INDEXES, create_schema_sql
+
+# Rows per generated chunk. Each chunk has its own random stream, seeded
+# from (seed, chunk number), so a run is reproducible at any size.
+CHUNK_ROWS = 1_000_000
+
+START_USAGE_ID = 900001
+
+# Client -> provider preference (index into standin.PROVIDERS: AWS, Azure, GCP)
+CLIENT_PROVIDERS = {
+    1001: 0, 1002: 0, 1003: 0, 1009: 0,
+    1004: 1, 1005: 1, 1006: 1,
+    1007: 2, 1008: 2, 1010: 2,
+}
+
+# Provider scaling to match invoice spending patterns (AWS ~1k/month,
+# Azure ~18k/month, GCP ~4.3k/month)
+PROVIDER_SCALE = (1, 16, 4)
+
+# Service type -> share of events in the busy window, its start hour and
+# length in hours; the rest fall anywhere in the day
+BUSY_HOURS = {
+    "Compute": (0.75, 8, 10),
+    "Containers": (0.75, 8, 10),
+    "Object Storage": (0.60, 1, 3),
+    "File Storage": (0.60, 1, 3),
+    "Machine Learning": (0.50, 2, 4),
+    "Data Warehouse": (0.50, 2, 4),
+    "Data Processing": (0.50, 2, 4),
+}
+
+# Service type -> UnitsUsed in cents: first + step * randrange(steps)
+UNITS = {
+    "Compute": (10, 10, 50),             # 0.1 - 5.0 hours
+    "Containers": (10, 10, 30),          # 0.1 - 3.0 hours
+    "Databases": (10, 10, 20),           # 0.1 - 2.0 hours
+    "Object Storage": (100, 100, 500),   # 1 - 500 GB
+    "File Storage": (100, 100, 500),
+    "Data Warehouse": (500, 100, 46),    # 5 - 50 hours
+    "Data Processing": (500, 100, 46),
+    "Machine Learning": (100, 100, 20),  # 1 - 20 hours
+}
+OTHER_UNITS = (1, 1, 10)                 # 0.01 - 0.10
+
+USAGE_SCHEMA = pa.schema([
+    ("UsageID", pa.int32()),
+    ("ClientID", pa.int32()),
+    ("ServiceID", pa.int32()),
+    ("UsageDate", pa.date32()),
+    ("UsageTime", pa.time32("s")),
+    ("UnitsUsed", pa.decimal128(18, 2)),
+    ("TotalCost", pa.decimal128(18, 2)),
+    ("CreatedDate", pa.timestamp("s")),
+])
+
+
+class _Model:
+    """The seed script's lookup tables as arrays indexed by client or service type."""
+
+    def __init__(self):
+        catalog = standin.services()
+        types = [service_type for service_type, _, _ in standin.SERVICE_CATALOG]
+        self.type_count = len(types)
+        self.clients = np.array(sorted(CLIENT_PROVIDERS), dtype=np.int32)
+        self.client_provider = np.array([CLIENT_PROVIDERS[client] for client in self.clients], dtype=np.int64)
+        self.provider_scale = np.array(PROVIDER_SCALE, dtype=np.int64)
+        # services() lists them provider by provider, in catalog order
+        self.service_ids = np.array([row[0] for row in catalog], dtype=np.int32)
+        # ServiceCost in units of 1e-7 (DECIMAL(18, 7)), so costs stay exact
+        self.service_cost = np.array([int(row[3].scaleb(7)) for row in catalog], dtype=np.int64)
+
+        busy = [BUSY_HOURS.get(service_type, (0.0, 0, 24)) for service_type in types]
+        self.busy_share = np.array([share for share, _, _ in busy])
+        self.busy_start = np.array([start * 3600 for _, start, _ in busy], dtype=np.int64)
+        self.busy_length = np.array([hours * 3600 for _, _, hours in busy], dtype=np.int64)
+
+        units = [UNITS.get(service_type, OTHER_UNITS) for service_type in types]
+        self.units_first = np.array([first for first, _, _ in units], dtype=np.int64)
+        self.units_step = np.array([step for _, step, _ in units], dtype=np.int64)
+        self.units_steps = np.array([steps for _, _, steps in units], dtype=np.int64)
+
+
+def _decimal_array(cents: np.ndarray) -> pa.Array:
+    # DECIMAL(18, 2) from unscaled int64 values: 128-bit little-endian words
+    words = np.zeros((len(cents), 2), dtype=np.int64)
+    words[:, 0] = cents
+    words[:, 1] = np.where(cents < 0, -1, 0)
+    return pa.Array.from_buffers(pa.decimal128(18, 2), len(cents), [None, pa.py_buffer(words)])
+
+
+def _chunk(model: _Model, rng: np.random.Generator, first: int, count: int,
+           start: date, days: int, created: datetime) -> pa.Table:
+    n = np.arange(first, first + count, dtype=np.int64)
+
+    # Clients in turn, each using a random service of its preferred provider
+    client = (n - 1) % len(model.clients)
+    provider = model.client_provider[client]
+    service_type = rng.integers(0, model.type_count, count)
+    service = provider * model.type_count + service_type
+
+    usage_date = np.datetime64(start, "D") + rng.integers(0, days, count)
+
+    busy = rng.random(count) < model.busy_share[service_type]
+    seconds = np.where(
+        busy,
+        model.busy_start[service_type] + rng.integers(0, model.busy_length[service_type]),
+        rng.integers(0, 86400, count),
+    )
+
+    units = (
+        model.units_first[service_type]
+        + model.units_step[service_type] * rng.integers(0, model.units_steps[service_type])
+    ) * model.provider_scale[provider]
+    # Cents x 1e-7 dollars per unit, rounded half up to the cent
+    cost = (units * model.service_cost[service] + 5_000_000) // 10_000_000
+
+    return pa.Table.from_arrays(
+        [
+            pa.array(START_USAGE_ID + n - 1, pa.int32()),
+            pa.array(model.clients[client]),
+            pa.array(model.service_ids[service]),
+            pa.array(usage_date, pa.date32()),
+            pa.array(seconds.astype(np.int32), pa.time32("s")),
+            _decimal_array(units),
+            _decimal_array(cost),
+            pa.array(np.full(count, np.datetime64(created, "s")), pa.timestamp("s")),
+        ],
+        schema=USAGE_SCHEMA,
+    )
+
+
+def generate_usages(
+    rows: int,
+    days: int = 90,
+    end: date | None = None,
+    seed: int = 495,
+    created: datetime | None = None,
+) -> Iterator[pa.Table]:
+    """
+    Yield Usages rows as Arrow tables of up to CHUNK_ROWS rows, dated over
+    the `days` days ending `end` (default today). Every row gets the same
+    CreatedDate, like GETDATE() in the seed script.
+    """
+    end = end or date.today()
+    start = end - timedelta(days=days - 1)
+    created = created or datetime.now().replace(microsecond=0)
+    model = _Model()
+    for chunk, first in enumerate(range(1, rows + 1, CHUNK_ROWS)):
+        rng = np.random.default_rng([seed, chunk])
+        yield _chunk(model, rng, first, min(CHUNK_ROWS, rows - first + 1), start, days, created)
+
+
+def write_standin(path: Path | str | None, backend: str, chunks: Iterator[pa.Table], progress=None) -> Path:
+    """
+    Replace the stand-in database's Usages with the generated rows. The
+    usage indexes are dropped during the load and built once at the end,
+    and the rollups are cleared so they are rebuilt from the new rows.
+    """
+    dialect = get_dialect(backend)
+    path = standin.bootstrap(path, backend=backend, usages=0)
+    connection = dialect.connect(str(path))
+    try:
+        connection.execute("DELETE FROM Usages")
+        for table in ("UsageRollupHourly", "UsageRollupDaily", "UsageRollupMonthly", "RollupWatermarks"):
+            connection.execute(f"DELETE FROM {table}")
+        for name, table, _ in INDEXES:
+            if table == "Usages":
+                connection.execute(f"DROP INDEX IF EXISTS {name}")
+        connection.commit()
+
+        for batch in chunks:
+            dialect.insert_arrow(connection, "Usages", batch)
+            connection.commit()
+            if progress:
+                progress(batch.num_rows)
+
+        for statement in create_schema_sql(dialect, ["Usages"]):
+            connection.execute(statement)
+        connection.commit()
+    finally:
+        connection.close()
+    return path
+
+
+def write_parquet(path: Path | str, chunks: Iterator[pa.Table], progress=None) -> Path:
+    """Write the generated rows to one Parquet file, a row group per chunk."""
+    path = Path(path)
+    with pq.ParquetWriter(path, USAGE_SCHEMA, compression="zstd") as writer:
+        for batch in chunks:
+            writer.write_table(batch)
+            if progress:
+                progress(batch.num_rows)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate benchmark-scale Usages rows.")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Usages rows to generate")
+    parser.add_argument("--days", type=int, default=90, help="Days of usage")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last usage date, YYYY-MM-DD (default: today)")
+    parser.add_argument("--seed", type=int, default=495, help="Random seed")
+    parser.add_argument("--backend", choices=sorted(DIALECTS), default="sqlite", help="Stand-in dialect")
+    parser.add_argument("--path", help="Database file (default: src/backend/local.db or local.duckdb)")
+    parser.add_argument("--parquet", help="Write a Parquet file instead of the stand-in database")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    written = 0
+
+    def progress(rows: int):
+        nonlocal written
+        written += rows
+        rate = written / max(time.monotonic() - started, 1e-9)
+        print(f"{written:,} / {args.rows:,} rows ({rate:,.0f} rows/s)", flush=True)
+
+    chunks = generate_usages(args.rows, days=args.days, end=args.end, seed=args.seed)
+    if args.parquet:
+        path = write_parquet(args.parquet, chunks, progress)
+    else:
+        path = write_standin(args.path, args.backend, chunks, progress)
+    print(f"{written:,} Usages rows written to {path} in {time.monotonic() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+File: tokens.py
+Project: Cloud Cost Intelligence Platform
+Author: Tony (Database Lead), Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Microsoft Entra access token cache for Azure SQL connections.
+             The token is fetched once, refreshed by a background thread
+             before it expires, and handed to each new pooled connection
+             already packed for the ODBC driver.
+"""
+
+import logging
+import os
+import struct
+import threading
+import time
+from typing import Any, Callable
+from azure.core.credentials import AccessToken
+
+logger = logging.getLogger(__name__)
+
+TOKEN_SCOPE = "https://database.windows.net/.default"
+REFRESH_MARGIN = 300  # seconds before expires_on to fetch a new token
+RETRY_INTERVAL = 30  # seconds between background attempts after a failure
+
+
+def odbc_access_token(token: str) -> bytes:
+    token_bytes = token.encode("utf-16-le")
+    return struct.pack(f"<I{len(token_bytes)}s", len(token_bytes), token_bytes)
+
+
+class AccessTokenProvider:
+    """
+    Thread-safe cache of the Azure SQL access token.
+
+    packed_token() only blocks on Entra ID for the first token (or when the
+    background refresh has been failing until the token expired); otherwise
+    it returns the cached token, which the refresher thread replaces
+    REFRESH_MARGIN seconds before expiry.
+    """
+
+    def __init__(self, credential_factory: Callable[[], Any], refresh_margin: float = REFRESH_MARGIN):
+        self._credential_factory = credential_factory
+        self._credential = None
+        self.refresh_margin = refresh_margin
+
+        self._lock = threading.Lock()
+        self._token: AccessToken | None = None
+        self._packed: bytes | None = None
+
+        self._stop = threading.Event()
+        self._refresher: threading.Thread | None = None
+        # Threads (and a lock held by one) do not survive fork: each worker
+        # process starts its own refresher
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def packed_token(self) -> bytes:
+        """Return the current token packed for SQL_COPT_SS_ACCESS_TOKEN."""
+        # A few seconds of slack so the token is still valid at login
+        self._refresh_if_needed(min_remaining=10)
+        self._ensure_refresher()
+        return self._packed
+
+    def expires_on(self) -> int | None:
+        token = self._token
+        return token.expires_on if token is not None else None
+
+    def stop(self):
+        self._stop.set()
+
+    def _refresh_if_needed(self, min_remaining: float):
+        token = self._token
+        if token is not None and token.expires_on - time.time() > min_remaining:
+            return
+
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            token = self._token
+            if token is not None and token.expires_on - time.time() > min_remaining:
+                return
+            if self._credential is None:
+                self._credential = self._credential_factory()
+            token = self._credential.get_token(TOKEN_SCOPE)
+            self._packed = odbc_access_token(token.token)
+            self._token = token
+
+    def _seconds_until_refresh(self) -> float:
+        token = self._token
+        if token is None:
+            return 0.0
+        return max(RETRY_INTERVAL, token.expires_on - time.time() - self.refresh_margin)
+
+    def _run(self):
+        delay = self._seconds_until_refresh()
+        while not self._stop.wait(delay):
+            try:
+                self._refresh_if_needed(min_remaining=self.refresh_margin)
+                delay = self._seconds_until_refresh()
+            except Exception:
+                logger.exception("Azure SQL access token refresh failed; retrying in %ss", RETRY_INTERVAL)
+                delay = RETRY_INTERVAL
+
+    def _ensure_refresher(self):
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._refresher = threading.Thread(target=self._run, name="sql-token-refresh", daemon=True)
+            self._refresher.start()
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._refresher = None
@@ -0,0 +1,58 @@
+"""
+File: validation.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Idle-aware connection validation. Instead of pool_pre_ping on
+             every checkout, only connections idle longer than
+             SQL_POOL_PING_IDLE seconds are pinged; a connection that dies
+             while hot is caught by the session's retry on disconnect.
+"""
+
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError
+
+LAST_USED_KEY = "last_used"  # monotonic time of the last checkin, in record.info
+
+
+def _metrics_count(engine: Engine, name: str):
+    metrics = getattr(engine.pool, "metrics", None)
+    if metrics is not None:
+        metrics.count(name)
+
+
+def install_idle_ping(engine: Engine, idle_seconds: float):
+    """
+    Ping a pooled connection on checkout only if it has been idle more than
+    idle_seconds. A failed ping that the dialect classifies as a disconnect
+    raises DisconnectionError, which makes the pool replace the connection
+    and retry the checkout, exactly as pool_pre_ping would.
+    """
+    dialect = engine.dialect
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # A brand new connection has just logged in and needs no ping
+        connection_record.info[LAST_USED_KEY] = time.monotonic()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        if dbapi_connection is not None:
+            connection_record.info[LAST_USED_KEY] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        last_used = connection_record.info.get(LAST_USED_KEY)
+        if last_used is not None and time.monotonic() - last_used <= idle_seconds:
+            return
+
+        _metrics_count(engine, "idle_pings")
+        try:
+            dialect.do_ping(dbapi_connection)
+        except dialect.loaded_dbapi.Error as exc:
+            if dialect.is_disconnect(exc, dbapi_connection, None):
+                _metrics_count(engine, "ping_disconnects")
+                raise DisconnectionError(f"Idle connection failed ping: {exc}") from exc
+            raise
@@ -0,0 +1,114 @@
+"""
+File: warmup.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Optional background connection pool warm-up. Opens
+             SQL_POOL_SIZE connections off the startup path (token fetch and
+             login included) so the first requests find a warm pool, and
+             reports progress for the readiness endpoint.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from sqlalchemy import text
+from backend.db.engine import get_engine
+
+
+class PoolWarmup:
+    """State of the warm-up: disabled, warming, warm or failed."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.state = "disabled"
+        self.target = 0
+        self.opened = 0
+        self.error: str | None = None
+        self.seconds: float | None = None
+        self._deferred = False
+        self._pending: int | None = None
+
+    def defer(self):
+        """
+        Hold start() until resume(). A gunicorn master that preloads the app
+        calls this so the connections are opened by each worker after fork,
+        not by the master.
+        """
+        with self._lock:
+            self._deferred = True
+
+    def resume(self) -> bool:
+        """Start a warm-up requested while deferred; False if there was none."""
+        with self._lock:
+            self._deferred = False
+            connections, self._pending = self._pending, None
+        return connections is not None and self.start(connections)
+
+    def start(self, connections: int) -> bool:
+        """Start warming in a daemon thread; False if already warming or warm."""
+        with self._lock:
+            if self._deferred:
+                self._pending = connections
+                return False
+            if self.state in ("warming", "warm"):
+                return False
+            self.state = "warming"
+            self.target = connections
+            self.opened = 0
+            self.error = None
+            self.seconds = None
+        threading.Thread(target=self._run, name="sql-pool-warmup", daemon=True).start()
+        return True
+
+    def _open(self, engine):
+        connection = engine.connect()
+        connection.execute(text("SELECT 1"))
+        with self._lock:
+            self.opened += 1
+        return connection
+
+    def _run(self):
+        started = time.monotonic()
+        connections = []
+        failure = None
+        try:
+            engine = get_engine()
+            # Hold every connection at once so the pool keeps `target` distinct ones
+            with ThreadPoolExecutor(max_workers=max(1, self.target)) as pool:
+                futures = [pool.submit(self._open, engine) for _ in range(self.target)]
+                for future in futures:
+                    try:
+                        connections.append(future.result())
+                    except Exception as exc:
+                        failure = failure or exc
+        except Exception as exc:
+            failure = exc
+        finally:
+            # Closing checks the connections back in to the pool
+            for connection in connections:
+                connection.close()
+
+        state = "warm" if failure is None else "failed"
+        error = None if failure is None else f"{type(failure).__name__}: {failure}"
+
+        with self._lock:
+            self.state = state
+            self.error = error
+            self.seconds = round(time.monotonic() - started, 3)
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            status = {
+                "state": self.state,
+                "target": self.target,
+                "opened": self.opened,
+                "seconds": self.seconds,
+            }
+            if self.error is not None:
+                status["error"] = self.error
+            return status
+
+
+pool_warmup = PoolWarmup()
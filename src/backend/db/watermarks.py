@@ -0,0 +1,56 @@
+"""
+File: watermarks.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: High-water marks for incremental jobs, stored in the
+             RollupWatermarks table (see database/create_rollups.sql). A mark
+             is the newest Usages.CreatedDate a job has fully processed.
+"""
+
+from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+def load_watermark(db: Session, name: str):
+    """Return the (HighWater, UpdatedDate) row for a job, or None if it has never run."""
+    return db.execute(
+        text("""
+            SELECT HighWater, UpdatedDate
+            FROM RollupWatermarks
+            WHERE RollupName = :rollup_name
+        """),
+        {
+            "rollup_name": name
+        },
+    ).fetchone()
+
+
+def load_high_water(db: Session, name: str) -> datetime | None:
+    row = load_watermark(db, name)
+    return row.HighWater if row is not None else None
+
+
+def save_high_water(db: Session, name: str, high_water: datetime):
+    # Caller commits, so the mark moves in the same transaction as the work
+    params = {"rollup_name": name, "high_water": high_water, "updated_date": datetime.now()}
+    # Looked up rather than taken from the UPDATE's rowcount, which the
+    # DuckDB driver always reports as -1
+    if load_watermark(db, name) is not None:
+        db.execute(
+            text("""
+                UPDATE RollupWatermarks
+                SET HighWater = :high_water, UpdatedDate = :updated_date
+                WHERE RollupName = :rollup_name
+            """),
+            params,
+        )
+    else:
+        db.execute(
+            text("""
+                INSERT INTO RollupWatermarks (RollupName, HighWater, UpdatedDate)
+                VALUES (:rollup_name, :high_water, :updated_date)
+            """),
+            params,
+        )
@@ -0,0 +1,86 @@
+"""
+File: gunicorn_conf.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Production gunicorn settings. Preloads the app once in the
+             master, sizes gthread workers from the SQL pool, recycles
+             workers with jitter and keeps client connections alive between
+             dashboard requests. Every setting can be overridden with a
+             GUNICORN_* variable:
+
+                 gunicorn -c python:backend.gunicorn_conf backend.wsgi:app
+"""
+
+import os
+import backend  # loads src/backend/.env
+from backend.config import BaseConfig
+from backend.db.warmup import pool_warmup
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name, "").strip()
+    return int(value) if value else default
+
+
+def _cpu_count() -> int:
+    # CPUs this container may use, not the host's
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# Each worker has its own connection pool, so the database sees up to
+# workers * (SQL_POOL_SIZE + SQL_MAX_OVERFLOW) sessions
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = _env_int("GUNICORN_WORKERS", min(_cpu_count(), 4))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+
+# One request thread per pooled connection: requests then never queue on
+# a checkout, and overflow connections stay free for streamed exports
+pool_size = BaseConfig.SQL_POOL_MAX_SIZE if BaseConfig.SQL_POOL_ADAPTIVE else BaseConfig.SQL_POOL_SIZE
+threads = _env_int("GUNICORN_THREADS", pool_size)
+
+# Open client connections per worker: kept-alive ones under gthread,
+# in-flight requests under the asgi worker (see backend.asgi)
+worker_connections = _env_int("GUNICORN_WORKER_CONNECTIONS", BaseConfig.ASGI_MAX_IN_FLIGHT)
+
+# Import the app (and azure.identity) once; workers fork with it loaded.
+# Engines are built lazily and dropped again in each child (db/engine.py),
+# so no pooled socket is shared across processes.
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").strip().lower() in ("1", "true", "yes")
+
+# Restart workers now and then to bound memory growth; the jitter keeps
+# them from all restarting at once
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 10000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 1000)
+
+# A dashboard page fires a burst of API calls; keep the browser's
+# connection open across them. gthread parks idle keep-alive connections
+# without holding a thread. Behind a load balancer, set this above its
+# idle timeout so the balancer closes first.
+keepalive = _env_int("GUNICORN_KEEPALIVE", 15)
+
+# Long enough for a large CSV export to stream
+timeout = _env_int("GUNICORN_TIMEOUT", 120)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+
+# Heartbeat files on tmpfs; a container's disk-backed /tmp can stall workers
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+if preload_app:
+    # The master must not open connections: warm up in each worker instead
+    pool_warmup.defer()
+
+
+def post_fork(server, worker):
+    pool_warmup.resume()
+
+
+def when_ready(server):
+    sessions = server.cfg.workers * (pool_size + BaseConfig.SQL_MAX_OVERFLOW)
+    server.log.info(
+        "%s %s workers x %s threads, up to %s SQL sessions",
+        server.cfg.workers, server.cfg.worker_class_str, server.cfg.threads, sessions,
+    )
@@ -0,0 +1,9 @@
+"""
+File: __init__.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Maintenance jobs package initialization. Batch jobs that run
+             outside the request path (e.g. on a schedule) against the same
+             database configuration as the API.
+"""
@@ -0,0 +1,245 @@
+"""
+File: invoices.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead), Tony Arista (Database)
+Created: Feburary 2026
+Description: Incremental invoice generation job, replacing the full rebuild
+             in database/generate_invoices.sql. Only client-months with new
+             or late usage (by Usages.CreatedDate) and months that closed
+             since the last run are recomputed, one month per worker, and
+             invoices are upserted so reruns never duplicate them.
+
+                 python -m backend.jobs.invoices [--rebuild] [--workers N]
+"""
+
+import argparse
+import calendar
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+from backend.db.query import Predicates
+from backend.db.session import get_db_session, remove_db_session
+from backend.db.watermarks import load_watermark, save_high_water
+
+WATERMARK_NAME = "invoices"
+DEFAULT_WORKERS = 4
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _next_month_start(year: int, month: int) -> date:
+    return date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+
+
+def _client_months(db: Session, where: Predicates) -> set[tuple[int, int, int]]:
+    rows = db.execute(
+        text(
+            f"""
+            SELECT DISTINCT ClientID, YEAR(UsageDate) AS UsageYear, MONTH(UsageDate) AS UsageMonth
+            FROM Usages
+            {where.sql()}
+            """
+        ),
+        where.params,
+    ).fetchall()
+    return {(row.UsageYear, row.UsageMonth, row.ClientID) for row in rows}
+
+
+def find_pending_client_months(
+    db: Session,
+    low: datetime | None,
+    high: datetime,
+    last_run: datetime | None,
+    today: date,
+) -> dict[tuple[int, int], set[int]]:
+    """
+    Return {(year, month): client_ids} that need (re)invoicing. Only closed
+    months are invoiced; the current month is still accumulating usage.
+    """
+    open_month = _month_start(today)
+
+    if low is None:
+        # First run (or rebuild): every closed client-month
+        where = Predicates().add("UsageDate < :open_month", open_month=open_month)
+        pending = _client_months(db, where)
+    else:
+        # New or late usage since the last run
+        where = Predicates()
+        where.add("CreatedDate > :low", low=low)
+        where.lte("CreatedDate", "high", high)
+        where.add("UsageDate < :open_month", open_month=open_month)
+        pending = _client_months(db, where)
+
+        # Months that closed since the last run were skipped while still open
+        if last_run is not None and _month_start(last_run.date()) < open_month:
+            where = Predicates()
+            where.gte("UsageDate", "closed_from", _month_start(last_run.date()))
+            where.add("UsageDate < :open_month", open_month=open_month)
+            pending |= _client_months(db, where)
+
+    months: dict[tuple[int, int], set[int]] = {}
+    for year, month, client_id in pending:
+        months.setdefault((year, month), set()).add(client_id)
+    return months
+
+
+def invoice_month(year: int, month: int, client_ids: set[int]) -> dict[str, int]:
+    """
+    Upsert the month's invoices for the given clients in one transaction.
+
+    Like generate_invoices.sql there is one invoice per client, provider and
+    month, dated the last day of the month. Invoices has no ProviderID, so a
+    client-month's invoices are matched to its providers in InvoiceID order:
+    changed amounts are updated in place, and rows are only inserted or
+    deleted when the number of providers changed.
+    """
+    month_start = date(year, month, 1)
+    invoice_date = date(year, month, calendar.monthrange(year, month)[1])
+    params = {
+        "month_start": month_start,
+        "next_month": _next_month_start(year, month),
+        "invoice_date": invoice_date,
+        "client_ids": sorted(client_ids),
+    }
+    counts = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+    # Each worker thread gets its own scoped session (and pooled connection)
+    db = get_db_session()
+    try:
+        amounts: dict[int, list[Decimal]] = {client_id: [] for client_id in client_ids}
+        rows = db.execute(
+            text("""
+                SELECT u.ClientID, s.ProviderID, SUM(u.TotalCost) AS InvoiceAmount
+                FROM Usages u
+                INNER JOIN Services s ON u.ServiceID = s.ServiceID
+                WHERE u.ClientID IN :client_ids
+                  AND u.UsageDate >= :month_start
+                  AND u.UsageDate < :next_month
+                GROUP BY u.ClientID, s.ProviderID
+                ORDER BY u.ClientID, s.ProviderID
+            """).bindparams(bindparam("client_ids", expanding=True)),
+            params,
+        ).fetchall()
+        for row in rows:
+            amounts[row.ClientID].append(row.InvoiceAmount)
+
+        existing: dict[int, list[tuple[int, Decimal]]] = {client_id: [] for client_id in client_ids}
+        rows = db.execute(
+            text("""
+                SELECT InvoiceID, ClientID, InvoiceAmount
+                FROM Invoices
+                WHERE ClientID IN :client_ids
+                  AND InvoiceDate = :invoice_date
+                ORDER BY ClientID, InvoiceID
+            """).bindparams(bindparam("client_ids", expanding=True)),
+            params,
+        ).fetchall()
+        for row in rows:
+            existing[row.ClientID].append((row.InvoiceID, row.InvoiceAmount))
+
+        now = datetime.now()
+        for client_id in sorted(client_ids):
+            new_amounts = amounts[client_id]
+            old_invoices = existing[client_id]
+
+            for (invoice_id, old_amount), new_amount in zip(old_invoices, new_amounts):
+                if old_amount == new_amount:
+                    counts["unchanged"] += 1
+                    continue
+                db.execute(
+                    text("UPDATE Invoices SET InvoiceAmount = :amount WHERE InvoiceID = :invoice_id"),
+                    {"amount": new_amount, "invoice_id": invoice_id},
+                )
+                counts["updated"] += 1
+
+            for new_amount in new_amounts[len(old_invoices):]:
+                db.execute(
+                    text("""
+                        INSERT INTO Invoices (ClientID, InvoiceDate, InvoiceAmount, CreatedDate)
+                        VALUES (:client_id, :invoice_date, :amount, :created_date)
+                    """),
+                    {"client_id": client_id, "invoice_date": invoice_date, "amount": new_amount, "created_date": now},
+                )
+                counts["inserted"] += 1
+
+            for invoice_id, _ in old_invoices[len(new_amounts):]:
+                db.execute(
+                    text("DELETE FROM Invoices WHERE InvoiceID = :invoice_id"),
+                    {"invoice_id": invoice_id},
+                )
+                counts["deleted"] += 1
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        remove_db_session()
+
+    return counts
+
+
+def generate_invoices(
+    db: Session,
+    rebuild: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    today: date | None = None,
+) -> dict:
+    """
+    Invoice every pending client-month, then advance the high-water mark.
+
+    The mark only moves once every month succeeded, so a failed run is simply
+    rerun. Deleting all of a client-month's usage is not detected; use
+    rebuild=True after such corrections.
+    """
+    today = today or date.today()
+    watermark = None if rebuild else load_watermark(db, WATERMARK_NAME)
+    low = watermark.HighWater if watermark is not None else None
+    last_run = watermark.UpdatedDate if watermark is not None else None
+
+    high = db.execute(text("SELECT MAX(CreatedDate) FROM Usages")).scalar()
+    if high is None:
+        return {"high_water": low, "months": 0, "counts": {}}
+
+    pending = find_pending_client_months(db, low, high, last_run, today)
+    # Release the read transaction before the workers start writing
+    db.commit()
+
+    totals = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            pool.submit(invoice_month, year, month, client_ids)
+            for (year, month), client_ids in sorted(pending.items())
+        ]
+        for future in futures:
+            for key, count in future.result().items():
+                totals[key] += count
+
+    save_high_water(db, WATERMARK_NAME, high)
+    db.commit()
+
+    return {"high_water": high, "months": len(pending), "counts": totals}
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Generate or update monthly invoices from usage.")
+    parser.add_argument("--rebuild", action="store_true", help="recompute every closed client-month")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="months processed in parallel")
+    args = parser.parse_args(argv)
+
+    from backend import create_app
+
+    app = create_app()
+    with app.app_context():
+        result = generate_invoices(get_db_session(), rebuild=args.rebuild, workers=args.workers)
+
+    counts = ", ".join(f"{key}={count}" for key, count in result["counts"].items()) or "nothing to do"
+    print(f"Invoices current up to {result['high_water']}: {result['months']} months ({counts})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+File: rollups.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Usage rollup maintenance job. Rebuilds only the hourly, daily
+             and monthly buckets that gained Usages rows since the CreatedDate
+             high-water mark, then advances the mark in the same transaction.
+             Run from a single scheduler:
+
+                 python -m backend.jobs.rollups [--rebuild]
+"""
+
+import argparse
+from datetime import datetime
+from typing import Any
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from backend.analytics.rollups import ROLLUPS, ROLLUP_NAME, RollupGrain
+from backend.db.watermarks import load_high_water, save_high_water
+
+
+# The (ClientID, ServiceID, BucketDate) buckets that gained Usages rows. An
+# hourly bucket is refreshed with the rest of its day, which reads the day
+# once instead of once per hour.
+TOUCHED = "#RollupKeys"
+# Last UsageDate in a touched bucket; hourly and daily buckets are one day
+BUCKET_LAST_DATE = {"month": "EOMONTH(k.BucketDate)"}
+
+
+def _refresh_grain(
+    db: Session, name: str, grain: RollupGrain, low: datetime | None, high: datetime, finer: RollupGrain | None = None,
+) -> int:
+    bucket_columns = ", ".join(grain.bucket_columns)
+    bucket_exprs = tuple(expr.format(u="u") for expr in grain.bucket_exprs)
+
+    if low is None:
+        db.execute(text(f"DELETE FROM {grain.table}"))
+        result = db.execute(
+            text(
+                f"""
+                INSERT INTO {grain.table} (ClientID, ServiceID, {bucket_columns}, UnitsUsed, TotalCost, UsageCount)
+                SELECT u.ClientID, u.ServiceID, {", ".join(bucket_exprs)},
+                       SUM(u.UnitsUsed), SUM(u.TotalCost), COUNT(*)
+                FROM Usages u
+                WHERE u.CreatedDate <= :high
+                GROUP BY u.ClientID, u.ServiceID, {", ".join(bucket_exprs)}
+                """
+            ),
+            {"high": high},
+        )
+        return result.rowcount
+
+    # Collect the touched buckets once, from the rows created in (low, high]
+    # (IX_Usages_CreatedDate). The delete and insert then join to this small
+    # key set instead of testing every rollup and Usages row against the
+    # new rows.
+    db.execute(text(
+        f"CREATE TABLE {TOUCHED} (ClientID int NOT NULL, ServiceID int NOT NULL, BucketDate date NOT NULL, "
+        "PRIMARY KEY (ClientID, ServiceID, BucketDate))"
+    ))
+    db.execute(
+        text(
+            f"""
+            INSERT INTO {TOUCHED} (ClientID, ServiceID, BucketDate)
+            SELECT DISTINCT u.ClientID, u.ServiceID, {bucket_exprs[0]}
+            FROM Usages u
+            WHERE u.CreatedDate > :low
+              AND u.CreatedDate <= :high
+            """
+        ),
+        {"low": low, "high": high},
+    )
+    db.execute(
+        text(
+            f"""
+            DELETE FROM {grain.table}
+            WHERE EXISTS (
+                SELECT 1
+                FROM {TOUCHED} k
+                WHERE k.ClientID = {grain.table}.ClientID
+                  AND k.ServiceID = {grain.table}.ServiceID
+                  AND k.BucketDate = {grain.table}.BucketDate
+            )
+            """
+        )
+    )
+
+    # Recompute whole buckets (old + new rows) so reruns are idempotent. The
+    # finest grain reads them from Usages; each coarser one sums the finer
+    # rollup refreshed just before it. A key's date span is a seek on the
+    # source's (ClientID or ServiceID, date) index.
+    if finer is None:
+        source = "Usages"
+        usage_count = "COUNT(*)"
+        created = "\n            WHERE u.CreatedDate <= :high"
+    else:
+        source = f"(SELECT ClientID, ServiceID, BucketDate AS UsageDate, UnitsUsed, TotalCost, UsageCount FROM {finer.table})"
+        usage_count = "SUM(u.UsageCount)"
+        created = ""
+    result = db.execute(
+        text(
+            f"""
+            INSERT INTO {grain.table} (ClientID, ServiceID, {bucket_columns}, UnitsUsed, TotalCost, UsageCount)
+            SELECT u.ClientID, u.ServiceID, {", ".join(bucket_exprs)},
+                   SUM(u.UnitsUsed), SUM(u.TotalCost), {usage_count}
+            FROM {TOUCHED} k
+            INNER JOIN {source} u
+               ON u.ClientID = k.ClientID
+              AND u.ServiceID = k.ServiceID
+              AND u.UsageDate >= k.BucketDate
+              AND u.UsageDate <= {BUCKET_LAST_DATE.get(name, "k.BucketDate")}{created}
+            GROUP BY u.ClientID, u.ServiceID, {", ".join(bucket_exprs)}
+            """
+        ),
+        {"high": high},
+    )
+    # If a statement fails first, the caller's rollback drops it instead
+    db.execute(text(f"DROP TABLE {TOUCHED}"))
+    return result.rowcount
+
+
+def refresh_usage_rollups(db: Session, rebuild: bool = False) -> dict[str, Any]:
+    """
+    Bring every rollup up to the newest Usages.CreatedDate.
+
+    Rows are picked up by CreatedDate, so usage must not be inserted with a
+    CreatedDate at or below the current high-water mark; run with
+    rebuild=True after backfills, deletes or edits to existing Usages rows.
+    """
+    low = None if rebuild else load_high_water(db, ROLLUP_NAME)
+    high = db.execute(text("SELECT MAX(CreatedDate) FROM Usages")).scalar()
+
+    if high is None or (low is not None and high <= low):
+        return {"previous_high_water": low, "high_water": low, "buckets": {}}
+
+    try:
+        buckets = {}
+        finer = None
+        for name, grain in ROLLUPS.items():
+            buckets[name] = _refresh_grain(db, name, grain, low, high, finer)
+            finer = grain
+        save_high_water(db, ROLLUP_NAME, high)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return {"previous_high_water": low, "high_water": high, "buckets": buckets}
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Refresh the usage rollup tables.")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild every bucket from scratch")
+    args = parser.parse_args(argv)
+
+    from backend import create_app
+    from backend.db.session import get_db_session
+
+    app = create_app()
+    with app.app_context():
+        result = refresh_usage_rollups(get_db_session(), rebuild=args.rebuild)
+
+    if not result["buckets"]:
+        print(f"Rollups already current (high-water mark {result['high_water']})")
+        return
+    counts = ", ".join(f"{name}={count}" for name, count in result["buckets"].items())
+    print(f"Rollups refreshed up to {result['high_water']} ({counts} buckets written)")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,10 @@ from backend.api_http.error_handlers import register_error_handlers
 register_error_handlers(api_v1_bp)
 
 # Import route modules so they register handlers on api_v1_bp.
+from backend.routes.v1 import analytics
 from backend.routes.v1 import budgets
 from backend.routes.v1 import clients
+from backend.routes.v1 import exports
 from backend.routes.v1 import health
 from backend.routes.v1 import invoices
 from backend.routes.v1 import providers
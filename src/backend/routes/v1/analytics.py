@@ -0,0 +1,241 @@
+"""
+File: analytics.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Analytics API endpoints. Returns pre-aggregated cost figures,
+             usage rollups, waste alerts and recommendations so the dashboard
+             does not have to download and analyze raw usage rows.
+"""
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from flask import current_app, request
+from sqlalchemy import text
+from typing import cast, Any
+from backend.analytics.queries import usage_filters, load_daily_service_usage, load_services, load_client_budget
+from backend.analytics.waste import compute_waste_alerts
+from backend.analytics.recommendations import compute_recommendations
+from backend.analytics.cache import TTLCache
+from backend.analytics.rollups import ROLLUPS, coarsest_resolution, usage_source
+from backend.db.query import Predicates
+from backend.db.session import get_analytics_session, get_db_session, STREAM_RESULTS, STREAM_BATCH_SIZE
+from backend.routes.v1 import api_v1_bp
+from backend.api_http.schemas import AnalyticsFilterSchema, RecommendationFilterSchema, PagedSchema, UsageRollupSchema
+from backend.api_http.responses import ok_resource, ok_resource_list, ok_resource_stream, response_format, COLUMNAR_FORMATS
+from backend.api_http.columnar import ROLLUP_COLUMNS, ok_resource_columnar
+
+# Recommendation roadmaps keyed by (client_id, days, budget version)
+recommendation_cache = TTLCache()
+
+
+def _decimal(value) -> Decimal:
+    # SUM() over DECIMAL columns comes back as Decimal from SQL Server, but be
+    # tolerant of drivers that hand back floats or NULL for empty groups
+    if value is None:
+        return Decimal("0")
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+@api_v1_bp.get("/analytics/cost-summary")
+def get_cost_summary():
+    args = cast(dict[str, Any], AnalyticsFilterSchema().load(request.args))
+    where = usage_filters(args)
+
+    db = get_analytics_session()
+    # A daily series is needed, so the daily rollup is the coarsest that answers it
+    source, source_params = usage_source(db, "day")
+    rows = db.execute(
+        text(
+            f"""
+            SELECT u.UsageDate, s.ProviderID, p.ProviderName,
+                   SUM(u.TotalCost) AS TotalCost,
+                   SUM(u.UnitsUsed) AS UnitsUsed
+            FROM {source} u
+            INNER JOIN Services s ON s.ServiceID = u.ServiceID
+            INNER JOIN Providers p ON p.ProviderID = s.ProviderID
+            {where.sql()}
+            GROUP BY u.UsageDate, s.ProviderID, p.ProviderName
+            ORDER BY u.UsageDate
+            """
+        ),
+        {**source_params, **where.params},
+    ).fetchall()
+
+    active_services = db.execute(
+        text(
+            f"""
+            SELECT COUNT(DISTINCT u.ServiceID)
+            FROM {source} u
+            INNER JOIN Services s ON s.ServiceID = u.ServiceID
+            {where.sql()}
+            """
+        ),
+        {**source_params, **where.params},
+    ).scalar() or 0
+
+    total_cost = Decimal("0")
+    total_units = Decimal("0")
+    providers: dict[int, dict[str, Any]] = {}
+    daily: dict[date, dict[str, Any]] = {}
+
+    for usage_date, provider_id, provider_name, cost, units in rows:
+        cost = _decimal(cost)
+        units = _decimal(units)
+        total_cost += cost
+        total_units += units
+
+        provider = providers.setdefault(
+            provider_id,
+            {"provider_id": provider_id, "provider_name": provider_name, "total_cost": Decimal("0")},
+        )
+        provider["total_cost"] += cost
+
+        day = daily.setdefault(
+            usage_date,
+            {"date": usage_date.isoformat(), "total_cost": Decimal("0"), "provider_costs": {}},
+        )
+        day["total_cost"] += cost
+        day["provider_costs"][str(provider_id)] = cost
+
+    cents = Decimal("0.01")
+    day_count = len(daily) or 1
+    summary = {
+        "days": args["days"],
+        "start_date": where.params["start_date"].isoformat(),
+        "total_cost": total_cost,
+        "total_units": total_units,
+        "avg_daily_cost": (total_cost / day_count).quantize(cents),
+        "max_daily_cost": max((d["total_cost"] for d in daily.values()), default=Decimal("0")),
+        "avg_units_per_day": (total_units / day_count).quantize(cents),
+        "active_services": active_services,
+        "avg_cost_per_service": (total_cost / active_services).quantize(cents) if active_services else Decimal("0"),
+        "providers": sorted(providers.values(), key=lambda p: p["provider_id"]),
+        "daily": list(daily.values()),
+    }
+    return ok_resource(summary, "cost_summary")
+
+
+def _rollup_item(row) -> dict[str, Any]:
+    if row.BucketHour is not None:
+        bucket = datetime.combine(row.BucketDate, time(hour=row.BucketHour)).isoformat()
+    else:
+        bucket = row.BucketDate.isoformat()
+    return {
+        "bucket": bucket,
+        "client_id": row.ClientID,
+        "service_id": row.ServiceID,
+        "provider_id": row.ProviderID,
+        "units_used": _decimal(row.UnitsUsed),
+        "total_cost": _decimal(row.TotalCost),
+        "usage_count": row.UsageCount,
+    }
+
+
+@api_v1_bp.get("/analytics/usage-rollup")
+def get_usage_rollup():
+    paged_args = cast(dict[str, Any], PagedSchema().load(request.args))
+    limit = paged_args["limit"]
+    page = paged_args["page"]
+    offset = (page - 1) * limit
+
+    args = cast(dict[str, Any], UsageRollupSchema().load(request.args))
+    interval = args["interval"]
+    resolution = coarsest_resolution(args["start_date"], args["end_date"], interval)
+
+    # Monthly buckets read from the daily rollup when the range is not month aligned
+    bucket = "u.UsageDate"
+    if interval == "month" and resolution != "month":
+        bucket = ROLLUPS["month"].bucket_exprs[0].format(u="u")
+    group_by = f"{bucket}, u.UsageHour" if interval == "hour" else bucket
+
+    where = Predicates()
+    where.gte("u.UsageDate", "start_date", args["start_date"])
+    where.lte("u.UsageDate", "end_date", args["end_date"])
+    where.eq("u.ClientID", "client_id", args["client_id"])
+    where.eq("s.ProviderID", "provider_id", args["provider_id"])
+    where.eq("u.ServiceID", "service_id", args["service_id"])
+
+    db = get_analytics_session()
+    source, source_params = usage_source(db, resolution)
+    list_format = response_format()
+    result = db.execute(
+        text(
+            f"""
+            SELECT {bucket} AS BucketDate, {"u.UsageHour" if interval == "hour" else "NULL"} AS BucketHour,
+                   u.ClientID, u.ServiceID, s.ProviderID,
+                   SUM(u.UnitsUsed) AS UnitsUsed,
+                   SUM(u.TotalCost) AS TotalCost,
+                   SUM(u.UsageCount) AS UsageCount
+            FROM {source} u
+            INNER JOIN Services s ON s.ServiceID = u.ServiceID
+            {where.sql()}
+            GROUP BY {group_by}, u.ClientID, u.ServiceID, s.ProviderID
+            ORDER BY {group_by}, u.ClientID, u.ServiceID
+            OFFSET :offset ROWS
+            FETCH NEXT :limit ROWS ONLY
+            """
+        ),
+        {
+            "limit": limit,
+            "offset": offset,
+            **source_params,
+            **where.params,
+        },
+        execution_options=STREAM_RESULTS if list_format != "json" else {},
+    )
+    if list_format == "ndjson":
+        return ok_resource_stream(result.yield_per(STREAM_BATCH_SIZE), _rollup_item, "usage_rollup", limit)
+    if list_format in COLUMNAR_FORMATS:
+        return ok_resource_columnar(result, ROLLUP_COLUMNS, "usage_rollup", limit, list_format)
+
+    rollup = [_rollup_item(row) for row in result.fetchall()]
+    return ok_resource_list(rollup, "usage_rollup")
+
+
+@api_v1_bp.get("/analytics/waste-alerts")
+def get_waste_alerts():
+    args = cast(dict[str, Any], AnalyticsFilterSchema().load(request.args))
+    where = usage_filters(args)
+
+    # Budgets are edited through the API, so they are read from the database
+    db = get_analytics_session()
+    daily_rows = load_daily_service_usage(db, where)
+    services = load_services(db)
+    budget = load_client_budget(get_db_session(), args["client_id"])
+
+    result = compute_waste_alerts(daily_rows, services, budget)
+    return ok_resource(result, "waste_alerts")
+
+
+def _budget_version(budget: dict[str, Any] | None) -> tuple | None:
+    # A budget PATCH changes these values, which moves the request to a fresh
+    # cache entry instead of serving a roadmap built on the old target
+    if budget is None:
+        return None
+    return (
+        budget["budget_id"],
+        str(budget["budget_amount"]),
+        str(budget["monthly_limit"]),
+        str(budget["alert_threshold"]),
+        bool(budget["alert_enabled"]),
+    )
+
+
+@api_v1_bp.get("/analytics/recommendations")
+def get_recommendations():
+    args = cast(dict[str, Any], RecommendationFilterSchema().load(request.args))
+
+    budget = load_client_budget(get_db_session(), args["client_id"])
+
+    cache_key = (args["client_id"], args["days"], _budget_version(budget))
+    result = recommendation_cache.get(cache_key)
+    if result is None:
+        where = usage_filters(args)
+        db = get_analytics_session()
+        services = load_services(db)
+        waste = compute_waste_alerts(load_daily_service_usage(db, where), services, budget)
+        result = compute_recommendations(waste["alerts"], services, waste["summary"])
+        recommendation_cache.set(cache_key, result, current_app.config["ANALYTICS_CACHE_TTL"])
+
+    return ok_resource(result, "recommendations")
@@ -0,0 +1,65 @@
+"""
+File: exports.py
+Project: Cloud Cost Intelligence Platform
+Author: Sean Kellner (Backend Lead)
+Created: Feburary 2026
+Description: Export API endpoints. Streams the dashboard's CSV workbook
+             straight from the database cursor, with client, service and
+             provider names joined from the in-process dimension cache.
+"""
+
+from datetime import date
+from flask import current_app, request
+from sqlalchemy import text
+from typing import cast, Any
+from werkzeug.utils import secure_filename
+from backend.analytics.dimensions import load_dimensions
+from backend.analytics.workbook import HEADERS, workbook_rows
+from backend.db.query import Predicates
+from backend.db.session import get_db_session, STREAM_RESULTS, STREAM_BATCH_SIZE
+from backend.routes.v1 import api_v1_bp
+from backend.api_http.schemas import UsageExportSchema
+from backend.api_http.responses import csv_stream
+
+
+@api_v1_bp.get("/exports/usages.csv")
+def export_usages_csv():
+    args = cast(dict[str, Any], UsageExportSchema().load(request.args))
+
+    where = Predicates()
+    where.gte("u.UsageDate", "start_date", args["start_date"])
+    where.lte("u.UsageDate", "end_date", args["end_date"])
+    where.eq("u.ClientID", "client_id", args["client_id"])
+    where.eq("s.ProviderID", "provider_id", args["provider_id"])
+    where.eq("u.ServiceID", "service_id", args["service_id"])
+
+    db = get_db_session()
+    dims = load_dimensions(db, current_app.config["DIMENSION_CACHE_TTL"])
+
+    # Date order lets the workbook compute rolling metrics one day at a time
+    result = db.execute(
+        text(
+            f"""
+            SELECT u.UsageID, u.ClientID, u.ServiceID, u.UsageDate, u.UnitsUsed, u.TotalCost
+            FROM Usages u
+            INNER JOIN Services s ON s.ServiceID = u.ServiceID
+            {where.sql()}
+            ORDER BY u.UsageDate, u.ClientID, u.UsageID DESC
+            """
+        ),
+        where.params,
+        execution_options=STREAM_RESULTS,
+    )
+
+    # Client names can hold anything; the Content-Disposition header takes
+    # Latin-1 only, and quotes, ; or line breaks would break it
+    client_id = args["client_id"]
+    if client_id is None:
+        client_label = "all-clients"
+    else:
+        client_label = secure_filename(dims.clients.get(client_id) or "") or f"client-{client_id}"
+    start = args["start_date"].isoformat() if args["start_date"] else "start"
+    end = (args["end_date"] or date.today()).isoformat()
+    filename = f"cost-workbook-{client_label}-{start}-to-{end}.csv"
+
+    return csv_stream(HEADERS, workbook_rows(result.yield_per(STREAM_BATCH_SIZE), dims), filename)
@@ -7,9 +7,17 @@ Description: Health check endpoints. Returns API status and database
              connectivity status for monitoring and testing.
 """
 
+from typing import Any, cast
+from flask import current_app, request
 from sqlalchemy import text
+from backend.db.engine import REPLICA, engine_configured, engine_created, get_engine, get_pool_controller
+from backend.db.replica import replica_health
 from backend.db.session import get_db_session
+from backend.db.snapshot import analytics_snapshot
+from backend.db.statements import statement_metrics
+from backend.db.warmup import pool_warmup
 from backend.api_http.responses import ok, error
+from backend.api_http.schemas import SqlStatsSchema
 from . import api_v1_bp
 
 @api_v1_bp.get("/health")
@@ -21,5 +29,59 @@ def health_db():
     db = get_db_session()
     db.execute(text("SELECT 1"))
     return ok(
-        meta={"db": "connected"},
+        # "replica" when the read replica answered, "primary" otherwise
+        meta={"db": "connected", "role": db.info["role"]},
     )
+
+@api_v1_bp.get("/health/ready")
+def health_ready():
+    # Without warm-up the instance is ready immediately; the pool fills on demand
+    if not current_app.config["SQL_POOL_WARMUP"]:
+        return ok(meta={"ready": True, "pool": pool_warmup.status()})
+
+    status = pool_warmup.status()
+    if status["state"] == "warm":
+        return ok(meta={"ready": True, "pool": status})
+
+    if status["state"] == "failed":
+        # Try again on the next probe, e.g. after a transient login failure
+        pool_warmup.start(current_app.config["SQL_POOL_SIZE"])
+
+    return error(
+        type="not_ready",
+        message="Database connection pool is still warming up.",
+        details={"pool": status},
+        status_code=503,
+    )
+
+@api_v1_bp.get("/health/pool")
+def health_pool():
+    # Reading metrics must not build an engine (and fetch a token) itself
+    if engine_created():
+        pool = get_engine().pool
+        meta = {"pool": pool.metrics.snapshot(pool), "engine": "created"}
+    else:
+        meta = {"pool": None, "engine": "not_created"}
+
+    controller = get_pool_controller()
+    if controller is not None:
+        meta["adaptive"] = controller.snapshot()
+
+    if engine_configured(REPLICA):
+        replica_pool = get_engine(REPLICA).pool if engine_created(REPLICA) else None
+        meta["replica"] = {
+            **replica_health.status(),
+            "pool": replica_pool.metrics.snapshot(replica_pool) if replica_pool is not None else None,
+        }
+    return ok(meta=meta)
+
+@api_v1_bp.get("/health/analytics")
+def health_analytics():
+    # "ready" once the analytics endpoints read from the DuckDB snapshot
+    return ok(meta={"snapshot": analytics_snapshot.status()})
+
+@api_v1_bp.get("/health/sql")
+def health_sql():
+    # This worker's statements since it started, heaviest first
+    args = cast(dict[str, Any], SqlStatsSchema().load(request.args))
+    return ok(meta={"sql": statement_metrics.status(args["top"], args["order"])})
@@ -9,57 +9,78 @@ Description: Invoices API endpoint. Returns invoice records for billing
 
 from flask import request
 from sqlalchemy import text
-from typing import cast
-from backend.db.session import get_db_session
+from typing import cast, Any
+from backend.db.query import Predicates
+from backend.db.session import get_db_session, STREAM_RESULTS, STREAM_BATCH_SIZE
 from backend.routes.v1 import api_v1_bp
-from backend.api_http.schemas import PagedSchema, DateRangeSchema
-from backend.api_http.responses import ok_resource, ok_resource_list, error_resource_missing
+from backend.api_http.schemas import CursorPagedSchema, DateRangeSchema
+from backend.api_http.cursors import encode_cursor
+from backend.api_http.serializers import invoice_item
+from backend.api_http.responses import ok_resource, ok_resource_list, ok_resource_stream, response_format, COLUMNAR_FORMATS, error_resource_missing
+from backend.api_http.columnar import INVOICE_COLUMNS, next_page_cursor, ok_resource_columnar
 
 @api_v1_bp.get("/invoices")
 def get_invoices():
-    paged_args = cast(dict[str, int], PagedSchema().load(request.args))
+    paged_args = cast(dict[str, Any], CursorPagedSchema().load(request.args))
     limit = paged_args["limit"]
     page = paged_args["page"]
-    offset = (page - 1) * limit
+    cursor = paged_args["cursor"]
+    offset = 0 if cursor is not None else (page - 1) * limit
 
     date_args = cast(dict[str, object], DateRangeSchema().load(request.args))
     start_date = date_args["start_date"]
     end_date = date_args["end_date"]
 
+    where = Predicates()
+    where.gte("InvoiceDate", "start_date", start_date)
+    where.lte("InvoiceDate", "end_date", end_date)
+    # Seek past the last row of the previous page instead of skipping rows
+    where.seek_before("InvoiceDate", "InvoiceID", cursor)
+
     db = get_db_session()
-    rows = db.execute(
+    list_format = response_format()
+    next_cursor = None
+    if list_format in COLUMNAR_FORMATS:
+        next_cursor = next_page_cursor(db, "Invoices", "InvoiceDate", "InvoiceID", where, offset, limit)
+    result = db.execute(
         text(
-            """
+            f"""
             SELECT InvoiceID, ClientID, InvoiceDate, InvoiceAmount, CreatedDate
             FROM Invoices
-            WHERE (:start_date IS NULL OR InvoiceDate >= :start_date)
-              AND (:end_date   IS NULL OR InvoiceDate <= :end_date)
+            {where.sql()}
             ORDER BY InvoiceDate DESC, InvoiceID DESC
             OFFSET :offset ROWS
             FETCH NEXT :limit ROWS ONLY
             """
         ),
         {
-            "limit": limit,
+            # Fetch one extra row to know whether another page exists
+            "limit": limit + 1,
             "offset": offset,
-            "start_date": start_date,
-            "end_date": end_date,
+            **where.params,
         },
-    ).fetchall()
-
-    invoices = []
-    for invoice_id, client_id, invoice_date, invoice_amount, created_date in rows:
-        invoices.append(
-            {
-                "invoice_id": invoice_id,
-                "client_id": client_id,
-                "invoice_date": invoice_date.isoformat() if invoice_date else None,
-                "invoice_amount": invoice_amount,
-                "created_date": created_date.isoformat() if created_date else None,
-            }
+        execution_options=STREAM_RESULTS if list_format != "json" else {},
+    )
+    if list_format == "ndjson":
+        return ok_resource_stream(
+            result.yield_per(STREAM_BATCH_SIZE),
+            invoice_item,
+            "invoice",
+            limit,
+            cursor_of=lambda row: encode_cursor(row.InvoiceDate, row.InvoiceID),
         )
+    if list_format in COLUMNAR_FORMATS:
+        return ok_resource_columnar(result, INVOICE_COLUMNS, "invoice", limit, list_format, next_cursor=next_cursor)
+
+    rows = result.fetchall()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].InvoiceDate, rows[-1].InvoiceID)
+
+    invoices = [invoice_item(row) for row in rows]
 
-    return ok_resource_list(invoices, "invoice")
+    return ok_resource_list(invoices, "invoice", next_cursor=next_cursor)
 
 
 @api_v1_bp.get("/invoices/<int:invoice_id>")
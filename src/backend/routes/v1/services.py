@@ -9,11 +9,15 @@ Description: Services API endpoint. Returns cloud service records with
 
 from flask import request
 from sqlalchemy import text
-from typing import cast
-from backend.db.session import get_db_session
+from typing import cast, Any
+from backend.db.query import Predicates
+from backend.db.session import get_db_session, STREAM_RESULTS, STREAM_BATCH_SIZE
 from backend.routes.v1 import api_v1_bp
-from backend.api_http.schemas import PagedSchema, DateRangeSchema
-from backend.api_http.responses import ok_resource, ok_resource_list, error_resource_missing
+from backend.api_http.schemas import PagedSchema, CursorPagedSchema, DateRangeSchema
+from backend.api_http.cursors import encode_cursor
+from backend.api_http.serializers import usage_item
+from backend.api_http.responses import ok_resource, ok_resource_list, ok_resource_stream, response_format, COLUMNAR_FORMATS, error_resource_missing
+from backend.api_http.columnar import USAGE_COLUMNS, next_page_cursor, ok_resource_columnar
 
 @api_v1_bp.get("/services")
 def get_services():
@@ -91,54 +95,67 @@ def get_service(service_id: int):
 
 @api_v1_bp.get("/services/<int:service_id>/usages")
 def get_service_usages(service_id: int):
-    paged_args = cast(dict[str, int], PagedSchema().load(request.args))
+    paged_args = cast(dict[str, Any], CursorPagedSchema().load(request.args))
     limit = paged_args["limit"]
     page = paged_args["page"]
-    offset = (page - 1) * limit
+    cursor = paged_args["cursor"]
+    offset = 0 if cursor is not None else (page - 1) * limit
 
     date_args = cast(dict[str, object], DateRangeSchema().load(request.args))
     start_date = date_args["start_date"]
     end_date = date_args["end_date"]
 
+    where = Predicates()
+    where.eq("ServiceID", "service_id", service_id)
+    where.gte("UsageDate", "start_date", start_date)
+    where.lte("UsageDate", "end_date", end_date)
+    # Seek past the last row of the previous page instead of skipping rows
+    where.seek_before("UsageDate", "UsageID", cursor)
+
     db = get_db_session()
-    rows = db.execute(
+    list_format = response_format()
+    next_cursor = None
+    if list_format in COLUMNAR_FORMATS:
+        next_cursor = next_page_cursor(db, "Usages", "UsageDate", "UsageID", where, offset, limit)
+    result = db.execute(
         text(
-            """
+            f"""
             SELECT UsageID, ClientID, ServiceID, UsageDate, UsageTime, UnitsUsed, TotalCost, CreatedDate
             FROM Usages
-            WHERE ServiceID = :service_id
-              AND (:start_date IS NULL OR UsageDate >= :start_date)
-              AND (:end_date   IS NULL OR UsageDate <= :end_date)
+            {where.sql()}
             ORDER BY UsageDate DESC, UsageID DESC
             OFFSET :offset ROWS
             FETCH NEXT :limit ROWS ONLY
             """
         ),
         {
-            "service_id": service_id,
-            "limit": limit,
+            # Fetch one extra row to know whether another page exists
+            "limit": limit + 1,
             "offset": offset,
-            "start_date": start_date,
-            "end_date": end_date,
+            **where.params,
         },
-    ).fetchall()
-
-    usages = []
-    for usage_id, client_id, service_id, usage_date, usage_time, units_used, total_cost, created_date in rows:
-        usages.append(
-            {
-                "usage_id": usage_id,
-                "client_id": client_id,
-                "service_id": service_id,
-                "usage_date": usage_date.isoformat() if usage_date else None,
-                "usage_time": usage_time.isoformat() if usage_time else None,
-                "units_used": units_used,
-                "total_cost": total_cost,
-                "created_date": created_date.isoformat() if created_date else None,
-            }
+        execution_options=STREAM_RESULTS if list_format != "json" else {},
+    )
+    if list_format == "ndjson":
+        return ok_resource_stream(
+            result.yield_per(STREAM_BATCH_SIZE),
+            usage_item,
+            "usage",
+            limit,
+            cursor_of=lambda row: encode_cursor(row.UsageDate, row.UsageID),
         )
+    if list_format in COLUMNAR_FORMATS:
+        return ok_resource_columnar(result, USAGE_COLUMNS, "usage", limit, list_format, next_cursor=next_cursor)
+
+    rows = result.fetchall()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].UsageDate, rows[-1].UsageID)
+
+    usages = [usage_item(row) for row in rows]
 
-    return ok_resource_list(usages, "usage")
+    return ok_resource_list(usages, "usage", next_cursor=next_cursor)
 
 
 @api_v1_bp.get("/services/<int:service_id>/usages/<int:usage_id>")
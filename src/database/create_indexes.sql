@@ -0,0 +1,35 @@
+-- =====================================================================
+-- Script: Create Indexes
+-- Purpose: Support keyset (cursor) pagination on the large list endpoints
+-- Description: The API lists usages and invoices newest-first and pages
+--              with a seek predicate on the sort key, e.g.
+--                  UsageDate <= @d AND (UsageDate < @d OR UsageID < @id)
+--              These indexes match that sort order so SQL Server can seek
+--              straight to the cursor position instead of scanning and
+--              discarding every earlier row the way OFFSET does.
+-- =====================================================================
+
+-- /usages
+CREATE INDEX IX_Usages_UsageDate_UsageID
+    ON dbo.Usages (UsageDate DESC, UsageID DESC)
+    INCLUDE (ClientID, ServiceID, UsageTime, UnitsUsed, TotalCost, CreatedDate);
+
+-- /clients/{clientId}/usages
+CREATE INDEX IX_Usages_ClientID_UsageDate_UsageID
+    ON dbo.Usages (ClientID, UsageDate DESC, UsageID DESC)
+    INCLUDE (ServiceID, UsageTime, UnitsUsed, TotalCost, CreatedDate);
+
+-- /services/{serviceId}/usages
+CREATE INDEX IX_Usages_ServiceID_UsageDate_UsageID
+    ON dbo.Usages (ServiceID, UsageDate DESC, UsageID DESC)
+    INCLUDE (ClientID, UsageTime, UnitsUsed, TotalCost, CreatedDate);
+
+-- /invoices
+CREATE INDEX IX_Invoices_InvoiceDate_InvoiceID
+    ON dbo.Invoices (InvoiceDate DESC, InvoiceID DESC)
+    INCLUDE (ClientID, InvoiceAmount, CreatedDate);
+
+-- /clients/{clientId}/invoices
+CREATE INDEX IX_Invoices_ClientID_InvoiceDate_InvoiceID
+    ON dbo.Invoices (ClientID, InvoiceDate DESC, InvoiceID DESC)
+    INCLUDE (InvoiceAmount, CreatedDate);
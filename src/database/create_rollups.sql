@@ -0,0 +1,61 @@
+-- =====================================================================
+-- Script: Create Rollups
+-- Purpose: Pre-aggregated usage tables for the analytics endpoints
+-- Description: Usage summed per (ClientID, ServiceID, bucket) at hourly,
+--              daily and monthly grain. The tables are filled and kept up
+--              to date by the backend maintenance job
+--                  python -m backend.jobs.rollups
+--              which only rebuilds buckets that gained Usages rows since
+--              the CreatedDate high-water mark in RollupWatermarks.
+-- =====================================================================
+
+CREATE TABLE dbo.UsageRollupHourly (
+    ClientID    int            NOT NULL,
+    ServiceID   int            NOT NULL,
+    BucketDate  date           NOT NULL,
+    BucketHour  tinyint        NOT NULL,
+    UnitsUsed   decimal(18, 2) NOT NULL,
+    TotalCost   decimal(18, 2) NOT NULL,
+    UsageCount  int            NOT NULL,
+    CONSTRAINT PK_UsageRollupHourly PRIMARY KEY (ClientID, ServiceID, BucketDate, BucketHour)
+);
+
+CREATE TABLE dbo.UsageRollupDaily (
+    ClientID    int            NOT NULL,
+    ServiceID   int            NOT NULL,
+    BucketDate  date           NOT NULL,
+    UnitsUsed   decimal(18, 2) NOT NULL,
+    TotalCost   decimal(18, 2) NOT NULL,
+    UsageCount  int            NOT NULL,
+    CONSTRAINT PK_UsageRollupDaily PRIMARY KEY (ClientID, ServiceID, BucketDate)
+);
+
+-- BucketDate is the first day of the month
+CREATE TABLE dbo.UsageRollupMonthly (
+    ClientID    int            NOT NULL,
+    ServiceID   int            NOT NULL,
+    BucketDate  date           NOT NULL,
+    UnitsUsed   decimal(18, 2) NOT NULL,
+    TotalCost   decimal(18, 2) NOT NULL,
+    UsageCount  int            NOT NULL,
+    CONSTRAINT PK_UsageRollupMonthly PRIMARY KEY (ClientID, ServiceID, BucketDate)
+);
+
+-- Date-range reads across all clients (dashboard with no client filter)
+CREATE INDEX IX_UsageRollupDaily_BucketDate
+    ON dbo.UsageRollupDaily (BucketDate)
+    INCLUDE (ClientID, ServiceID, UnitsUsed, TotalCost, UsageCount);
+
+-- Per-job high-water marks: every Usages row with CreatedDate <= HighWater
+-- has been processed (RollupName 'usage_rollups', 'invoices')
+CREATE TABLE dbo.RollupWatermarks (
+    RollupName  varchar(50) NOT NULL,
+    HighWater   datetime    NOT NULL,
+    UpdatedDate datetime    NOT NULL,
+    CONSTRAINT PK_RollupWatermarks PRIMARY KEY (RollupName)
+);
+
+-- Finds the rows added since the last refresh without scanning Usages
+CREATE INDEX IX_Usages_CreatedDate
+    ON dbo.Usages (CreatedDate)
+    INCLUDE (ClientID, ServiceID, UsageDate, UsageTime);
@@ -6,6 +6,8 @@
 --              based on their aggregated service usage costs by provider.
 --              It groups usage records by client, provider, year, and month,
 --              then creates invoice records with the total cost for each period.
+-- NOTE: Superseded by the incremental job `python -m backend.jobs.invoices`.
+--       This script always inserts, so rerunning it duplicates invoices.
 -- =====================================================================
 
 ;WITH MonthlyUsage AS (
@@ -123,7 +123,7 @@ function transformBackendResponse(data) {
     }
     
     // Handle array response wrapped in API format
-    if (data.status === 'ok') {
+    if (data.status === 'ok' && Array.isArray(data.data)) {
         data.data = data.data.map(item => transformSingleItem(item));
     }
 
@@ -356,7 +356,7 @@ async function checkHealth() {
 
 /**
  * Fetch and aggregate cost data for all dashboard views.
- * Called by loadDashboard(), getWasteAlerts(), getRecommendations(), and exportData().
+ * Called by getCostSummary() (browser fallback), getWasteAlerts(), getRecommendations(), and exportData().
  *
  * NOTE: Return values totalCost/awsCost/azureCost/gcpCost/trendData are provided
  * for convenience but dashboard.js recalculates these from usages via
@@ -442,6 +442,98 @@ async function getDashboardData(days = 30) {
     }
 }
 
+/**
+ * Fetch server-side cost aggregates from /analytics/cost-summary.
+ * The backend sums totals, per-provider and per-day costs with GROUP BY,
+ * so only a few KB come back instead of every usage row in the window.
+ *
+ * Falls back to aggregating raw usages in the browser (getDashboardData +
+ * calculateDashboardMetrics) when mock data is enabled or the call fails.
+ *
+ * @param {number} days - lookback window (default 30)
+ * @param {Object} filters - { clientId, providerId, serviceId }
+ * @returns {Object} same shape as calculateDashboardMetrics() minus raw usages
+ */
+async function getCostSummary(days = 30, filters = {}) {
+    if (!API_CONFIG.USE_MOCK_DATA) {
+        try {
+            const apiResponse = await fetchFromApi(ENDPOINTS.COST_SUMMARY, {
+                days,
+                client_id: filters.clientId,
+                provider_id: filters.providerId,
+                service_id: filters.serviceId,
+            });
+            return transformCostSummary(apiResponse.data);
+        } catch (error) {
+            console.warn('Cost summary failed, aggregating usages in the browser');
+        }
+    }
+
+    const dashData = await getDashboardData(days);
+    let usages = dashData.usages;
+    if (filters.clientId) {
+        usages = usages.filter(u => u.client_id === parseInt(filters.clientId));
+    }
+    if (filters.serviceId) {
+        usages = usages.filter(u => u.service_id === parseInt(filters.serviceId));
+    } else if (filters.providerId) {
+        const providerServiceIds = new Set(dashData.services
+            .filter(s => s.provider_id === parseInt(filters.providerId))
+            .map(s => s.service_id));
+        usages = usages.filter(u => providerServiceIds.has(u.service_id));
+    }
+    return calculateDashboardMetrics(usages, dashData.services, dashData.providers);
+}
+
+/**
+ * Convert a /analytics/cost-summary payload into the metrics shape
+ * used by updateDashboardUI() and renderTrendChart().
+ */
+function transformCostSummary(summary) {
+    const providerCost = (providerId) => {
+        const provider = (summary.providers || []).find(p => p.provider_id === providerId);
+        return provider ? parseNumericValue(provider.total_cost) : 0;
+    };
+
+    const trendData = (summary.daily || []).map(day => ({
+        date: day.date,
+        total: parseNumericValue(day.total_cost),
+        aws: parseNumericValue(day.provider_costs[PROVIDER_IDS.AWS]),
+        azure: parseNumericValue(day.provider_costs[PROVIDER_IDS.AZURE]),
+        gcp: parseNumericValue(day.provider_costs[PROVIDER_IDS.GCP]),
+    }));
+
+    return {
+        totalCost: parseNumericValue(summary.total_cost),
+        awsCost: providerCost(PROVIDER_IDS.AWS),
+        azureCost: providerCost(PROVIDER_IDS.AZURE),
+        gcpCost: providerCost(PROVIDER_IDS.GCP),
+        trendData,
+        avgDailyCost: parseNumericValue(summary.avg_daily_cost),
+        maxDailyCost: parseNumericValue(summary.max_daily_cost),
+        activeServices: parseNumericValue(summary.active_services),
+        avgCostPerService: parseNumericValue(summary.avg_cost_per_service),
+        totalUnitsUsed: parseNumericValue(summary.total_units),
+        avgUnitsPerDay: parseNumericValue(summary.avg_units_per_day),
+    };
+}
+
+/**
+ * Dashboard entry point: cost summary plus the service/provider lists
+ * needed by the filter dropdowns, fetched in parallel.
+ *
+ * @param {number} days - lookback window (default 30)
+ * @returns {Object} cost summary metrics + { services[], providers[] }
+ */
+async function getDashboardSummary(days = 30) {
+    const [summary, services, providers] = await Promise.all([
+        getCostSummary(days),
+        getServices(),
+        getProviders(),
+    ]);
+    return { ...summary, services, providers };
+}
+
 /**
  * Get waste alerts using the analysis engine from analysis.js.
  * Fetches usages, services, providers, and budgets, then runs computeWasteAlerts().
@@ -456,13 +548,65 @@ async function getDashboardData(days = 30) {
 // ═══════════════════════════════════════════════════════════════════════════
 
 /**
- * Fetch data and compute waste alerts using the analysis engine.
+ * Fetch waste alerts computed by the backend engine (/analytics/waste-alerts).
+ * The analysis runs next to the data, so no raw usages are downloaded.
+ * Falls back to the in-browser engine when mock data is enabled or the call fails.
+ *
+ * @param {Object} filters - { clientId, providerId, serviceId } from navbar/drawer
+ * @returns {Object} { alerts[], summary{} } in the computeWasteAlerts() shape
+ */
+async function getWasteAlerts(filters = {}) {
+    if (!API_CONFIG.USE_MOCK_DATA) {
+        try {
+            const apiResponse = await fetchFromApi(ENDPOINTS.WASTE_ALERTS, {
+                days: 30,
+                client_id: filters.clientId,
+                provider_id: filters.providerId,
+                service_id: filters.serviceId,
+            });
+            return transformWasteAlerts(apiResponse.data);
+        } catch (error) {
+            console.warn('Waste alerts API failed, computing in the browser');
+        }
+    }
+    return computeWasteAlertsInBrowser(filters);
+}
+
+/**
+ * Convert a /analytics/waste-alerts payload (snake_case summary) into the
+ * camelCase summary shape that computeWasteAlerts() returns.
+ */
+function transformWasteAlerts(result) {
+    const s = result.summary || {};
+    return {
+        alerts: result.alerts || [],
+        summary: {
+            totalMonthlyCost: s.total_monthly_cost,
+            totalSavings: s.total_savings,
+            criticalCount: s.critical_count,
+            warningCount: s.warning_count,
+            budgetAmount: s.budget_amount,
+            monthlyLimit: s.monthly_limit,
+            alertThreshold: s.alert_threshold,
+            overBudget: s.over_budget,
+            overBudgetAmount: s.over_budget_amount,
+            providerCosts: s.provider_costs || {},
+            providerCount: s.provider_count,
+            topProvider: s.top_provider,
+            topProviderPct: s.top_provider_pct,
+            categorySpend: s.category_spend || {},
+        },
+    };
+}
+
+/**
+ * Fetch raw usages and compute waste alerts with analysis.js.
  * Applies client/provider/service filters before analysis.
  *
  * @param {Object} filters - { clientId, providerId, serviceId } from navbar/drawer
  * @returns {Object} { alerts[], summary{} } from computeWasteAlerts()
  */
-async function getWasteAlerts(filters = {}) {
+async function computeWasteAlertsInBrowser(filters = {}) {
     try {
         const [dashData, budgets] = await Promise.all([
             getDashboardData(30),
@@ -500,7 +644,98 @@ async function getWasteAlerts(filters = {}) {
 }
 
 /**
- * Get optimization recommendations using the analysis engine.
+ * Fetch the phased savings roadmap computed by the backend engine
+ * (/analytics/recommendations) in one compact response instead of
+ * downloading a year of raw usages.
+ * Falls back to the in-browser engine when mock data is enabled or the call fails.
+ *
+ * Provider/service filters are intentionally not sent: recommendations must
+ * evaluate ALL services to find cross-provider optimization opportunities.
+ *
+ * @param {Object} filters - { clientId, providerId, serviceId }
+ * @returns {Object} { phases, totals } in the computeRecommendations() shape
+ */
+async function getRecommendations(filters = {}) {
+    if (!API_CONFIG.USE_MOCK_DATA) {
+        try {
+            const apiResponse = await fetchFromApi(ENDPOINTS.RECOMMENDATIONS, {
+                days: 365,
+                client_id: filters.clientId,
+            });
+            return transformRecommendations(apiResponse.data);
+        } catch (error) {
+            console.warn('Recommendations API failed, computing in the browser');
+        }
+    }
+    return computeRecommendationsInBrowser(filters);
+}
+
+/**
+ * Start a download of the CSV workbook from /exports/usages.csv.
+ *
+ * The server streams the file from the database cursor, and the browser
+ * saves it straight to disk (Content-Disposition: attachment), so large
+ * exports are never held in page memory. Uses the dashboard's window
+ * (usage dated on or after today - days). As in the in-browser export, the
+ * provider filter is ignored when a service is selected.
+ *
+ * @param {number} days - Dashboard date range
+ * @param {Object} filters - { clientId, providerId, serviceId }
+ */
+function downloadUsageExport(days, filters = {}) {
+    const cutoffDate = new Date();
+    cutoffDate.setDate(cutoffDate.getDate() - days);
+
+    const a = document.createElement('a');
+    a.href = getApiUrl(ENDPOINTS.EXPORT_USAGES_CSV, {
+        start_date: cutoffDate.toISOString().split('T')[0],
+        client_id: filters.clientId,
+        provider_id: filters.serviceId ? null : filters.providerId,
+        service_id: filters.serviceId,
+    });
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
+}
+
+/**
+ * Convert a /analytics/recommendations payload (snake_case phase and total
+ * fields) into the camelCase shape that computeRecommendations() returns.
+ * Recommendation items already use snake_case keys in both engines.
+ */
+function transformRecommendations(result) {
+    const phases = {};
+    Object.entries(result.phases || {}).forEach(([p, phase]) => {
+        phases[p] = {
+            label: phase.label,
+            tag: phase.tag,
+            tagClass: phase.tag_class,
+            description: phase.description,
+            savings: phase.savings,
+            upfront: phase.upfront,
+            hours: phase.hours,
+            downtime: phase.downtime,
+            payback: phase.payback,
+            budgetAmount: phase.budget_amount,
+            spendBefore: phase.spend_before,
+            spendAfter: phase.spend_after,
+            items: phase.items || [],
+            skipped: phase.skipped || false,
+            skipReason: phase.skip_reason,
+        };
+    });
+
+    const t = result.totals || {};
+    const totals = { savings: t.savings, upfront: t.upfront, hours: t.hours };
+    if (t.budget_shortfall !== undefined) {
+        totals.budgetShortfall = t.budget_shortfall;
+        totals.recommendedBudget = t.recommended_budget;
+    }
+    return { phases, totals };
+}
+
+/**
+ * Compute optimization recommendations in the browser with analysis.js.
  * Builds on waste alerts, then runs computeRecommendations().
  *
  * KEY DESIGN DECISIONS:
@@ -513,7 +748,7 @@ async function getWasteAlerts(filters = {}) {
  * @param {Object} filters - { clientId, providerId, serviceId }
  * @returns {Object} { phases, totals } from computeRecommendations
  */
-async function getRecommendations(filters = {}) {
+async function computeRecommendationsInBrowser(filters = {}) {
     try {
         const [dashData, budgets] = await Promise.all([
             getDashboardData(365),
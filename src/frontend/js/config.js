@@ -25,6 +25,10 @@ const ENDPOINTS = {
     USAGES: '/usages',
     BUDGETS: '/budgets',
     INVOICES: '/invoices',
+    COST_SUMMARY: '/analytics/cost-summary',
+    WASTE_ALERTS: '/analytics/waste-alerts',
+    RECOMMENDATIONS: '/analytics/recommendations',
+    EXPORT_USAGES_CSV: '/exports/usages.csv',
 };
 
 // Build full URL for an endpoint
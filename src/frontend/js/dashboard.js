@@ -11,7 +11,8 @@
  * Dependencies (loaded via <script> tags before this file):
  *   config.js  - API_CONFIG, ENDPOINTS, PROVIDER_IDS, CHART_COLORS
  *   utils.js   - formatCurrency, formatDate, formatPercentage, groupBy, exportToCSV, showError
- *   api.js     - getDashboardData, getWasteAlerts, getRecommendations, getBudgets, patchBudget
+ *   api.js     - getDashboardData, getWasteAlerts, getRecommendations, getBudgets, patchBudget,
+ *                downloadUsageExport
  *   analysis.js - computeWasteAlerts, computeRecommendations, getBudgetForClient
  *
  * FR Coverage:
@@ -224,18 +225,15 @@ async function loadDashboard(skipRender = false) {
         document.getElementById('total-units-used').textContent = '...';
         document.getElementById('avg-units-per-day').textContent = '...';
         
-        // Fetch dashboard data
-        const data = await getDashboardData(currentDateRange);
+        // Fetch server-side cost summary (including FR-08 resource metrics)
+        const data = await getDashboardSummary(currentDateRange);
         
-        // Cache the unfiltered data for filtering
+        // Cache the unfiltered summary so clearing filters needs no refetch
         unfilteredDashboardData = data;
         
-        // Calculate metrics (including FR-08 resource metrics)
-        const metricsData = calculateDashboardMetrics(data.usages, data.services, data.providers);
-        
         // Update UI (skip if filters will be applied immediately after)
         if (!skipRender) {
-            updateDashboardUI(metricsData);
+            updateDashboardUI(data);
         }
         
         // Update cost period display
@@ -318,8 +316,8 @@ async function populateFilters(services = null, providers = null) {
 }
 
 /**
- * Apply active client/provider/service filters to cached dashboard data (FR-03).
- * Filters usages client-side from unfilteredDashboardData, recalculates metrics,
+ * Apply active client/provider/service filters to the dashboard (FR-03).
+ * Requests a filtered cost summary from the backend, re-renders metrics,
  * and cascades to waste alerts / recommendations if those pages are active.
  */
 async function applyFilters() {
@@ -336,12 +334,7 @@ async function applyFilters() {
         if (!providerId && !serviceId && !clientId) {
             console.log('No filters selected - showing all data');
             if (unfilteredDashboardData) {
-                const metricsData = calculateDashboardMetrics(
-                    unfilteredDashboardData.usages,
-                    unfilteredDashboardData.services,
-                    unfilteredDashboardData.providers
-                );
-                updateDashboardUI(metricsData);
+                updateDashboardUI(unfilteredDashboardData);
             } else {
                 await loadDashboard();
             }
@@ -355,48 +348,27 @@ async function applyFilters() {
         
         // Get the unfiltered data if we don't have it
         if (!unfilteredDashboardData) {
-            unfilteredDashboardData = await getDashboardData(currentDateRange);
-        }
-        
-        // Filter the usages array based on selected filters
-        let filteredUsages = unfilteredDashboardData.usages;
-        
-        // Filter by client
-        if (clientId) {
-            filteredUsages = filteredUsages.filter(u => u.client_id === parseInt(clientId));
-            console.log(`Filtered by client ${clientId}: ${filteredUsages.length} records`);
+            unfilteredDashboardData = await getDashboardSummary(currentDateRange);
         }
         
-        // Filter by service (and implicitly by provider since services belong to providers)
-        if (serviceId) {
-            filteredUsages = filteredUsages.filter(u => u.service_id === parseInt(serviceId));
-            console.log(`Filtered by service ${serviceId}: ${filteredUsages.length} records`);
-        } else if (providerId) {
-            // If no service selected but provider is selected, filter by provider
-            const providerServices = unfilteredDashboardData.services
-                .filter(s => s.provider_id === parseInt(providerId))
-                .map(s => s.service_id);
-            filteredUsages = filteredUsages.filter(u => providerServices.includes(u.service_id));
-            console.log(`Filtered by provider ${providerId}: ${filteredUsages.length} records`);
-        }
+        // Aggregate server-side for the selected filters; a service filter
+        // already implies its provider, matching the old client-side logic
+        const filteredData = await getCostSummary(currentDateRange, {
+            clientId,
+            serviceId,
+            providerId: serviceId ? '' : providerId,
+        });
         
         // If no results after filtering, show message
-        if (filteredUsages.length === 0) {
+        if (filteredData.trendData.length === 0) {
             showError('No data found for the selected filters. Try different filter combinations.');
             return;
         }
         
-        // Recalculate costs from filtered data
-        const filteredData = calculateDashboardMetrics(
-            filteredUsages, 
-            unfilteredDashboardData.services, 
-            unfilteredDashboardData.providers
-        );
-        
         // Update the UI with filtered data
         updateDashboardUI(filteredData);
         
-        console.log(`✓ Filters applied: Showing ${filteredUsages.length} of ${unfilteredDashboardData.usages.length} total records`);
+        console.log(`✓ Filters applied: ${filteredData.trendData.length} days of data`);
         console.log(`Total Cost: ${formatCurrency(filteredData.totalCost)} (was ${formatCurrency(unfilteredDashboardData.totalCost)})`);
         
         // Also reload waste alerts / recommendations if those pages are active
@@ -564,12 +536,7 @@ function clearFilters() {
     
     // Re-render dashboard with unfiltered data
     if (unfilteredDashboardData) {
-        const metricsData = calculateDashboardMetrics(
-            unfilteredDashboardData.usages,
-            unfilteredDashboardData.services,
-            unfilteredDashboardData.providers
-        );
-        updateDashboardUI(metricsData);
+        updateDashboardUI(unfilteredDashboardData);
         console.log('Filters cleared - showing all data');
     } else {
         // If we don't have cached data, reload
@@ -1327,6 +1294,8 @@ async function handleSaveBudgetSettings() {
  *   - Switch-savings calculation (cheapest provider delta)
  *   - Utilization estimates and waste status flags
  *   Respects all active filters (client/provider/service).
+ *   Streamed by the backend (/exports/usages.csv); built in the browser
+ *   only in mock-data mode.
  *
  * PDF (Invoice) — Finance-persona document with:
  *   - December 2025 billing period vs November 2025 comparison
@@ -1348,6 +1317,21 @@ async function exportData(format) {
         progressFill.style.width = '0%';
         progressText.textContent = 'Preparing export...';
         
+        if (format === 'csv' && !API_CONFIG.USE_MOCK_DATA) {
+            // The server streams the workbook straight to a file download
+            downloadUsageExport(currentDateRange, {
+                clientId: document.getElementById('client-filter')?.value,
+                providerId: document.getElementById('provider-filter')?.value,
+                serviceId: document.getElementById('service-filter')?.value,
+            });
+            progressFill.style.width = '100%';
+            progressText.textContent = 'Export started. The file is downloading from the server.';
+            setTimeout(() => {
+                progressDiv.classList.add('hidden');
+            }, 2000);
+            return;
+        }
+
         // Simulate progress
         progressFill.style.width = '30%';
         
@@ -0,0 +1,379 @@
+"""
+File: bench.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Sean Kellner (Backend Lead)
+Created: February 2026
+Description: Endpoint benchmark suite. Runs every api_v1 route in-process
+             against the local stand-in database at one or more data scales
+             (usages generated by backend.db.synthetic), records latency
+             percentiles and rows/s to JSON, and exits non-zero when a
+             stored baseline regresses beyond a tolerance:
+
+                 python tests/benchmarks/bench.py --scales 40000,1000000 --out results.json
+                 python tests/benchmarks/bench.py --baseline tests/benchmarks/baseline.json
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parents[1] / "src"
+DATA_DIR = BENCH_DIR / ".data"
+API = "/api/v1"
+
+sys.path.insert(0, str(SRC_DIR))
+
+
+class Case(NamedTuple):
+    name: str
+    path: str
+    method: str = "GET"
+    body: dict | None = None
+
+
+def _cases(ids: dict[str, Any]) -> list[Case]:
+    """Micro cases: one request each. Paths are filled in from ids."""
+    month_ago = (date.today() - timedelta(days=30)).isoformat()
+    cases = []
+    for resource in ("usages", "invoices", "clients", "services", "providers", "budgets"):
+        for limit in (10, 100, 1000):
+            cases.append(Case(f"list {resource} limit={limit}", f"/{resource}?limit={limit}"))
+    cases += [
+        Case("list usages page=50 limit=100", "/usages?limit=100&page=50"),
+        Case("list usages cursor limit=100", "/usages?limit=100&cursor={usage_cursor}"),
+        Case("list usages ndjson limit=1000", "/usages?limit=1000&format=ndjson"),
+        Case("list usages arrow limit=1000", "/usages?limit=1000&format=arrow"),
+        Case("list usages parquet limit=1000", "/usages?limit=1000&format=parquet"),
+        Case("list usages date range limit=100", f"/usages?limit=100&start_date={month_ago}"),
+        Case("list client usages limit=100", "/clients/{client_id}/usages?limit=100"),
+        Case("list service usages limit=100", "/services/{service_id}/usages?limit=100"),
+        Case("list client invoices", "/clients/{invoice_client_id}/invoices"),
+        Case("list client budgets", "/clients/{client_id}/budgets"),
+        Case("list provider services", "/providers/{provider_id}/services"),
+        Case("get usage", "/usages/{usage_id}"),
+        Case("get client usage", "/clients/{client_id}/usages/{usage_id}"),
+        Case("get service usage", "/services/{service_id}/usages/{usage_id}"),
+        Case("get invoice", "/invoices/{invoice_id}"),
+        Case("get client invoice", "/clients/{invoice_client_id}/invoices/{invoice_id}"),
+        Case("get client", "/clients/{client_id}"),
+        Case("get service", "/services/{service_id}"),
+        Case("get provider", "/providers/{provider_id}"),
+        Case("get provider service", "/providers/{provider_id}/services/{service_id}"),
+        Case("get budget", "/budgets/{budget_id}"),
+        Case("get client budget", "/clients/{client_id}/budgets/{budget_id}"),
+        Case("patch budget", "/budgets/{budget_id}", "PATCH", {"alert_threshold": "80.00"}),
+        Case("cost-summary days=30", "/analytics/cost-summary?days=30"),
+        Case("cost-summary days=90 client", "/analytics/cost-summary?days=90&client_id={client_id}"),
+        Case("usage-rollup day limit=1000", "/analytics/usage-rollup?interval=day&limit=1000"),
+        Case("usage-rollup hour limit=1000", "/analytics/usage-rollup?interval=hour&limit=1000"),
+        Case("usage-rollup month", "/analytics/usage-rollup?interval=month&limit=1000"),
+        Case("usage-rollup day arrow", "/analytics/usage-rollup?interval=day&limit=1000&format=arrow"),
+        Case("waste-alerts", "/analytics/waste-alerts"),
+        Case("waste-alerts client", "/analytics/waste-alerts?client_id={client_id}"),
+        Case("recommendations client", "/analytics/recommendations?client_id={client_id}"),
+        Case("export usages.csv client 30 days", f"/exports/usages.csv?client_id={{client_id}}&start_date={month_ago}"),
+        Case("health", "/health"),
+        Case("health db", "/health/db"),
+        Case("health ready", "/health/ready"),
+        Case("health pool", "/health/pool"),
+        Case("health analytics", "/health/analytics"),
+    ]
+    return [case._replace(path=API + case.path.format(**ids)) for case in cases]
+
+
+def _dashboard(ids: dict[str, Any]) -> list[str]:
+    """Macro case: the requests one dashboard page load makes."""
+    return [API + path.format(**ids) for path in (
+        "/clients",
+        "/services?limit=100",
+        "/budgets",
+        "/analytics/cost-summary?days=30&client_id={client_id}",
+        "/analytics/usage-rollup?interval=day&client_id={client_id}&limit=1000",
+        "/analytics/waste-alerts?client_id={client_id}",
+        "/analytics/recommendations?client_id={client_id}",
+        "/clients/{client_id}/usages?limit=100",
+    )]
+
+
+def _rows(response) -> int:
+    """Rows in a response body, for rows/s."""
+    mimetype = response.mimetype
+    body = response.get_data()
+    if mimetype == "application/json":
+        data = json.loads(body).get("data")
+        return len(data) if isinstance(data, list) else int(data is not None)
+    if mimetype in ("application/x-ndjson", "text/csv"):
+        return max(body.count(b"\n") - 1, 0)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    if mimetype == "application/vnd.apache.parquet":
+        return pq.read_metadata(io.BytesIO(body)).num_rows
+    return pa.ipc.open_stream(body).read_all().num_rows
+
+
+def _summary(latencies: list[float], elapsed: float, rows: int) -> dict[str, Any]:
+    latencies = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        return round(latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000, 3)
+
+    rate = len(latencies) / elapsed if elapsed else 0.0
+    return {
+        "requests": len(latencies),
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "req_per_s": round(rate, 2),
+        "rows": rows,
+        "rows_per_s": round(rows * rate, 1),
+    }
+
+
+def _fetch(client, method: str, path: str, body: dict | None = None):
+    response = client.open(path, method=method, json=body)
+    # Read the whole body: streamed responses do their work while iterated
+    response.get_data()
+    if response.status_code >= 400:
+        raise RuntimeError(f"{method} {path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+    return response
+
+
+def _measure(run, requests: int, seconds: float, warmup: int) -> tuple[list[float], float]:
+    for _ in range(warmup):
+        run()
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < requests and time.perf_counter() - started < seconds:
+        begin = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - begin)
+    return latencies, time.perf_counter() - started
+
+
+def _best_round(rounds: int, measure) -> tuple[list[float], float]:
+    # Like timeit, keep the fastest round: on a shared or single-CPU
+    # machine the slower ones mostly measure other work
+    return min((measure() for _ in range(max(rounds, 1))), key=lambda result: statistics.median(result[0]))
+
+
+def _discover_ids(client, rows: int) -> dict[str, Any]:
+    # A usage from the middle of the table, and the client/service it belongs to
+    usage = _fetch(client, "GET", f"{API}/usages/{900001 + rows // 2}").get_json()["data"]
+    service = _fetch(client, "GET", f"{API}/services/{usage['service_id']}").get_json()["data"]
+    first_page = _fetch(client, "GET", f"{API}/usages?limit=100").get_json()
+    invoices = _fetch(client, "GET", f"{API}/invoices?limit=1").get_json()["data"]
+    if not invoices:
+        raise RuntimeError("No invoices; the data set was built without running the invoice job")
+    return {
+        "usage_id": usage["usage_id"],
+        "client_id": usage["client_id"],
+        "service_id": usage["service_id"],
+        "provider_id": service["provider_id"],
+        "usage_cursor": first_page["meta"]["next_cursor"],
+        "invoice_id": invoices[0]["invoice_id"],
+        "invoice_client_id": invoices[0]["client_id"],
+        "budget_id": 1,
+    }
+
+
+def build_data(path: Path, backend: str, rows: int, seed: int):
+    from backend import create_app
+    from backend.db.session import get_db_session
+    from backend.db.synthetic import generate_usages, write_standin
+    from backend.jobs.invoices import generate_invoices
+    from backend.jobs.rollups import refresh_usage_rollups
+
+    print(f"Building {rows:,} usages in {path}", file=sys.stderr, flush=True)
+    write_standin(path, backend, generate_usages(rows, seed=seed))
+    # Deployed instances run both jobs on a schedule
+    with create_app().app_context():
+        refresh_usage_rollups(get_db_session())
+        generate_invoices(get_db_session())
+
+
+def data_path(args: argparse.Namespace, rows: int) -> Path:
+    from backend.db.dialects import get_dialect
+    return Path(args.data_dir) / f"usages-{rows}-seed{args.seed}{get_dialect(args.backend).suffix}"
+
+
+def run_scale(args: argparse.Namespace, rows: int) -> dict[str, Any]:
+    """Benchmark every case at one data scale. Runs in its own process."""
+    path = data_path(args, rows)
+    if args.rebuild_data and path.exists():
+        path.unlink()
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        build_data(path, args.backend, rows, args.seed)
+
+    from backend import create_app
+    app = create_app()
+    client = app.test_client()
+    ids = _discover_ids(client, rows)
+
+    results: dict[str, Any] = {}
+    for case in _cases(ids):
+        if args.only and args.only not in case.name:
+            continue
+        latencies, elapsed = _best_round(args.rounds, lambda: _measure(
+            lambda: _fetch(client, case.method, case.path, case.body),
+            args.requests, args.seconds / args.rounds, args.warmup,
+        ))
+        results[case.name] = _summary(latencies, elapsed, _rows(_fetch(client, case.method, case.path, case.body)))
+        print(f"  {rows:>11,}  {case.name:<40} p50={results[case.name]['p50_ms']:>9.2f} ms  "
+              f"p95={results[case.name]['p95_ms']:>9.2f} ms", file=sys.stderr, flush=True)
+
+    dashboard = _dashboard(ids)
+    for threads in sorted({1, args.threads}):
+        name = f"dashboard page x{threads} threads"
+        if args.only and args.only not in name:
+            continue
+        clients = {}
+
+        def page_load():
+            # One test client per thread, like one browser per user
+            import threading
+            own = clients.setdefault(threading.get_ident(), app.test_client())
+            for path in dashboard:
+                _fetch(own, "GET", path)
+
+        def page_loads():
+            started = time.perf_counter()
+            timed = list(pool.map(lambda _: _timed(page_load), range(args.requests)))
+            return timed, time.perf_counter() - started
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(lambda _: page_load(), range(max(args.warmup, threads))))
+            timed, elapsed = _best_round(args.rounds, page_loads)
+        results[name] = _summary(timed, elapsed, len(dashboard))
+        print(f"  {rows:>11,}  {name:<40} p50={results[name]['p50_ms']:>9.2f} ms  "
+              f"p95={results[name]['p95_ms']:>9.2f} ms", file=sys.stderr, flush=True)
+    return results
+
+
+def _timed(run) -> float:
+    begin = time.perf_counter()
+    run()
+    return time.perf_counter() - begin
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float, slack_ms: float) -> list[str]:
+    """
+    Cases whose p50 is above baseline * (1 + tolerance) + slack_ms. The p95
+    is held to twice the tolerance: tail latency is noisier run to run.
+    """
+    regressions = []
+    for scale, cases in results["scales"].items():
+        base_cases = baseline.get("scales", {}).get(scale, {})
+        for name, result in cases.items():
+            base = base_cases.get(name)
+            if base is None:
+                continue
+            for metric, allowed in (("p50_ms", tolerance), ("p95_ms", 2 * tolerance)):
+                limit = base[metric] * (1 + allowed) + slack_ms
+                if result[metric] > limit:
+                    regressions.append(
+                        f"{scale} rows, {name}: {metric} {result[metric]:.2f} > {limit:.2f} "
+                        f"(baseline {base[metric]:.2f})"
+                    )
+    return regressions
+
+
+def _scale_in_subprocess(args: argparse.Namespace, rows: int) -> dict[str, Any]:
+    # Config is read from the environment at import, and each scale needs a
+    # fresh process: its own DB_BACKEND/SQLITE_PATH, engine and caches
+    env = {
+        **os.environ,
+        "DB_BACKEND": args.backend,
+        "SQL_STANDIN_LATENCY_MS": str(args.latency_ms),
+        "ANALYTICS_CACHE_TTL": "0",
+        "SQL_READ_REPLICA": "false",
+    }
+    env["SQLITE_PATH" if args.backend == "sqlite" else "DUCKDB_PATH"] = str(data_path(args, rows))
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as output:
+        target = output.name
+    try:
+        subprocess.run(
+            [sys.executable, __file__, *sys.argv[1:], "--child-rows", str(rows), "--child-out", target],
+            env=env, check=True,
+        )
+        return json.loads(Path(target).read_text())
+    finally:
+        os.unlink(target)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the API against the local stand-in database.")
+    parser.add_argument("--scales", default="40000", help="Comma-separated Usages row counts")
+    parser.add_argument("--backend", choices=("sqlite", "duckdb"), default="sqlite", help="Stand-in dialect")
+    parser.add_argument("--requests", type=int, default=50, help="Timed requests per case")
+    parser.add_argument("--seconds", type=float, default=10, help="Time limit per case, shared by its rounds")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed requests before each case")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds per case; the fastest is kept")
+    parser.add_argument("--threads", type=int, default=4, help="Concurrent page loads for the dashboard case")
+    parser.add_argument("--latency-ms", type=float, default=0, help="SQL_STANDIN_LATENCY_MS for the run")
+    parser.add_argument("--only", help="Only run cases whose name contains this text")
+    parser.add_argument("--seed", type=int, default=495, help="Data generator seed")
+    parser.add_argument("--data-dir", default=str(DATA_DIR), help="Where generated databases are kept")
+    parser.add_argument("--rebuild-data", action="store_true", help="Regenerate the databases")
+    parser.add_argument("--out", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Baseline results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p50 slowdown over baseline (0.25 = 25%%; p95 gets twice this)")
+    parser.add_argument("--slack-ms", type=float, default=1.0, help="Absolute slowdown always allowed, in ms")
+    parser.add_argument("--child-rows", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--child-out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_rows is not None:
+        Path(args.child_out).write_text(json.dumps(run_scale(args, args.child_rows)))
+        return
+
+    results = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "backend": args.backend,
+            "latency_ms": args.latency_ms,
+            "requests": args.requests,
+            "rounds": args.rounds,
+            "threads": args.threads,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+        },
+        "scales": {},
+    }
+    for rows in (int(scale) for scale in args.scales.split(",")):
+        results["scales"][str(rows)] = _scale_in_subprocess(args, rows)
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Results written to {args.out}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        for key in ("backend", "latency_ms"):
+            if baseline["meta"].get(key) != results["meta"][key]:
+                print(f"Warning: baseline {key} is {baseline['meta'].get(key)}, this run used {results['meta'][key]}")
+        regressions = compare(results, baseline, args.tolerance, args.slack_ms)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
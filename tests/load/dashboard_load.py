@@ -0,0 +1,423 @@
+"""
+File: dashboard_load.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Sean Kellner (Backend Lead)
+Created: February 2026
+Description: Dashboard traffic load generator. Simulated analysts repeat
+             what the dashboard does (the parallel Promise.all fetches of
+             each page load, filter change and page switch) with think time
+             between actions. For each gunicorn worker model it starts the
+             API on the local stand-in database, adds analysts step by step
+             and reports the step where latency or errors pass the limits:
+
+                 python tests/load/dashboard_load.py --models gthread,asgi --users 5,10,20,40,80
+                 python tests/load/dashboard_load.py --url http://localhost:5000 --mix fanout
+"""
+
+import argparse
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+import requests
+from requests.adapters import HTTPAdapter
+
+LOAD_DIR = Path(__file__).resolve().parent
+SRC_DIR = LOAD_DIR.parents[1] / "src"
+API = "/api/v1"
+
+sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(LOAD_DIR.parent / "benchmarks"))
+
+# getClients(), getServices() etc. ask for DEFAULT_LIMIT rows (config.js)
+DEFAULT_LIMIT = 50000
+
+# Connections a browser opens per host
+BROWSER_CONNECTIONS = 6
+
+# Worker model -> (GUNICORN_WORKER_CLASS, app)
+MODELS = {
+    "sync": ("sync", "backend.wsgi:app"),
+    "gthread": ("gthread", "backend.wsgi:app"),
+    "asgi": ("asgi", "backend.asgi:app"),
+}
+
+
+class Action(NamedTuple):
+    """
+    One user action. Each step is a list of requests fired together, like
+    a Promise.all; the next step starts when all of them have answered.
+    """
+    name: str
+    weight: float
+    steps: tuple[tuple[str, ...], ...]
+
+
+_LISTS = (f"/services?limit={DEFAULT_LIMIT}", f"/providers?limit={DEFAULT_LIMIT}")
+_CLIENTS = (f"/clients?limit={DEFAULT_LIMIT}",)
+_BUDGETS = (f"/budgets?limit={DEFAULT_LIMIT}",)
+
+# dashboard.js as it is now: server-side aggregates (getDashboardSummary,
+# getCostSummary, getWasteAlerts, getRecommendations)
+CURRENT_MIX = (
+    Action("open dashboard", 1, (("/analytics/cost-summary?days={days}", *_LISTS), _CLIENTS)),
+    Action("filter client", 4, (("/analytics/cost-summary?days={days}&client_id={client_id}",),)),
+    Action("filter provider", 2, (
+        ("/analytics/cost-summary?days={days}&client_id={client_id}&provider_id={provider_id}",),
+    )),
+    Action("change date range", 1, (
+        ("/analytics/cost-summary?days={days}", *_LISTS),
+        _CLIENTS,
+        ("/analytics/cost-summary?days={days}&client_id={client_id}",),
+    )),
+    Action("waste alerts", 2, (("/analytics/waste-alerts?days=30&client_id={client_id}",),)),
+    Action("recommendations", 1, (("/analytics/recommendations?days=365&client_id={client_id}",),)),
+    Action("settings", 0.5, (_LISTS, _CLIENTS, _BUDGETS)),
+    Action("save budget", 0.2, (_BUDGETS, ("PATCH /budgets/{budget_id}",))),
+)
+
+# The getDashboardData() fan-out: every usage row, providers and services,
+# then budgets for the in-browser waste alerts, on every filter change
+FANOUT_MIX = (
+    Action("open dashboard", 1, ((f"/usages?limit={DEFAULT_LIMIT}", *_LISTS), _CLIENTS)),
+    Action("filter change", 6, ((f"/usages?limit={DEFAULT_LIMIT}", *_LISTS), _BUDGETS)),
+    Action("recommendations", 1, ((f"/usages?limit={DEFAULT_LIMIT}", *_LISTS), _BUDGETS)),
+    Action("save budget", 0.2, (_BUDGETS, ("PATCH /budgets/{budget_id}",))),
+)
+
+MIXES = {"current": CURRENT_MIX, "fanout": FANOUT_MIX}
+
+
+class Recorder:
+    """Completed actions and requests, stamped with their start time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.actions: list[tuple[float, str, float, bool]] = []
+        self.requests: list[tuple[float, float, int]] = []
+
+    def action(self, started: float, name: str, seconds: float, ok: bool):
+        with self._lock:
+            self.actions.append((started, name, seconds, ok))
+
+    def request(self, started: float, seconds: float, status: int):
+        with self._lock:
+            self.requests.append((started, seconds, status))
+
+    def window(self, start: float, end: float) -> tuple[list, list]:
+        with self._lock:
+            return (
+                [a for a in self.actions if start <= a[0] < end],
+                [r for r in self.requests if start <= r[0] < end],
+            )
+
+
+class Analyst(threading.Thread):
+    """One dashboard user: a weighted random action, then think time."""
+
+    def __init__(self, number: int, base_url: str, mix: tuple[Action, ...], ids: dict[str, Any],
+                 think: float, recorder: Recorder, stop: threading.Event, seed: int):
+        super().__init__(name=f"analyst-{number}", daemon=True)
+        self.base_url = base_url
+        self.mix = mix
+        self.ids = ids
+        self.think = think
+        self.recorder = recorder
+        self.stop_event = stop
+        self.rnd = random.Random(seed * 100003 + number)
+        # Like a browser tab: keep-alive connections, a few at a time
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=BROWSER_CONNECTIONS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.fetchers = ThreadPoolExecutor(max_workers=BROWSER_CONNECTIONS)
+        self.client_id = self.rnd.choice(ids["client_ids"])
+
+    def run(self):
+        # Spread the first actions out so users do not start in lockstep
+        if self.stop_event.wait(self.rnd.uniform(0, self.think)):
+            return
+        while not self.stop_event.is_set():
+            action = self.rnd.choices(self.mix, weights=[a.weight for a in self.mix])[0]
+            if action.name == "filter client":
+                self.client_id = self.rnd.choice(self.ids["client_ids"])
+            values = {
+                "client_id": self.client_id,
+                "provider_id": self.rnd.choice(self.ids["provider_ids"]),
+                "budget_id": self.ids["budget_ids"].get(self.client_id, 1),
+                "days": self.rnd.choice((7, 30, 90)) if action.name == "change date range" else 30,
+            }
+            started = time.perf_counter()
+            ok = True
+            for step in action.steps:
+                results = list(self.fetchers.map(lambda path: self._fetch(path.format(**values)), step))
+                if not all(results):
+                    # The page shows an error and the user moves on
+                    ok = False
+                    break
+            self.recorder.action(started, action.name, time.perf_counter() - started, ok)
+            self.stop_event.wait(self.rnd.expovariate(1 / self.think))
+        self.fetchers.shutdown(wait=False)
+
+    def _fetch(self, path: str) -> bool:
+        method = "GET"
+        body = None
+        if path.startswith("PATCH "):
+            # The settings form saves the values it loaded
+            method, path = "PATCH", path[len("PATCH "):]
+            body = {"alert_threshold": "80.00"}
+        started = time.perf_counter()
+        try:
+            response = self.session.request(method, f"{self.base_url}{API}{path}", json=body, timeout=60)
+            response.content
+            status = response.status_code
+        except requests.RequestException:
+            status = 0
+        self.recorder.request(started, time.perf_counter() - started, status)
+        return 0 < status < 400
+
+
+def _percentile(values: list[float], p: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000, 2)
+
+
+def _step_summary(users: int, actions: list, fetched: list, seconds: float) -> dict[str, Any]:
+    action_times = [a[2] for a in actions if a[3]]
+    request_times = [r[1] for r in fetched]
+    errors = sum(1 for r in fetched if not 0 < r[2] < 400)
+    by_action: dict[str, list[float]] = {}
+    for _, name, took, ok in actions:
+        if ok:
+            by_action.setdefault(name, []).append(took)
+    return {
+        "users": users,
+        "actions": len(actions),
+        "actions_per_s": round(len(actions) / seconds, 2),
+        "requests_per_s": round(len(fetched) / seconds, 2),
+        "action_p50_ms": _percentile(action_times, 0.50),
+        "action_p95_ms": _percentile(action_times, 0.95),
+        "request_p50_ms": _percentile(request_times, 0.50),
+        "request_p95_ms": _percentile(request_times, 0.95),
+        "request_p99_ms": _percentile(request_times, 0.99),
+        "errors": errors,
+        "error_rate": round(errors / len(fetched), 4) if fetched else 0.0,
+        "overloaded": sum(1 for r in fetched if r[2] == 503),
+        "by_action_p95_ms": {name: _percentile(times, 0.95) for name, times in sorted(by_action.items())},
+    }
+
+
+def _saturation(step: dict[str, Any], first: dict[str, Any] | None, args: argparse.Namespace) -> str | None:
+    """Why this step is past what the instance can serve, or None."""
+    if step["error_rate"] > args.max_error_rate:
+        return f"error rate {step['error_rate']:.1%} > {args.max_error_rate:.1%}"
+    if step["action_p95_ms"] is None:
+        return "no action completed"
+    if step["action_p95_ms"] > args.slo_ms:
+        return f"action p95 {step['action_p95_ms']:.0f} ms > {args.slo_ms:.0f} ms"
+    # With think time the load is a closed loop: once the server is busy,
+    # throughput holds and the extra users show up as queuing time instead
+    if first is not None and first["action_p50_ms"] and step["action_p50_ms"] > args.knee * first["action_p50_ms"]:
+        return f"action p50 {step['action_p50_ms']:.0f} ms > {args.knee:g}x the {first['users']}-user step"
+    return None
+
+
+def ramp(base_url: str, args: argparse.Namespace) -> dict[str, Any]:
+    """Add analysts step by step; stop after the first saturated step."""
+    ids = _discover_ids(base_url)
+    recorder = Recorder()
+    stop = threading.Event()
+    analysts: list[Analyst] = []
+    steps = []
+    capacity = 0
+    saturation = None
+    first = None
+    try:
+        for users in (int(step) for step in args.users.split(",")):
+            while len(analysts) < users:
+                analyst = Analyst(len(analysts), base_url, MIXES[args.mix], ids, args.think, recorder, stop, args.seed)
+                analyst.start()
+                analysts.append(analyst)
+            # Let the new users get going before measuring
+            time.sleep(min(args.think, args.step_seconds / 3))
+            start = time.perf_counter()
+            time.sleep(args.step_seconds)
+            actions, fetched = recorder.window(start, time.perf_counter())
+            step = _step_summary(users, actions, fetched, args.step_seconds)
+            reason = _saturation(step, first, args)
+            step["saturated"] = reason
+            steps.append(step)
+            print(
+                f"  {users:>5} users  {step['actions_per_s']:>7.2f} actions/s  {step['requests_per_s']:>7.2f} req/s  "
+                f"action p50={step['action_p50_ms'] or 0:>8.0f} ms p95={step['action_p95_ms'] or 0:>8.0f} ms  "
+                f"errors={step['error_rate']:.1%}" + (f"  <- {reason}" if reason else ""),
+                flush=True,
+            )
+            if reason:
+                saturation = {"users": users, "reason": reason}
+                if not args.full:
+                    break
+            elif saturation is None:
+                capacity = users
+            first = first or step
+    finally:
+        stop.set()
+        for analyst in analysts:
+            analyst.join(timeout=65)
+    return {
+        "steps": steps,
+        "capacity_users": capacity,
+        "saturation": saturation,
+        "peak_actions_per_s": max((step["actions_per_s"] for step in steps), default=0),
+    }
+
+
+def _discover_ids(base_url: str) -> dict[str, Any]:
+    def get(path):
+        response = requests.get(f"{base_url}{API}{path}", timeout=60)
+        response.raise_for_status()
+        return response.json()["data"]
+
+    budgets = get(f"/budgets?limit={DEFAULT_LIMIT}")
+    return {
+        "client_ids": [client["client_id"] for client in get(f"/clients?limit={DEFAULT_LIMIT}")],
+        "provider_ids": [provider["provider_id"] for provider in get(f"/providers?limit={DEFAULT_LIMIT}")],
+        "budget_ids": {budget["client_id"]: budget["budget_id"] for budget in budgets},
+    }
+
+
+def _serve(model: str, args: argparse.Namespace, db_path: Path) -> subprocess.Popen:
+    worker_class, app = MODELS[model]
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC_DIR),
+        "DB_BACKEND": args.backend,
+        "SQL_STANDIN_LATENCY_MS": str(args.latency_ms),
+        "SQL_READ_REPLICA": "false",
+        "GUNICORN_BIND": f"127.0.0.1:{args.port}",
+        "GUNICORN_WORKER_CLASS": worker_class,
+    }
+    env["SQLITE_PATH" if args.backend == "sqlite" else "DUCKDB_PATH"] = str(db_path)
+    if args.workers:
+        env["GUNICORN_WORKERS"] = str(args.workers)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "python:backend.gunicorn_conf", app],
+        cwd=SRC_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"gunicorn ({model}) exited with code {server.returncode}")
+        try:
+            if requests.get(f"http://127.0.0.1:{args.port}{API}/health/ready", timeout=2).ok:
+                return server
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    _shutdown(server)
+    raise RuntimeError(f"gunicorn ({model}) did not become ready within 60s")
+
+
+def _shutdown(server: subprocess.Popen):
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(timeout=35)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def _database(args: argparse.Namespace) -> Path:
+    if args.db:
+        return Path(args.db)
+    # Shared with the benchmark suite's generated data
+    import bench
+    args.data_dir = str(bench.DATA_DIR)
+    path = bench.data_path(args, args.rows)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # backend.config has not been imported yet, so the build sees these
+        os.environ["DB_BACKEND"] = args.backend
+        os.environ["SQLITE_PATH" if args.backend == "sqlite" else "DUCKDB_PATH"] = str(path)
+        bench.build_data(path, args.backend, args.rows, args.seed)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ramp simulated dashboard users against the API.")
+    parser.add_argument("--models", default="gthread,asgi", help=f"Comma-separated worker models: {', '.join(MODELS)}")
+    parser.add_argument("--url", help="Load an already running server instead (e.g. http://localhost:5000)")
+    parser.add_argument("--users", default="5,10,20,40,80,160", help="Comma-separated analyst counts to ramp through")
+    parser.add_argument("--step-seconds", type=float, default=30, help="Measured seconds per step")
+    parser.add_argument("--think", type=float, default=10, help="Mean think time between actions, in seconds")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="current", help="Request mix to model")
+    parser.add_argument("--slo-ms", type=float, default=2000, help="Action p95 above this means saturated")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Error rate above this means saturated")
+    parser.add_argument("--knee", type=float, default=3.0,
+                        help="Saturated when action p50 grows past this multiple of the first step's")
+    parser.add_argument("--full", action="store_true", help="Keep ramping after the first saturated step")
+    parser.add_argument("--workers", type=int, help="GUNICORN_WORKERS (default: gunicorn_conf's)")
+    parser.add_argument("--port", type=int, default=5055, help="Port for the servers this script starts")
+    parser.add_argument("--backend", choices=("sqlite", "duckdb"), default="sqlite", help="Stand-in dialect")
+    parser.add_argument("--db", help="Stand-in database file (default: generated, shared with the benchmarks)")
+    parser.add_argument("--rows", type=int, default=40000, help="Usages rows in the generated database")
+    parser.add_argument("--seed", type=int, default=495, help="Data generator and user seed")
+    parser.add_argument("--latency-ms", type=float, default=0, help="SQL_STANDIN_LATENCY_MS for the servers")
+    parser.add_argument("--out", help="Write results JSON here")
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "mix": args.mix,
+            "think_seconds": args.think,
+            "step_seconds": args.step_seconds,
+            "slo_ms": args.slo_ms,
+            "max_error_rate": args.max_error_rate,
+            "backend": args.backend,
+            "latency_ms": args.latency_ms,
+            "workers": args.workers,
+            "cpus": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+        },
+        "models": {},
+    }
+
+    if args.url:
+        print(f"{args.url} ({args.mix} mix)", flush=True)
+        results["models"]["external"] = ramp(args.url.rstrip("/"), args)
+    else:
+        db_path = _database(args)
+        for model in args.models.split(","):
+            if model not in MODELS:
+                parser.error(f"unknown worker model: {model}")
+            print(f"{model} ({args.mix} mix)", flush=True)
+            server = _serve(model, args, db_path)
+            try:
+                results["models"][model] = ramp(f"http://127.0.0.1:{args.port}", args)
+            finally:
+                _shutdown(server)
+
+    print()
+    for model, result in results["models"].items():
+        saturation = result["saturation"]
+        limit = f"saturated at {saturation['users']} ({saturation['reason']})" if saturation else "not saturated"
+        print(f"{model}: {result['capacity_users']} analysts within limits, "
+              f"peak {result['peak_actions_per_s']:.1f} actions/s, {limit}")
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
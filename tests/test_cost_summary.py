@@ -0,0 +1,27 @@
+"""
+File: test_cost_summary.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-011
+Description: Cost summary endpoint test. Verifies /analytics/cost-summary
+             returns totals that match its own per-provider and daily series.
+"""
+
+import requests
+from decimal import Decimal
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+def test_cost_summary_totals_are_consistent():
+    response = requests.get(f"{BASE_URL}/analytics/cost-summary", params={"days": 365}, timeout=TIMEOUT)
+    data = assert_json_response(response)
+    assert data.get("status") == "ok"
+
+    summary = data["data"]
+    total = Decimal(summary["total_cost"])
+    assert sum(Decimal(p["total_cost"]) for p in summary["providers"]) == total
+    assert sum(Decimal(d["total_cost"]) for d in summary["daily"]) == total
+
+def test_cost_summary_rejects_bad_window():
+    response = requests.get(f"{BASE_URL}/analytics/cost-summary", params={"days": 0}, timeout=TIMEOUT)
+    assert response.status_code == 400
@@ -0,0 +1,25 @@
+"""
+File: test_health_analytics.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-019
+Description: Analytics snapshot status test. Verifies /health/analytics
+             reports the snapshot state, and row counts once it has loaded.
+"""
+
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+def test_health_analytics_reports_snapshot():
+    # The first analytics request starts the snapshot when it is enabled
+    assert_json_response(requests.get(f"{BASE_URL}/analytics/cost-summary", timeout=TIMEOUT))
+
+    body = assert_json_response(requests.get(f"{BASE_URL}/health/analytics", timeout=TIMEOUT))
+    snapshot = body["meta"]["snapshot"]
+    assert snapshot["state"] in ("disabled", "loading", "ready", "failed")
+    assert snapshot["refresh_seconds"] > 0
+    if snapshot["state"] == "ready":
+        assert snapshot["rows"]["Usages"] > 0
+        assert snapshot["rows"]["Services"] > 0
+        assert snapshot["loaded_at"] is not None
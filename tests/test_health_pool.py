@@ -0,0 +1,23 @@
+"""
+File: test_health_pool.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-018
+Description: Pool telemetry test. Verifies /health/pool reports counters
+             and checkout wait percentiles once the database has been used.
+"""
+
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+def test_health_pool_reports_checkouts():
+    assert_json_response(requests.get(f"{BASE_URL}/health/db", timeout=TIMEOUT))
+
+    body = assert_json_response(requests.get(f"{BASE_URL}/health/pool", timeout=TIMEOUT))
+    pool = body["meta"]["pool"]
+    assert body["meta"]["engine"] == "created"
+    assert pool["counters"]["checkouts"] >= 1
+    assert pool["checkout_wait"]["count"] >= 1
+    assert pool["checkout_wait"]["p95_ms"] is not None
+    assert sum(bucket["count"] for bucket in pool["checkout_wait"]["buckets"]) == pool["checkout_wait"]["count"]
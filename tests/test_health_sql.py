@@ -0,0 +1,36 @@
+"""
+File: test_health_sql.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-021
+Description: SQL statement stats test. Verifies /health/sql lists the
+             statements the API has run, ranked as asked, and rejects an
+             unknown ranking.
+"""
+
+import pytest
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+def test_health_sql_reports_statements():
+    assert_json_response(requests.get(f"{BASE_URL}/providers", timeout=TIMEOUT))
+
+    body = assert_json_response(requests.get(f"{BASE_URL}/health/sql", params={"top": 3, "order": "calls"}, timeout=TIMEOUT))
+    sql = body["meta"]["sql"]
+    if not sql["enabled"]:
+        pytest.skip("Server is running without SQL_STATS")
+    assert sql["statements"]["calls"] > 0
+    assert sql["requests"]["count"] > 0
+    assert 0 < len(sql["top"]) <= 3
+    calls = [entry["calls"] for entry in sql["top"]]
+    assert calls == sorted(calls, reverse=True)
+    for entry in sql["top"]:
+        # Normalized: no literal values left in the statement
+        assert "'" not in entry["statement"]
+        assert entry["total_ms"] >= 0
+
+def test_health_sql_rejects_unknown_order():
+    response = requests.get(f"{BASE_URL}/health/sql", params={"order": "bogus"}, timeout=TIMEOUT)
+    assert response.status_code == 400
+    assert response.json()["status"] == "error"
@@ -0,0 +1,26 @@
+"""
+File: test_recommendations.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-013
+Description: Recommendations endpoint test. Verifies /analytics/recommendations
+             returns three phases whose savings add up to the totals.
+"""
+
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+def test_recommendations_phase_totals():
+    response = requests.get(f"{BASE_URL}/analytics/recommendations", params={"client_id": 1001}, timeout=TIMEOUT)
+    data = assert_json_response(response)
+    assert data.get("status") == "ok"
+
+    phases = data["data"]["phases"]
+    totals = data["data"]["totals"]
+    assert set(phases) == {"1", "2", "3"}
+    assert totals["savings"] == sum(p["savings"] for p in phases.values())
+
+    for key, phase in phases.items():
+        assert phase["savings"] == sum(item["savings"] for item in phase["items"])
+        assert all(item["phase"] == int(key) for item in phase["items"])
@@ -0,0 +1,39 @@
+"""
+File: test_server_timing.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-020
+Description: Request timing test. When the server runs with SERVER_TIMING,
+             verifies the Server-Timing header lists every phase, and that
+             meta.timing matches it when SERVER_TIMING_META is also set.
+"""
+
+import re
+import pytest
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+PHASES = ("validate", "db", "convert", "serialize", "total")
+
+def test_server_timing_header_lists_phases():
+    response = requests.get(f"{BASE_URL}/providers?limit=5", timeout=TIMEOUT)
+    body = assert_json_response(response)
+
+    header = response.headers.get("Server-Timing")
+    if header is None:
+        pytest.skip("Server is running without SERVER_TIMING")
+
+    durations = {}
+    for entry in header.split(","):
+        match = re.match(r'\s*(\w+);dur=([\d.]+)', entry)
+        assert match, f"Malformed Server-Timing entry: {entry}"
+        durations[match.group(1)] = float(match.group(2))
+    assert tuple(durations) == PHASES
+    assert durations["total"] >= durations["db"]
+    assert 'desc="1 SQL statement"' in header
+
+    timing = body["meta"].get("timing")
+    if timing is not None:
+        assert timing["queries"] == 1
+        assert set(timing) == {"validate", "db", "convert", "total", "queries"}
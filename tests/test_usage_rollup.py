@@ -0,0 +1,38 @@
+"""
+File: test_usage_rollup.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-014
+Description: Usage rollup endpoint test. Verifies /analytics/usage-rollup
+             returns monthly buckets whose costs match the daily buckets.
+"""
+
+import calendar
+from datetime import date
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+def test_usage_rollup_month_matches_days():
+    # The month of the client's latest usage, so the range has data
+    latest = assert_json_response(requests.get(f"{BASE_URL}/clients/1001/usages", params={"limit": 1}, timeout=TIMEOUT))
+    assert latest["data"], "client 1001 has no usage"
+    month = date.fromisoformat(latest["data"][0]["usage_date"]).replace(day=1)
+    month_end = month.replace(day=calendar.monthrange(month.year, month.month)[1])
+    params = {"client_id": 1001, "start_date": month.isoformat(), "end_date": month_end.isoformat(), "limit": 1000}
+
+    monthly = assert_json_response(
+        requests.get(f"{BASE_URL}/analytics/usage-rollup", params={**params, "interval": "month"}, timeout=TIMEOUT)
+    )
+    daily = assert_json_response(
+        requests.get(f"{BASE_URL}/analytics/usage-rollup", params={**params, "interval": "day"}, timeout=TIMEOUT)
+    )
+    assert monthly.get("status") == "ok"
+    assert monthly["data"]
+    assert daily["data"]
+    assert all(row["bucket"] == month.isoformat() for row in monthly["data"])
+
+    month_total = sum(float(row["total_cost"]) for row in monthly["data"])
+    day_total = sum(float(row["total_cost"]) for row in daily["data"])
+    assert month_total > 0
+    assert abs(month_total - day_total) < 0.01
@@ -0,0 +1,71 @@
+"""
+File: test_usages_arrow.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-017
+Description: Columnar format test. Verifies /usages returns the same page as
+             an Arrow IPC stream and as a Parquet file, including pages
+             longer than one database batch, and pages on with the
+             X-Next-Cursor header.
+"""
+
+import io
+import pytest
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+def test_usages_arrow_and_parquet_match_json():
+    params = {"limit": 5}
+    expected = assert_json_response(requests.get(f"{BASE_URL}/usages", params=params, timeout=TIMEOUT))
+    expected_ids = [item["usage_id"] for item in expected["data"]]
+
+    response = requests.get(
+        f"{BASE_URL}/usages",
+        params=params,
+        headers={"Accept": "application/vnd.apache.arrow.stream"},
+        timeout=TIMEOUT,
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("application/vnd.apache.arrow.stream")
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("usage_id").to_pylist() == expected_ids
+    assert table.schema.field("units_used").type == pa.float64()
+
+    response = requests.get(f"{BASE_URL}/usages", params={**params, "format": "parquet"}, timeout=TIMEOUT)
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.column("usage_id").to_pylist() == expected_ids
+
+def test_usages_arrow_streams_several_batches():
+    # More rows than one STREAM_BATCH_SIZE (1000) batch, so the stream keeps
+    # reading from the database after the view has returned
+    params = {"limit": 2500}
+    expected = assert_json_response(requests.get(f"{BASE_URL}/usages", params=params, timeout=TIMEOUT))
+    expected_ids = [item["usage_id"] for item in expected["data"]]
+    assert len(expected_ids) > 1000
+
+    response = requests.get(f"{BASE_URL}/usages", params={**params, "format": "arrow"}, timeout=TIMEOUT)
+    assert response.status_code == 200
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("usage_id").to_pylist() == expected_ids
+
+def test_usages_arrow_next_cursor_header():
+    params = {"limit": 5}
+    expected = assert_json_response(requests.get(f"{BASE_URL}/usages", params=params, timeout=TIMEOUT))
+    next_cursor = expected["meta"]["next_cursor"]
+
+    response = requests.get(f"{BASE_URL}/usages", params={**params, "format": "arrow"}, timeout=TIMEOUT)
+    assert response.status_code == 200
+    assert response.headers["X-Next-Cursor"] == next_cursor
+
+    # Following the header gives the same page as following meta.next_cursor
+    expected = assert_json_response(requests.get(f"{BASE_URL}/usages", params={**params, "cursor": next_cursor}, timeout=TIMEOUT))
+    response = requests.get(
+        f"{BASE_URL}/usages", params={**params, "cursor": next_cursor, "format": "arrow"}, timeout=TIMEOUT,
+    )
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("usage_id").to_pylist() == [item["usage_id"] for item in expected["data"]]
@@ -0,0 +1,32 @@
+"""
+File: test_usages_cursor.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-010
+Description: Cursor pagination test. Verifies /usages returns a next_cursor
+             and that following it continues the list without overlap.
+"""
+
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+def test_usages_cursor_continues_list():
+    first = requests.get(f"{BASE_URL}/usages", params={"limit": 5}, timeout=TIMEOUT)
+    data = assert_json_response(first)
+    next_cursor = data["meta"].get("next_cursor")
+    assert next_cursor
+
+    second = requests.get(f"{BASE_URL}/usages", params={"limit": 5, "cursor": next_cursor}, timeout=TIMEOUT)
+    next_data = assert_json_response(second)
+    first_ids = {u["usage_id"] for u in data["data"]}
+    second_ids = {u["usage_id"] for u in next_data["data"]}
+    assert first_ids.isdisjoint(second_ids)
+
+    # Same rows as the equivalent OFFSET page
+    paged = requests.get(f"{BASE_URL}/usages", params={"limit": 5, "page": 2}, timeout=TIMEOUT)
+    assert [u["usage_id"] for u in assert_json_response(paged)["data"]] == [u["usage_id"] for u in next_data["data"]]
+
+def test_usages_invalid_cursor_rejected():
+    response = requests.get(f"{BASE_URL}/usages", params={"cursor": "not-a-cursor"}, timeout=TIMEOUT)
+    assert response.status_code == 400
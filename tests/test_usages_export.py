@@ -0,0 +1,48 @@
+"""
+File: test_usages_export.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-016
+Description: CSV export test. Verifies /exports/usages.csv streams the
+             20-column workbook, restricted to the requested client.
+"""
+
+import csv
+import re
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+HEADERS = [
+    "Date", "Client", "Provider", "Service", "Service Type", "Unit",
+    "Units Used", "Unit Cost", "Total Cost",
+    "Daily Avg (7d)", "30d Trend %", "Forecast 30d",
+    "AWS Rate", "Azure Rate", "GCP Rate",
+    "Cheapest", "Switch Savings", "Utilization %", "Status", "Est Monthly Savings",
+]
+
+def test_usages_export_csv_filters_by_client():
+    client = assert_json_response(requests.get(f"{BASE_URL}/clients/1001", timeout=TIMEOUT))["data"]
+
+    response = requests.get(
+        f"{BASE_URL}/exports/usages.csv",
+        params={"client_id": 1001},
+        stream=True,
+        timeout=TIMEOUT,
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/csv")
+    # The client name goes into the file name as a plain token
+    assert re.fullmatch(
+        r'attachment; filename="cost-workbook-[\w.-]+-to-\d{4}-\d{2}-\d{2}\.csv"',
+        response.headers["Content-Disposition"],
+        re.ASCII,
+    )
+
+    rows = list(csv.reader(response.iter_lines(decode_unicode=True)))
+    assert rows[0] == HEADERS
+    assert len(rows) > 1
+    for row in rows[1:]:
+        assert len(row) == len(HEADERS)
+        assert row[1] == client["client_name"]
+    assert [row[0] for row in rows[1:]] == sorted(row[0] for row in rows[1:])
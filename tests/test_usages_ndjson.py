@@ -0,0 +1,30 @@
+"""
+File: test_usages_ndjson.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-015
+Description: NDJSON streaming test. Verifies /usages?format=ndjson streams the
+             same items as the JSON response followed by a meta line.
+"""
+
+import json
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+def test_usages_ndjson_matches_json():
+    params = {"limit": 5}
+    expected = assert_json_response(requests.get(f"{BASE_URL}/usages", params=params, timeout=TIMEOUT))
+
+    response = requests.get(
+        f"{BASE_URL}/usages",
+        params=params,
+        headers={"Accept": "application/x-ndjson"},
+        timeout=TIMEOUT,
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[:-1] == expected["data"]
+    assert lines[-1] == {"status": "ok", "meta": expected["meta"]}
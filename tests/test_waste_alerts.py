@@ -0,0 +1,29 @@
+"""
+File: test_waste_alerts.py
+Project: Cloud Cost Intelligence Platform
+Author: Bryana Henderson (Test Lead), Michael Allen (PM)
+Created: February 2026
+Test ID: T-012
+Description: Waste alerts endpoint test. Verifies /analytics/waste-alerts
+             returns sorted alerts and a summary computed by the backend.
+"""
+
+import requests
+from conftest import BASE_URL, assert_json_response, TIMEOUT
+
+SEVERITY_ORDER = {"critical": 0, "warning": 1, "info": 2}
+
+def test_waste_alerts_sorted_by_severity():
+    response = requests.get(f"{BASE_URL}/analytics/waste-alerts", params={"client_id": 1001}, timeout=TIMEOUT)
+    data = assert_json_response(response)
+    assert data.get("status") == "ok"
+
+    alerts = data["data"]["alerts"]
+    summary = data["data"]["summary"]
+    assert isinstance(alerts, list)
+    assert summary["critical_count"] == sum(1 for a in alerts if a["severity"] == "critical")
+
+    ranks = [SEVERITY_ORDER[a["severity"]] for a in alerts]
+    assert ranks == sorted(ranks)
+    for alert in alerts:
+        assert 0 <= alert["utilization"] <= 1